@@ -1,164 +1,39 @@
-import re
 import os
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk
 import sys 
 
-# --- FUNCIÓN CENTRAL DE ANÁLISIS ---
+from Monitoring import find_method_starts, method_start_lines
+from TextRender import TextBatch
+from Worker import BackgroundWorker
 
-# Reemplaza la FUNCIÓN CENTRAL DE ANÁLISIS con esta V11.0.
+# --- FUNCIÓN CENTRAL DE ANÁLISIS ---
+# La búsqueda y el texto del reporte viven en Monitoring (sin Tkinter); este módulo
+# solo los muestra. find_method_starts se re-exporta por compatibilidad.
 
+def report_method_starts(results, unclosed, filename, output_widget):
+    """
+    Escribe en `output_widget` el reporte de find_method_starts (hilo de Tk).
+    Las líneas se acumulan en un TextBatch: una sola inserción y un solo `see`
+    por archivo, sin importar cuántos métodos tenga.
+    """
+    batch = TextBatch()
+    for line, color in method_start_lines(results, unclosed, filename):
+        batch.add_line(line, color)
+    for color in batch.tag_names():
+        output_widget.tag_config(color, foreground=color)
+    batch.flush(output_widget, tk.END, see=tk.END)
 
-# Reemplaza la FUNCIÓN CENTRAL DE ANÁLISIS con esta V12.0.
 
 def locate_method_starts(code, filename, output_widget):
     """
     Busca firmas de método de clase y reporta la línea de inicio de su llave '{'.
-    (V12.0: Precisión de alcance y limpieza explícita de comentarios al inicio de línea)
+    (V13.0: búsqueda separada del reporte; ver find_method_starts)
     """
+    results, unclosed = find_method_starts(code, filename)
+    report_method_starts(results, unclosed, filename, output_widget)
     
-    def log(message, color="black"):
-        output_widget.tag_config(color, foreground=color)
-        output_widget.insert(tk.END, message + "\n", color)
-        output_widget.see(tk.END)
-    
-    log(f"==================================================================")
-    log(f"🔎 INICIANDO BÚSQUEDA DE MÉTODOS EN: {filename}", "blue")
-    log(f"==================================================================\n")
-    
-    # 1. Palabras clave de control de flujo a excluir
-    EXCLUDED_KEYWORDS = r'(?:if|for|while|switch|catch|do|try|new|delete|sizeof|return|NULL|class|struct|enum|using)\b'
-
-    # 2. PATRÓN FINAL (V12.0)
-    FUNCTION_SIG_PATTERN = re.compile(
-        # COMIENZO CRÍTICO: Coincide con inicio de línea/newline, espacios, y CUALQUIER NÚMERO
-        # de comentarios de una o varias líneas que puedan estar entre el método anterior y este.
-        r'(?:^|\n)\s*(?:/\*[\s\S]*?\*/|//[^\n]*\n)*\s*'
-        
-        # Group 1: Tipo de retorno. NO permite ':' para evitar consumir parte del alcance '::'.
-        r'([a-zA-Z_][a-zA-Z0-9_&\s*<>()\[\]]+\s+)?' 
-        
-        r'(?!' + EXCLUDED_KEYWORDS + r')' # Negación de palabras clave
-        
-        r'(' # Group 2 (ALCANCE Y NOMBRE DEL MÉTODO): DEBE contener '::' o 'operator'
-            
-            # Opción 1: Método/Constructor/Destructor con alcance anidado (Clase::SubClase::Metodo)
-            r'(?:[a-zA-Z_][a-zA-Z0-9_]*::)+[a-zA-Z_~][a-zA-Z0-9_:]*' 
-            r'|'
-            # Opción 2: Operador sobrecargado (con o sin alcance)
-            r'(?:[a-zA-Z_][a-zA-Z0-9_]*::)?operator\s*(?:<<|>>|==|!=|<=|>=|<|>|\+\+|--|\+|-|\*|/|%|=|\[\]|&|\||\^|~|\(\))'
-        r')'  
-        
-        # Group 3 (Parámetros): Permite cualquier contenido, incluyendo comentarios y newlines.
-        r'\s*\(([\s\S]*?)\)' 
-        r'(\s*const)?'                        # Group 4: Modificador const (opcional)
-        r'(\s*:[\s\S]*?)?'                    # Group 5: Lista de inicialización (opcional)
-        r'\s*\{'                              # Coincide con la llave de apertura
-        , re.DOTALL  
-    )
-    
-    current_pos = 0  
-    results = []
-    
-    while True:
-        # Usa re.search desde la posición actual
-        match = FUNCTION_SIG_PATTERN.search(code, current_pos)
-        
-        if not match:
-            break  
-        
-        # 3. Calcular la línea y posición del inicio de la llave '{'
-        start_brace_index = match.end() - 1
-        line_number = code.count('\n', 0, start_brace_index) + 1
-        full_name = match.group(2).strip()
-        
-        # 4. Determinar el índice de inicio real de la firma
-        # match.start() devuelve el inicio de la coincidencia completa (incluyendo comentarios y \n)
-        
-        # Intentamos obtener el inicio del Grupo 1, y si no existe (constructor), el inicio del Grupo 2.
-        real_start_index = match.start(1) if match.group(1) else match.start(2)
-        
-        signature_line = code[real_start_index:start_brace_index].strip()
-        
-        # 5. Encontrar el final del cuerpo de la función (llave de cierre '}')
-        body, body_end_index = _extract_brace_body(code, start_brace_index)
-        
-        if body is None or body_end_index == -1:
-            log(f"   ⚠️ ERROR: Cuerpo no cerrado para '{full_name}'. Saltando.", "red")
-            current_pos = start_brace_index + 1
-            continue
-
-        results.append({
-            'name': full_name,
-            'signature': signature_line,
-            'line_start': line_number,
-        })
-        
-        # 6. Mover la posición de búsqueda justo después del cierre de llave
-        current_pos = body_end_index + 1
-        
-    # --- REPORTE DE RESULTADOS ---
-    log("\n==================================================================")
-    log(f"🎉 ANÁLISIS COMPLETADO. {len(results)} métodos de clase identificados.", "blue")
-    log("==================================================================")
-
-    if results:
-        log("\n| Línea | Método de Clase/Operador |")
-        log("|-------|--------------------------|")
-        for r in results:
-            display_signature = r['signature'].replace(r['name'], f"**{r['name']}**")
-            log(f"| {r['line_start']:<5} | {display_signature} {{...}}", "green")
-    else:
-        log("No se encontraron métodos de clase con notación de alcance (::) o sobrecarga de operador.", "red")
-        
-    log("\n--- FIN DEL REPORTE ---")
-    
-# --- FUNCIONES DE SOPORTE y CLASE DE UI (Mantener el código sin cambios) ---
-# ... (El código de _extract_brace_body y MethodLocatorApp es estable y no necesita cambios) ...
-def _extract_brace_body(code_snippet, start_brace_index):
-    balance = 1
-    body_end_index = start_brace_index + 1
-    code_length = len(code_snippet)
-    
-    while body_end_index < code_length:
-        char = code_snippet[body_end_index]
-        
-        # Manejo de Strings
-        if char == '"' or char == "'":
-            end_quote = code_snippet.find(char, body_end_index + 1)
-            while end_quote != -1 and code_snippet[end_quote - 1] == '\\':
-                end_quote = code_snippet.find(char, end_quote + 1)
-            if end_quote != -1:
-                body_end_index = end_quote + 1
-                continue
-            
-        # Manejo de Comentarios C/C++
-        elif char == '/':
-            next_char_index = body_end_index + 1
-            if next_char_index < code_length:
-                next_char = code_snippet[next_char_index]
-                if next_char == '/':
-                    newline_index = code_snippet.find('\n', next_char_index)
-                    body_end_index = newline_index + 1 if newline_index != -1 else code_length  
-                    continue
-                elif next_char == '*':
-                    end_comment_index = code_snippet.find('*/', next_char_index + 1)
-                    body_end_index = end_comment_index + 2 if end_comment_index != -1 else code_length  
-                    continue
-        
-        # Contador de Llaves
-        if char == '{':
-            balance += 1
-        elif char == '}':
-            balance -= 1
-            if balance == 0:
-                return code_snippet[start_brace_index + 1 : body_end_index], body_end_index
-        
-        body_end_index += 1
-        
-    return None, -1 
-
-
+# --- CLASE DE UI ---
 class MethodLocatorApp:
     def __init__(self, master):
         self.master = master
@@ -166,6 +41,7 @@ class MethodLocatorApp:
         master.geometry("800x600")
         
         self.file_path = tk.StringVar(value="Ningún archivo seleccionado")
+        self.worker = BackgroundWorker(master)
 
         style = ttk.Style()
         style.configure('TButton', font=('Helvetica', 10), padding=5)
@@ -176,7 +52,13 @@ class MethodLocatorApp:
         ttk.Button(control_frame, text="1. Seleccionar Archivo C++", command=self.open_file_dialog).pack(side='left', padx=5)
         ttk.Label(control_frame, textvariable=self.file_path, width=50).pack(side='left', padx=10, fill='x', expand=True)
         
-        ttk.Button(control_frame, text="2. ANALIZAR", command=self.start_analysis).pack(side='right', padx=5)
+        self.cancel_button = ttk.Button(control_frame, text="Cancelar", command=self.worker.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side='right', padx=5)
+        self.analyze_button = ttk.Button(control_frame, text="2. ANALIZAR", command=self.start_analysis)
+        self.analyze_button.pack(side='right', padx=5)
+
+        self.progress = ttk.Progressbar(master, mode='indeterminate')
+        self.progress.pack(fill='x', padx=10)
 
         output_frame = ttk.Frame(master, padding="10 0 10 10")
         output_frame.pack(fill='both', expand=True)
@@ -203,27 +85,50 @@ class MethodLocatorApp:
             self.output_text.insert(tk.END, f"Archivo seleccionado: {os.path.basename(filepath)}\nListo para analizar.")
 
     def start_analysis(self):
+        if self.worker.running:
+            return
         filepath = self.file_path.get()
         if not os.path.exists(filepath):
             self.output_text.delete(1.0, tk.END)
             self.output_text.insert(tk.END, "ERROR: Por favor, selecciona un archivo válido primero.", "red")
             return
 
-        try:
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    code_content = f.read()
-            except UnicodeDecodeError:
-                with open(filepath, 'r', encoding='latin-1') as f:
-                    code_content = f.read()
-            
-            filename = os.path.basename(filepath)
-            self.output_text.delete(1.0, tk.END)
-            
-            locate_method_starts(code_content, filename, self.output_text)
+        self.output_text.delete(1.0, tk.END)
+        self.analyze_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.progress.start(10)
+        self.worker.start(
+            lambda cancel_event: _analyze_path(filepath, cancel_event),
+            self._on_analysis_result, self._on_analysis_done, self._on_analysis_error
+        )
 
-        except Exception as e:
-            self.output_text.insert(tk.END, f"\n--- ERROR FATAL DURANTE EL ANÁLISIS ---\n{type(e).__name__}: {str(e)}", "red")
+    def _on_analysis_result(self, item):
+        filename, results, unclosed = item
+        report_method_starts(results, unclosed, filename, self.output_text)
+
+    def _on_analysis_error(self, e):
+        self.output_text.insert(tk.END, f"\n--- ERROR FATAL DURANTE EL ANÁLISIS ---\n{type(e).__name__}: {str(e)}", "red")
+
+    def _on_analysis_done(self, cancelled):
+        self.progress.stop()
+        self.analyze_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        if cancelled:
+            self.output_text.insert(tk.END, "\n⛔ Análisis cancelado por el usuario.\n", "red")
+
+
+def _analyze_path(filepath, cancel_event):
+    """Generador (hilo de trabajo): lee el archivo y produce (nombre, resultados, sin cerrar)."""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            code_content = f.read()
+    except UnicodeDecodeError:
+        with open(filepath, 'r', encoding='latin-1') as f:
+            code_content = f.read()
+    
+    filename = os.path.basename(filepath)
+    results, unclosed = find_method_starts(code_content, filename, cancel_event)
+    yield filename, results, unclosed
 
 
 if __name__ == "__main__":
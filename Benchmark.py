@@ -0,0 +1,772 @@
+# Benchmark.py
+#
+# Mediciones de rendimiento del análisis. Uso:
+#   python Benchmark.py parallel --files 200 --functions 300 --workers 4
+#   python Benchmark.py stress --scale 4 --fuzz 50 --budget 2
+#   python Benchmark.py suite --sizes 100,500,2000          (-> benchmarks/latest.json)
+#   python Benchmark.py compare --threshold 0.10            (baseline.json vs. latest.json)
+#   python Benchmark.py equivalence --files 200
+#   python Benchmark.py render --sizes 1000,10000,100000
+#   python Benchmark.py imports --budget 0.1
+#   python Benchmark.py memory --functions 20000
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Extractor import BraceTable, SourceFile, _extract_brace_body
+from Lexer import RegionMask, identifier_set, iter_identifiers
+from LineRules import evaluate_line_rules
+import ReviewChecks
+from Monitoring import MethodRecord, find_method_starts, iter_method_starts, iter_methods, method_rows, monitor_methods
+from TextRender import TextBatch
+from Pipeline import (
+    CHECK_KEYS, DEFAULT_TIME_BUDGET, LINE_CHECKS, REVIEW_CHECKS, analyze_file, read_source, render_timings, run_pipeline,
+    run_pipeline_parallel,
+)
+
+
+# =========================================================================
+# === Corpus Sintético ===
+# =========================================================================
+
+def generate_cpp(functions, seed=0):
+    """Genera un archivo C++ determinista con `functions` métodos documentados."""
+    rnd = random.Random(seed)
+    parts = ['#include <vector>\n\n']
+    for i in range(functions):
+        params = [f"int p{j}" for j in range(rnd.randint(0, 4))]
+        used = [p.split()[-1] for p in params if rnd.random() < 0.8]
+        parts.append(
+            f"/**\n * \\brief Método {i}\n"
+            + ''.join(f" * @param {p.split()[-1]} valor\n" for p in params)
+            + " */\n"
+            + f"int Clase{i % 7}::metodo{i}({', '.join(params)})\n{{\n"
+            + f"    int total = {' + '.join(used) if used else '0'};\n"
+            + "    for (int k = 0; k < 10; ++k) { total += k; } // TODO: revisar\n"
+            + "    return total;\n}\n\n"
+        )
+    return ''.join(parts)
+
+
+def write_corpus(directory, files, functions, seed=0):
+    """Escribe `files` archivos sintéticos en `directory` y devuelve sus rutas."""
+    paths = []
+    for i in range(files):
+        path = os.path.join(directory, f"synthetic_{i}.cpp")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate_cpp(functions, seed + i))
+        paths.append(path)
+    return paths
+
+
+def generate_source(functions, depth=2, comment_density=0.5, operators=0.1, init_lists=0.2,
+                    long_lines=0.05, seed=0):
+    """
+    Genera un archivo C++ determinista y configurable para la suite de benchmarks.
+      functions        número de funciones/métodos
+      depth            profundidad de bloques anidados dentro de cada cuerpo
+      comment_density  fracción de funciones con comentario de cabecera (y comentarios en el cuerpo)
+      operators        fracción de funciones que son sobrecargas de operador
+      init_lists       fracción de constructores con lista de inicialización
+      long_lines       fracción de líneas de cuerpo que superan los 120 caracteres
+    """
+    rnd = random.Random(seed)
+    parts = ['#include <vector>\n#include <string>\n\n']
+    for i in range(functions):
+        cls = f"Clase{i % 13}"
+        params = [f"int p{j}" for j in range(rnd.randint(0, 4))]
+        used = [p.split()[-1] for p in params if rnd.random() < 0.8]
+        documented = rnd.random() < comment_density
+
+        if documented:
+            style = rnd.random()
+            if style < 0.6:
+                parts.append(f"/**\n * \\brief Función {i}\n"
+                             + ''.join(f" * @param {p.split()[-1]} valor\n" for p in params) + " */\n")
+            else:
+                parts.append(f"// Función {i}\n" + ''.join(f"// \\param {p.split()[-1]}\n" for p in params))
+
+        kind = rnd.random()
+        init = ""
+        if kind < operators:
+            symbol = rnd.choice(['==', '!=', '<', '+', '[]', '()', '<<'])
+            signature = f"bool {cls}::operator{symbol}(const {cls}& other) const"
+            used = ['other']
+        elif kind < operators + init_lists:
+            signature = f"{cls}::{cls}({', '.join(params)})"
+            if used:
+                init = "\n    : " + ",\n      ".join(f"m_{name}({name})" for name in used)
+                used = used[:1]
+        else:
+            signature = f"int {cls}::metodo{i}({', '.join(params)})"
+
+        body = [f"    int total = {' + '.join(used) if used else '0'};"]
+        indent = "    "
+        for level in range(depth):
+            body.append(f"{indent}for (int k{level} = 0; k{level} < {level + 3}; ++k{level}) {{")
+            indent += "    "
+            if documented and rnd.random() < 0.5:
+                body.append(f"{indent}// comentario con llaves {{ }} y \"cadena\" nivel {level}")
+            if rnd.random() < long_lines:
+                body.append(f"{indent}total += " + " + ".join(f"valor_{n}" for n in range(20)) + ";")
+            else:
+                body.append(f"{indent}total += k{level};")
+        for level in range(depth):
+            indent = indent[:-4]
+            body.append(f"{indent}}}")
+        if rnd.random() < 0.05:
+            body.append("    // TODO: revisar este caso")
+        body.append("    return total;")
+        parts.append(f"{signature}{init}\n{{\n" + "\n".join(body) + "\n}\n\n")
+    return ''.join(parts)
+
+
+# =========================================================================
+# === Corpus Adversarial (entradas que provocaban retroceso del patrón) ===
+# =========================================================================
+
+def adversarial_cases(scale=1):
+    """Devuelve {nombre: código} con entradas patológicas para FUNCTION_SIG_PATTERN."""
+    n = 1000 * scale
+    return {
+        'blank_lines': "int\n" + "\n" * (20 * n) + "x",
+        'macro_header': ''.join(f"DECLARE_THING(Type{i}, Other{i})\n" for i in range(n)),
+        'unbalanced_paren': "int f(" + "a, b, c\n" * n,
+        'nested_parens': "f(" * n + ")" * (n // 2),
+        'type_token_lines': "unsigned long long int value\n" * n,
+        'long_return_type': ("static inline const " * 20 + "\n") * (n // 10),
+        'init_list_no_brace': "A::A(int x) : m(x)\n" * n,
+        'template_soup': ("template<typename T> " * 50 + "\n") * (n // 10),
+        'long_params': "void f(" + "int a, " * (5 * n) + ")\n",
+        'operator_lines': "bool operator==(const A& other) const\n" * n,
+        'unclosed_braces': "void f()\n{\n    if (x) {\n" * (n // 5),
+        'unterminated_comment': "/*" + " * nota\n" * n + "void f(int a) { return; }\n",
+        'unclosed_comments': "/* x\n" * (10 * n) + "void f(int a) { return; }\n",
+        'brace_default_args': SIGNATURE_CASES['brace_default_arg'] * (n // 10),
+        'nested_callback_params': SIGNATURE_CASES['nested_callback'] * (n // 10),
+        'unclosed_default_brace': "void f(int a = {" * n,
+        'deep_parens_params': "void f(" + "g(h(" * n + ")\n",
+    }
+
+
+# Firmas válidas que el patrón debe reconocer como definiciones (y no escanear su cuerpo
+# como código de nivel superior): {nombre del caso: código}
+SIGNATURE_CASES = {
+    'brace_default_arg': "void Foo::set(std::vector<int> v = {})\n{\n    use(v);\n}\n",
+    'brace_default_list': "void Foo::fill(std::vector<int> v = {1, 2}, int w = 0)\n{\n    use(v, w);\n}\n",
+    'nested_callback': "void Foo::cb(std::function<void(int(*)(int))> f)\n{\n    use(f);\n}\n",
+    'function_pointer': "int Foo::apply(int (*op)(int, int), int a)\n{\n    return op(a, a);\n}\n",
+}
+
+
+def signature_misses():
+    """Casos de SIGNATURE_CASES cuyo único registro no es la definición esperada."""
+    misses = []
+    for name, code in SIGNATURE_CASES.items():
+        records = SourceFile(code, SUITE_FILENAME).functions
+        expected_name = code.split('(')[0].split()[-1]
+        if len(records) != 1 or records[0]['name'] != expected_name or records[0]['body_span'] is None:
+            misses.append(name)
+    return misses
+
+
+def fuzz_cpp(seed, tokens=400):
+    """Sopa de tokens C++ determinista: paréntesis, llaves y comentarios desbalanceados."""
+    rnd = random.Random(seed)
+    vocabulary = [
+        'int', ' ', '\n', 'foo', 'A::b', '(', ')', '{', '}', ';', ':', 'const', '*', '&', '<', '>',
+        ',', 'x', '= 0', 'if', '// c', '/*', '*/', 'operator==', '~A', 'static', '"s"', '#define M',
+        ' : m(x) ', 'B::B()', 'template<typename T>', '\\param p', 'TODO',
+    ]
+    return ''.join(rnd.choice(vocabulary) for _ in range(tokens))
+
+
+# =========================================================================
+# === Benchmarks ===
+# =========================================================================
+
+def bench_parallel(files, functions, workers):
+    """Compara el pipeline secuencial con el modo paralelo y reporta la aceleración."""
+    checks = set(CHECK_KEYS)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory, files, functions)
+
+        start = time.perf_counter()
+        serial = list(run_pipeline(((p, read_source(p)) for p in paths), checks))
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = list(run_pipeline_parallel(paths, checks, workers=workers))
+        parallel_time = time.perf_counter() - start
+
+    assert [r['filepath'] for r in parallel] == paths, "El modo paralelo alteró el orden"
+    assert [r['violation_count'] for r in parallel] == [r['violation_count'] for r in serial]
+
+    print(f"Archivos: {files} x {functions} funciones | workers: {workers or os.cpu_count()}")
+    print(f"Secuencial: {serial_time:.2f} s")
+    print(f"Paralelo:   {parallel_time:.2f} s")
+    print(f"Aceleración: x{serial_time / parallel_time:.2f}")
+
+
+def bench_stress(scale, fuzz, budget, output=None):
+    """
+    Ejecuta el pipeline completo sobre el corpus adversarial y `fuzz` entradas aleatorias,
+    con `budget` segundos por etapa. Reporta la duración de cada caso y los que agotaron el tiempo.
+    Con `output` escribe además el corpus en ese directorio (para reproducir con ReviewCLI).
+    """
+    cases = adversarial_cases(scale)
+    for seed in range(fuzz):
+        cases[f'fuzz_{seed}'] = fuzz_cpp(seed, 400 * scale)
+
+    if output:
+        os.makedirs(output, exist_ok=True)
+        for name, code in cases.items():
+            with open(os.path.join(output, f"{name}.cpp"), 'w', encoding='utf-8') as f:
+                f.write(code)
+
+    checks = set(CHECK_KEYS)
+    results = []
+    for name, code in cases.items():
+        results.append(analyze_file(f"{name}.cpp", code, checks, monitor=True, time_budget=budget))
+
+    results.sort(key=lambda result: result['elapsed'], reverse=True)
+    for result in results:
+        print(render_timings(result))
+    timed_out = [result['filepath'] for result in results if result['timed_out']]
+    print(f"Casos: {len(results)} | tiempo total: {sum(r['elapsed'] for r in results):.2f} s"
+          f" | agotaron el tiempo: {len(timed_out)}")
+    return timed_out
+
+
+# =========================================================================
+# === Render en Tk (inserción por lotes) ===
+# =========================================================================
+
+RENDER_SIZES = (1000, 10000, 100000)
+
+
+class _CountingText:
+    """Sustituto de Text sin pantalla: solo cuenta llamadas y caracteres."""
+    def __init__(self):
+        self.calls = 0
+        self.chars = 0
+
+    def insert(self, index, *args):
+        self.calls += 1
+        self.chars += sum(len(text) for text in args[::2])
+
+    def see(self, index):
+        self.calls += 1
+
+    def tag_config(self, *args, **options):
+        self.calls += 1
+
+    def delete(self, *args):
+        self.chars = 0
+
+
+def _render_lines(count):
+    """Líneas como las del reporte de métodos: casi todas 'green', una de cada 50 'red'."""
+    return [
+        (f"| {number:<5} | Clase{number % 97}::metodo_{number}(int a, int b) {{...}}", 'red' if number % 50 == 0 else 'green')
+        for number in range(1, count + 1)
+    ]
+
+
+def _insert_per_line(widget, lines):
+    """Forma anterior: tag_config + insert + see por cada línea."""
+    for text, tag in lines:
+        widget.tag_config(tag, foreground=tag)
+        widget.insert('end', text + "\n", tag)
+        widget.see('end')
+
+
+def _insert_batched(widget, lines):
+    """TextBatch: tags configurados una vez, una inserción y un solo see."""
+    batch = TextBatch()
+    for text, tag in lines:
+        batch.add_line(text, tag)
+    for tag in batch.tag_names():
+        widget.tag_config(tag, foreground=tag)
+    batch.flush(widget, 'end', see='end')
+
+
+def bench_render(sizes=RENDER_SIZES, per_line_limit=10000):
+    """
+    Mide el costo de escribir `size` líneas en un Text: por línea (hasta `per_line_limit`,
+    que con see() por línea crece rápido) y con TextBatch. Reporta µs por línea; si el
+    lote es lineal, ese valor se mantiene al crecer el tamaño. Sin pantalla usa un Text
+    simulado y mide solo la construcción del lote y el número de llamadas.
+    """
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+        make_widget = lambda: tk.Text(root)
+        backend = "Tk"
+    except Exception as e:  # Sin tkinter o sin pantalla ($DISPLAY)
+        root = None
+        make_widget = _CountingText
+        backend = f"simulado ({type(e).__name__})"
+
+    print(f"Widget: {backend}")
+    rates = []
+    try:
+        for size in sizes:
+            lines = _render_lines(size)
+            widget = make_widget()
+            start = time.perf_counter()
+            _insert_batched(widget, lines)
+            if root is not None:
+                root.update_idletasks()
+            batched = time.perf_counter() - start
+            rates.append(batched / size)
+
+            per_line = "-"
+            if size <= per_line_limit:
+                widget = make_widget()
+                start = time.perf_counter()
+                _insert_per_line(widget, lines)
+                if root is not None:
+                    root.update_idletasks()
+                per_line = f"{(time.perf_counter() - start) / size * 1e6:8.2f} µs/línea"
+            print(f"{size:>7} líneas | lote: {batched * 1000:8.1f} ms ({batched / size * 1e6:6.2f} µs/línea)"
+                  f" | por línea: {per_line}")
+    finally:
+        if root is not None:
+            root.destroy()
+    if len(rates) > 1:
+        print(f"Crecimiento del costo por línea (lote, mayor/menor tamaño): x{rates[-1] / rates[0]:.2f}")
+    return rates
+
+
+# =========================================================================
+# === Memoria de los Registros de Método ===
+# =========================================================================
+
+def _traced_peak(function):
+    """Ejecuta `function` y devuelve (resultado, pico de memoria asignada en bytes)."""
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _legacy_method_dicts(source):
+    """Forma anterior de monitor_methods: un dict por método con copias de cada parte."""
+    code = source.code
+    return [
+        {
+            'name': record['name'],
+            'line': record['line'],
+            'comment': source.header_comment(record),
+            'signature': source.text(record['signature_span']),
+            'params': source.text(record['params_span']),
+            'init_list': source.text(record['init_span']),
+            'body': code[record['body_span'][0]:record['body_span'][1]],
+        }
+        for record in source.definitions()
+    ]
+
+
+def bench_memory(functions, seed=0):
+    """
+    Compara la memoria de las filas de método sobre un SourceFile ya parseado: dicts con
+    copias del texto, el texto formateado completo (monitor_methods) y MethodRecord (solo
+    offsets). Verifica además que MethodRecord.to_json/from_json sean inversos.
+    """
+    code = generate_source(functions, seed=seed)
+    source = SourceFile(code, SUITE_FILENAME)
+    source.functions  # Extracción fuera de las mediciones: solo cuentan las filas
+
+    records, records_peak = _traced_peak(lambda: method_rows(source))
+    _, legacy_peak = _traced_peak(lambda: _legacy_method_dicts(source))
+    _, text_peak = _traced_peak(lambda: monitor_methods(code, SUITE_FILENAME, source))
+
+    restored = [MethodRecord.from_json(json.loads(json.dumps(row.to_json()))) for row in records]
+    mismatches = sum(
+        original.to_json() != copy.to_json() or original.body_span != copy.body_span
+        for original, copy in zip(records, restored)
+    )
+
+    source_bytes = len(code.encode('utf-8'))
+    print(f"Código: {source_bytes / 1e6:.1f} MB | {len(records)} métodos")
+    for label, peak in (("dicts con texto", legacy_peak), ("texto formateado", text_peak), ("MethodRecord", records_peak)):
+        print(f"{label:<18} {peak / 1e6:8.2f} MB ({peak / source_bytes:5.2f} x código, {peak / len(records):6.0f} B/método)")
+    print(f"to_json/from_json: {mismatches} diferencias")
+    return mismatches
+
+
+# =========================================================================
+# === Tiempo de Importación del Núcleo ===
+# =========================================================================
+
+# Módulos del núcleo de análisis: no deben depender de la interfaz ni cargar
+# dependencias pesadas al importarse (workers, scripts y la CLI los importan)
+CORE_MODULES = (
+    'Lexer', 'LineRules', 'Extractor', 'ReviewChecks', 'Monitoring', 'Pipeline',
+    'ResultCache', 'FileModel', 'TextRender', 'Worker', 'ReviewCLI',
+)
+HEAVY_MODULES = ('tkinter', 'sqlite3', 'concurrent.futures', 'multiprocessing')
+IMPORT_BUDGET = 0.1
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print(time.perf_counter() - start)\n"
+    "print(','.join(name for name in {heavy!r} if name in sys.modules))\n"
+)
+
+
+def check_imports(budget=IMPORT_BUDGET, repeat=3, modules=CORE_MODULES):
+    """
+    Importa cada módulo del núcleo en un intérprete nuevo (sin caché de sys.modules) y
+    toma el mínimo de `repeat` mediciones. Falla si alguno supera `budget` segundos o
+    arrastra un módulo de HEAVY_MODULES. Devuelve el número de fallos.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    failures = 0
+    for module in modules:
+        probe = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+        samples = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, '-c', probe], cwd=directory, capture_output=True, text=True, check=True
+            ).stdout.splitlines()
+            samples.append(float(output[0]))
+        heavy = output[1] if len(output) > 1 else ''
+        ok = min(samples) <= budget and not heavy
+        failures += not ok
+        print(f"{'OK  ' if ok else 'FALLA'} {module:<14} {min(samples) * 1000:7.1f} ms"
+              + (f" | importa: {heavy}" if heavy else ""))
+    print(f"Presupuesto: {budget * 1000:.0f} ms por módulo | fallos: {failures}")
+    return failures
+
+
+# =========================================================================
+# === Suite de Benchmarks (JSON + comparación contra una línea base) ===
+# =========================================================================
+
+SUITE_SIZES = (100, 500, 2000)
+
+# Línea base versionada en el repositorio y última medición local (ignorada por git)
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks')
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+LATEST_PATH = os.path.join(BENCHMARK_DIR, 'latest.json')
+SUITE_FILENAME = "benchmark.cpp"
+
+
+def _time_call(function, repeat):
+    """Ejecuta `function` `repeat` veces y devuelve las duraciones en segundos."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _suite_targets(code):
+    """
+    Devuelve [(nombre, función sin argumentos)] a medir sobre `code`. Los checks y
+    monitor_methods reciben un SourceFile ya parseado para medir solo su propio trabajo;
+    la extracción se mide aparte como 'extract_functions' y la pasada compartida de las
+    reglas por línea como 'line_rules'.
+    """
+    parsed = SourceFile(code, SUITE_FILENAME)
+    braces = [record['brace_index'] for record in parsed.definitions()]
+
+    targets = [('extract_functions', lambda: SourceFile(code, SUITE_FILENAME).functions)]
+    for key, check, _, _, _ in REVIEW_CHECKS:
+        if key in LINE_CHECKS:
+            # Las reglas por línea se memorizan en el SourceFile: cada repetición usa uno nuevo
+            targets.append((check.__name__, lambda check=check: check(code, SUITE_FILENAME)))
+        else:
+            targets.append((check.__name__, lambda check=check: check(code, SUITE_FILENAME, parsed)))
+    targets.append(('line_rules', lambda: evaluate_line_rules(parsed, LINE_CHECKS)))
+    targets.append(('monitor_methods', lambda: monitor_methods(code, SUITE_FILENAME, parsed)))
+    targets.append(('locate_method_starts', lambda: find_method_starts(code, SUITE_FILENAME)))
+    # Generadores: costo de obtener solo el primer registro (archivo sin parsear)
+    targets.append(('iter_methods_first', lambda: next(iter_methods(code, SUITE_FILENAME), None)))
+    targets.append(('iter_method_starts_first', lambda: next(iter_method_starts(code, SUITE_FILENAME), None)))
+    targets.append(('_extract_brace_body', lambda: [_extract_brace_body(code, brace) for brace in braces]))
+    targets.append(('region_mask', lambda: RegionMask(code)))
+    targets.append(('brace_table', lambda: BraceTable(code)))
+    bodies = [record['body_span'] for record in parsed.definitions()]
+    targets.append(('scrub_legacy', lambda: [
+        set(_legacy_clean_body_for_param_search(code[start:end]).split(' ')) for start, end in bodies
+    ]))
+    targets.append(('scrub_lexer', lambda: [identifier_set(code, start, end) for start, end in bodies]))
+    mask = parsed.region_mask
+    targets.append(('scrub_mask', lambda: [mask.identifiers(start, end) for start, end in bodies]))
+    return targets
+
+
+def run_suite(sizes=SUITE_SIZES, repeat=5, seed=0, **corpus_options):
+    """
+    Mide cada objetivo con cada tamaño de corpus y devuelve un dict serializable en JSON.
+    `corpus_options` se pasan a generate_source (depth, comment_density, ...).
+    """
+    cases = {}
+    for size in sizes:
+        code = generate_source(size, seed=seed, **corpus_options)
+        for name, function in _suite_targets(code):
+            samples = _time_call(function, repeat)
+            cases[f"{name}@{size}"] = {
+                'target': name,
+                'functions': size,
+                'bytes': len(code),
+                'min': min(samples),
+                'median': statistics.median(samples),
+            }
+            print(f"{name + '@' + str(size):40} min {min(samples) * 1000:9.2f} ms"
+                  f"  mediana {statistics.median(samples) * 1000:9.2f} ms")
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'seed': seed,
+            'corpus': corpus_options,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'cases': cases,
+    }
+
+
+def compare_results(baseline, current, threshold=0.10, metric='min'):
+    """
+    Compara dos resultados de run_suite. Devuelve (líneas de reporte, regresiones):
+    una regresión es un caso cuya `metric` creció más que `threshold` (fracción).
+    """
+    lines = []
+    regressions = []
+    for key, case in current['cases'].items():
+        base = baseline['cases'].get(key)
+        if base is None:
+            lines.append(f"{key:40} (nuevo) {case[metric] * 1000:9.2f} ms")
+            continue
+        ratio = case[metric] / base[metric] if base[metric] else float('inf')
+        if ratio > 1 + threshold:
+            flag = "🔴 REGRESIÓN"
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            flag = "🟢 mejora"
+        else:
+            flag = ""
+        lines.append(f"{key:40} {base[metric] * 1000:9.2f} ms -> {case[metric] * 1000:9.2f} ms  x{ratio:5.2f} {flag}")
+    for key in sorted(baseline['cases'].keys() - current['cases'].keys()):
+        lines.append(f"{key:40} (ausente en el resultado actual)")
+    return lines, regressions
+
+
+# =========================================================================
+# === Equivalencia con implementaciones anteriores ===
+# =========================================================================
+
+def _legacy_clean_body_for_param_search(body_content: str) -> str:
+    """
+    Limpieza anterior a Lexer (V26): diez pasadas re.sub sobre el cuerpo de la función.
+    Se conserva solo para medir y comparar con Lexer.identifier_set.
+    """
+    # === FASE 1: Limpieza de COMENTARIOS (Alta Precedencia) =============
+    body_content = re.sub(r'(//|#).*$', ' ', body_content, flags=re.MULTILINE)
+    body_content = re.sub(r'/\*[\s\S]*?\*/', ' ', body_content, flags=re.DOTALL)
+
+    # === FASE 2: Limpieza de STRINGS (Precedencia Media) =================
+    body_content = re.sub(r'"([^"\\]|\\.)*"', ' ', body_content, flags=re.DOTALL)
+    body_content = re.sub(r"'([^'\\]|\\.)*'", ' ', body_content, flags=re.DOTALL)
+
+    # === FASE 3: Normalización y Aislamiento de Tokens ===================
+    # Eliminar U+00A0
+    body_content = body_content.replace('\u00A0', ' ')
+    body_content = re.sub(r'\s', ' ', body_content) 
+
+    body_content = re.sub(r'::', ' ', body_content) 
+    body_content = re.sub(r'->', ' ', body_content) 
+    body_content = re.sub(r'\.', ' ', body_content) 
+
+    body_content = re.sub(r'[^\w]', ' ', body_content)
+
+    body_content = re.sub(r' +', ' ', body_content).strip() 
+
+    return body_content
+
+
+def _legacy_unused_params(parameters, init_list, cleaned_body):
+    """Detección anterior a V27: un re.compile(r'\\bparam\\b') por parámetro y texto."""
+    used_in_init_list = set()
+    if init_list:
+        for param in parameters:
+            if re.compile(r'\b' + re.escape(param) + r'\b').search(init_list):
+                used_in_init_list.add(param)
+    return [
+        param for param in parameters
+        if param not in used_in_init_list
+        and not re.compile(r'\b' + re.escape(param) + r'\b').search(cleaned_body)
+    ]
+
+
+def check_equivalence(files=100, seed=0):
+    """
+    Compara las implementaciones actuales con las anteriores sobre el corpus sintético y el fuzz:
+      - check_unused_parameters (conjuntos) contra un re.compile(r'\\bparam\\b') por parámetro,
+        ambos sobre los mismos identificadores del cuerpo.
+      - Lexer.identifier_set contra _legacy_clean_body_for_param_search, cuerpo por cuerpo.
+        En el fuzz hay diferencias esperadas: la limpieza anterior quitaba primero todos los
+        '//' y '#' (incluso dentro de cadenas o de '/* */') y luego los bloques; el escáner
+        respeta el orden léxico de izquierda a derecha.
+      - RegionMask.identifiers (máscara del archivo) contra Lexer.identifier_set (cuerpo
+        lexeado por separado): deben coincidir en todos los cuerpos que abren en código.
+      - SIGNATURE_CASES: cada firma válida debe extraerse como una sola definición.
+    Devuelve el número de diferencias no esperadas (unused_params, máscara y escáner en el
+    corpus sintético, firmas no reconocidas).
+    """
+    synthetic = [generate_source(200, seed=seed + i, init_lists=0.5) for i in range(files // 2)]
+    fuzz = [fuzz_cpp(seed + i, 800) for i in range(files - files // 2)]
+    mismatches = functions = mask_differences = 0
+    scrub_differences = {'sintético': 0, 'fuzz': 0}
+    for corpus_name, corpus in (('sintético', synthetic), ('fuzz', fuzz)):
+        for code in corpus:
+            source = SourceFile(code, SUITE_FILENAME)
+            expected = []
+            for record in source.definitions():
+                body_start, body_end = record['body_span']
+                legacy_identifiers = set(
+                    _legacy_clean_body_for_param_search(code[body_start:body_end]).split(' ')
+                ) - {''}
+                lexer_identifiers = identifier_set(code, body_start, body_end)
+                if legacy_identifiers != lexer_identifiers:
+                    scrub_differences[corpus_name] += 1
+                if source.region_mask.is_code(record['brace_index']) and \
+                        source.region_mask.identifiers(body_start, body_end) != lexer_identifiers:
+                    mask_differences += 1
+
+                raw_params = [p.strip() for p in re.split(r',\s*', source.text(record['params_span'])) if p.strip()]
+                parameters = [
+                    name for name in map(ReviewChecks._get_clean_param_name, raw_params)
+                    if name and name not in ('self', 'cls', '_', '__')
+                ]
+                if not parameters:
+                    continue
+                cleaned_body = ' '.join(iter_identifiers(code, body_start, body_end))
+                unused = _legacy_unused_params(parameters, source.text(record['init_span']), cleaned_body)
+                if unused:
+                    expected.append(ReviewChecks._format_unused_params_message_en(
+                        record['name'].split('::')[-1], record['line'], unused
+                    ))
+                functions += 1
+            _, actual, _ = ReviewChecks.check_unused_parameters(code, SUITE_FILENAME, source)
+            if actual != expected:
+                mismatches += 1
+                print(f"❌ Diferencia en un archivo del corpus ({len(expected)} vs {len(actual)} violaciones)")
+    print(f"unused_params: {files} archivos, {functions} funciones con parámetros, {mismatches} diferencias")
+    print(f"escáner: cuerpos distintos a la limpieza anterior -> sintético {scrub_differences['sintético']},"
+          f" fuzz {scrub_differences['fuzz']} (esperadas: '//', '#' o '/*' solapados)")
+    print(f"máscara de regiones: {mask_differences} cuerpos distintos al escáner")
+    misses = signature_misses()
+    print(f"firmas válidas no reconocidas: {len(misses)}" + (f" ({', '.join(misses)})" if misses else ""))
+    return mismatches + mask_differences + scrub_differences['sintético'] + len(misses)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del revisor de código.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    parallel = subparsers.add_parser('parallel', help="Secuencial vs. ProcessPoolExecutor")
+    parallel.add_argument('--files', type=int, default=100)
+    parallel.add_argument('--functions', type=int, default=300)
+    parallel.add_argument('--workers', type=int, default=None)
+
+    stress = subparsers.add_parser('stress', help="Corpus adversarial y fuzz con presupuesto de tiempo")
+    stress.add_argument('--scale', type=int, default=1)
+    stress.add_argument('--fuzz', type=int, default=20)
+    stress.add_argument('--budget', type=float, default=DEFAULT_TIME_BUDGET)
+    stress.add_argument('--output', default=None, help="Directorio donde escribir el corpus generado")
+
+    suite = subparsers.add_parser('suite', help="Mide checks, monitoreo y escáneres; guarda JSON")
+    suite.add_argument('--sizes', default=','.join(str(size) for size in SUITE_SIZES),
+                       help="Número de funciones por corpus, separados por comas")
+    suite.add_argument('--repeat', type=int, default=5)
+    suite.add_argument('--seed', type=int, default=0)
+    suite.add_argument('--depth', type=int, default=2, help="Profundidad de bloques anidados")
+    suite.add_argument('--comment-density', type=float, default=0.5)
+    suite.add_argument('--operators', type=float, default=0.1, help="Fracción de sobrecargas de operador")
+    suite.add_argument('--init-lists', type=float, default=0.2, help="Fracción de constructores con lista de inicialización")
+    suite.add_argument('--long-lines', type=float, default=0.05, help="Fracción de líneas de más de 120 caracteres")
+    suite.add_argument('--output', default=LATEST_PATH)
+
+    compare = subparsers.add_parser('compare', help="Marca regresiones contra una línea base")
+    compare.add_argument('baseline', nargs='?', default=BASELINE_PATH)
+    compare.add_argument('current', nargs='?', default=LATEST_PATH)
+    compare.add_argument('--threshold', type=float, default=0.10, help="Fracción tolerada (0.10 = 10%%)")
+    compare.add_argument('--metric', choices=('min', 'median'), default='min')
+
+    equivalence = subparsers.add_parser('equivalence', help="Resultados idénticos a la implementación anterior")
+    equivalence.add_argument('--files', type=int, default=100)
+    equivalence.add_argument('--seed', type=int, default=0)
+
+    render = subparsers.add_parser('render', help="Inserción en Text por línea vs. por lotes")
+    render.add_argument('--sizes', default=','.join(str(size) for size in RENDER_SIZES),
+                        help="Número de líneas por medición, separados por comas")
+    render.add_argument('--per-line-limit', type=int, default=10000,
+                        help="Tamaño máximo para medir la inserción línea por línea")
+
+    memory = subparsers.add_parser('memory', help="Memoria de las filas de método (offsets vs. texto)")
+    memory.add_argument('--functions', type=int, default=20000)
+    memory.add_argument('--seed', type=int, default=0)
+
+    imports = subparsers.add_parser('imports', help="Tiempo de importación del núcleo sin Tkinter")
+    imports.add_argument('--budget', type=float, default=IMPORT_BUDGET, help="Segundos máximos por módulo")
+    imports.add_argument('--repeat', type=int, default=3)
+
+    args = parser.parse_args(argv)
+    if args.command == 'equivalence':
+        return 1 if check_equivalence(args.files, args.seed) else 0
+    elif args.command == 'suite':
+        sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+        results = run_suite(
+            sizes, args.repeat, args.seed, depth=args.depth, comment_density=args.comment_density,
+            operators=args.operators, init_lists=args.init_lists, long_lines=args.long_lines
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Resultados guardados en {args.output}")
+    elif args.command == 'compare':
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        with open(args.current, encoding='utf-8') as f:
+            current = json.load(f)
+        lines, regressions = compare_results(baseline, current, args.threshold, args.metric)
+        print('\n'.join(lines))
+        print(f"Regresiones: {len(regressions)}")
+        return 1 if regressions else 0
+    elif args.command == 'parallel':
+        bench_parallel(args.files, args.functions, args.workers)
+    elif args.command == 'memory':
+        return 1 if bench_memory(args.functions, args.seed) else 0
+    elif args.command == 'imports':
+        return 1 if check_imports(args.budget, args.repeat) else 0
+    elif args.command == 'render':
+        sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+        bench_render(sizes, args.per_line_limit)
+    elif args.command == 'stress':
+        bench_stress(args.scale, args.fuzz, args.budget or None, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,17 @@
 import tkinter as tk
-from tkinter import scrolledtext, filedialog, messagebox
-from collections import OrderedDict 
+from tkinter import scrolledtext, filedialog, messagebox, ttk
+import json
 import os
-import re
-# ASUMIMOS que Monitoring.py sigue proveyendo estas funciones
-from Monitoring import monitor_methods, _extract_brace_body, _get_header_comment
+import time
+from Pipeline import (
+    DEFAULT_EXCLUDE, DEFAULT_INCLUDE, DEFAULT_TIME_BUDGET, analyze_path, file_metadata, metrics_rows, run_pipeline,
+    read_source, run_pipeline_parallel, render_review, render_summary, scan_directory, stat_files_parallel,
+)
+from Monitoring import method_detail_lines
+from FileModel import FileListModel
+from TextRender import TextBatch
+from Worker import BackgroundWorker
+from ResultCache import ResultCache, format_cache_stats
 
 
 class CodeReviewApp:
@@ -20,7 +27,15 @@ class CodeReviewApp:
         self.root.title("Revisor y Monitor de Código (Standards V26 - Consistencia de Parámetros)")
         self.root.geometry("1400x750")
 
-        self.loaded_files = OrderedDict() 
+        # ruta -> metadatos {'size', 'mtime', 'digest'} en orden de fila del Listbox;
+        # el contenido se lee al analizar
+        self.loaded_files = FileListModel()
+        self._load_errors = []      # (ruta, error) de la carga en curso, resumidos al terminar
+        self._folder_found = None   # archivos nuevos encontrados por Cargar Carpeta (None = recorriendo)
+        
+        # Filtros de "Cargar Carpeta" (globs separados por ';')
+        self.var_include = tk.StringVar(value=DEFAULT_INCLUDE)
+        self.var_exclude = tk.StringVar(value=DEFAULT_EXCLUDE)
 
         self.var_120_chars = tk.BooleanVar(value=True)
         self.var_check_todos = tk.BooleanVar(value=True) 
@@ -31,6 +46,35 @@ class CodeReviewApp:
         
         self.var_monitor_methods = tk.BooleanVar(value=True) 
         
+        # Modo paralelo: reparte los archivos entre procesos (multi-núcleo)
+        self.var_parallel = tk.BooleanVar(value=False)
+        self.var_workers = tk.IntVar(value=os.cpu_count() or 1)
+        
+        # Caché persistente de resultados (por hash de contenido)
+        self.var_cache = tk.BooleanVar(value=True)
+        self.cache = ResultCache()
+        
+        # Hilo de trabajo: el análisis y la carga no bloquean la ventana
+        self.worker = BackgroundWorker(self.root)
+        self._total_violations = 0
+        self._cache_stats = [0, 0]
+        
+        # Modo vigilancia: re-analiza solo los archivos cuyo mtime cambió
+        self.var_watch = tk.BooleanVar(value=False)
+        self._watch_job = None
+        self._sections = {}         # ruta -> tag de su sección en las áreas de texto
+        self._file_violations = {}  # ruta -> violaciones de su último análisis
+        self._method_rows = {}      # tag de sección -> (ruta, filas de método) del árbol de monitoreo
+        self._detail_source = None  # (ruta, mtime, código) del último archivo leído para el detalle
+        self._last_run = None       # (checks, monitor, instrumentar) del último análisis mostrado
+        
+        # Instrumentación: filas por archivo y etapa para el panel "Rendimiento"
+        self.var_instrument = tk.BooleanVar(value=False)
+        self._perf_rows = []
+        self._perf_window = None
+        self._perf_tree = None
+        self._perf_sort = ('seconds', True)
+        
         self.setup_ui()
 
     def setup_ui(self):
@@ -55,7 +99,14 @@ class CodeReviewApp:
             bg="#4CAF50", fg="white", 
             command=self.load_files_to_list
         )
-        self.boton_cargar.grid(row=1, column=0, columnspan=2, sticky='ew', pady=5)
+        self.boton_cargar.grid(row=1, column=0, sticky='ew', pady=5, padx=(0, 2))
+
+        self.boton_carpeta = tk.Button(
+            frame_archivos, text="📁 Cargar Carpeta", font=('Arial', 10, 'bold'),
+            bg="#4CAF50", fg="white",
+            command=self.load_folder_to_list
+        )
+        self.boton_carpeta.grid(row=1, column=1, sticky='ew', pady=5, padx=(2, 0))
 
         self.listbox_archivos = tk.Listbox(
             frame_archivos, selectmode=tk.EXTENDED, font=('Consolas', 10),
@@ -70,6 +121,15 @@ class CodeReviewApp:
         )
         self.boton_eliminar.grid(row=3, column=0, columnspan=2, sticky='ew', pady=5)
 
+        # Filtros de carpeta: globs de inclusión y exclusión ('build/' omite la carpeta entera)
+        frame_filtros = tk.Frame(frame_archivos)
+        frame_filtros.grid(row=4, column=0, columnspan=2, sticky='ew', pady=(5, 0))
+        frame_filtros.grid_columnconfigure(1, weight=1)
+        tk.Label(frame_filtros, text="Incluir:", font=('Arial', 9)).grid(row=0, column=0, sticky='w')
+        tk.Entry(frame_filtros, textvariable=self.var_include, font=('Consolas', 9)).grid(row=0, column=1, sticky='ew')
+        tk.Label(frame_filtros, text="Excluir:", font=('Arial', 9)).grid(row=1, column=0, sticky='w')
+        tk.Entry(frame_filtros, textvariable=self.var_exclude, font=('Consolas', 9)).grid(row=1, column=1, sticky='ew')
+
         # --- Panel Derecho: Controles y Resultados (Columna 1) ---
 
         # Fila 0: Controles
@@ -109,9 +169,51 @@ class CodeReviewApp:
             font=('Arial', 10, 'bold'), fg="#008080"
         ).pack(side=tk.LEFT, padx=5)
         
-        # Botón de acción
+        # Separador para Ejecución Paralela
+        tk.Label(frame_controles, text="|", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+        
+        tk.Checkbutton(
+            frame_controles, text="Paralelo", variable=self.var_parallel,
+            font=('Arial', 10)
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Label(frame_controles, text="Workers:", font=('Arial', 10)).pack(side=tk.LEFT)
+        tk.Spinbox(
+            frame_controles, from_=1, to=64, width=3, textvariable=self.var_workers,
+            font=('Arial', 10)
+        ).pack(side=tk.LEFT, padx=(2, 5))
+        
+        tk.Checkbutton(
+            frame_controles, text="Caché", variable=self.var_cache,
+            font=('Arial', 10)
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Button(
+            frame_controles, text="Invalidar Caché", font=('Arial', 9),
+            command=self.invalidate_cache
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(
+            frame_controles, text="👁 Vigilar Cambios", variable=self.var_watch,
+            font=('Arial', 10), command=self.toggle_watch
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Separador para Instrumentación
+        tk.Label(frame_controles, text="|", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=10)
+        
+        tk.Checkbutton(
+            frame_controles, text="Instrumentar", variable=self.var_instrument,
+            font=('Arial', 10)
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Button(
+            frame_controles, text="📊 Rendimiento", font=('Arial', 9),
+            command=self.open_performance_panel
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Fila 1: Botón de acción, barra de progreso y cancelación
+        frame_accion = tk.Frame(frame_principal)
+        frame_accion.grid(row=1, column=1, sticky='ew', pady=(5, 5))
+        frame_accion.grid_columnconfigure(0, weight=1)
+
         self.boton_verificar = tk.Button(
-            frame_principal, 
+            frame_accion, 
             text="Ejecutar Revisión y Monitoreo Completos", 
             font=('Arial', 12, 'bold'), 
             bg="#3f51b5", fg="white", 
@@ -119,7 +221,16 @@ class CodeReviewApp:
             activeforeground="white",
             command=self.analyze_all_files
         )
-        self.boton_verificar.grid(row=1, column=1, sticky='ew', pady=(5, 5))
+        self.boton_verificar.grid(row=0, column=0, sticky='ew')
+
+        self.barra_progreso = ttk.Progressbar(frame_accion, orient=tk.HORIZONTAL, length=200, mode='determinate')
+        self.barra_progreso.grid(row=0, column=1, sticky='ew', padx=(10, 5))
+
+        self.boton_cancelar = tk.Button(
+            frame_accion, text="⛔ Cancelar", font=('Arial', 10),
+            state=tk.DISABLED, command=self.cancel_work
+        )
+        self.boton_cancelar.grid(row=0, column=2, sticky='ew')
         
         # Fila 2: Títulos de las Áreas de Texto
         frame_titulos = tk.Frame(frame_principal)
@@ -147,13 +258,35 @@ class CodeReviewApp:
         self.area_resultado.insert(tk.END, "Selecciona los archivos y presiona 'Ejecutar Revisión Completa'.\n")
         self.area_resultado.config(state=tk.DISABLED)
         
-        # Área de Resultados de Monitoreo (Columna 1 del sub-frame)
+        # Área de Resultados de Monitoreo (Columna 1 del sub-frame): árbol archivo → métodos
+        # (los métodos se insertan al expandir el archivo) y detalle del método seleccionado
+        frame_monitoreo = tk.Frame(frame_resultados_monitoreo)
+        frame_monitoreo.grid(row=0, column=1, sticky='nsew', padx=(5, 0))
+        frame_monitoreo.grid_columnconfigure(0, weight=1)
+        frame_monitoreo.grid_rowconfigure(0, weight=3)
+        frame_monitoreo.grid_rowconfigure(1, weight=2)
+
+        self.tree_monitoreo = ttk.Treeview(
+            frame_monitoreo, columns=[key for key, _, _ in METHOD_COLUMNS], show='tree headings'
+        )
+        self.tree_monitoreo.heading('#0', text="Archivo / Método")
+        self.tree_monitoreo.column('#0', width=260)
+        for key, title, width in METHOD_COLUMNS:
+            self.tree_monitoreo.heading(key, text=title)
+            self.tree_monitoreo.column(key, width=width, anchor='e')
+        scroll_monitoreo = ttk.Scrollbar(frame_monitoreo, orient=tk.VERTICAL, command=self.tree_monitoreo.yview)
+        self.tree_monitoreo.configure(yscrollcommand=scroll_monitoreo.set)
+        self.tree_monitoreo.grid(row=0, column=0, sticky='nsew')
+        scroll_monitoreo.grid(row=0, column=1, sticky='ns')
+        self.tree_monitoreo.bind('<<TreeviewOpen>>', self._on_monitor_open)
+        self.tree_monitoreo.bind('<<TreeviewSelect>>', self._on_monitor_select)
+
         self.area_monitoreo = scrolledtext.ScrolledText(
-            frame_resultados_monitoreo, wrap=tk.WORD, font=('Consolas', 10),
+            frame_monitoreo, wrap=tk.WORD, font=('Consolas', 10), height=12,
             bg="#f0fff0", relief=tk.SUNKEN 
         )
-        self.area_monitoreo.grid(row=0, column=1, sticky='nsew', padx=(5, 0))
-        self.area_monitoreo.insert(tk.END, "Aquí se mostrarán los datos de monitoreo (e.g., métodos extraídos).\n")
+        self.area_monitoreo.grid(row=1, column=0, columnspan=2, sticky='nsew', pady=(5, 0))
+        self.area_monitoreo.insert(tk.END, "Selecciona un método del árbol para ver su comentario, firma y cuerpo.\n")
         self.area_monitoreo.config(state=tk.DISABLED)
         
         self.area_resultado.tag_config("warning", foreground="red", font=('Consolas', 10, 'bold'))
@@ -164,7 +297,8 @@ class CodeReviewApp:
     # =========================================================================
 
     def load_files_to_list(self):
-        """Permite al usuario seleccionar múltiples archivos y los carga."""
+        """Permite al usuario seleccionar múltiples archivos y los carga en segundo plano."""
+        if self.worker.running: return
         filepaths = filedialog.askopenfilenames(
             title="Seleccionar múltiples archivos para revisión",
             filetypes=(
@@ -174,20 +308,79 @@ class CodeReviewApp:
         )
         if not filepaths: return
 
-        count_new = 0
-        for filepath in filepaths:
-            try:
-                if filepath in self.loaded_files: continue
-                
-                with open(filepath, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                
-                self.loaded_files[filepath] = content
-                self.listbox_archivos.insert(tk.END, os.path.basename(filepath))
-                count_new += 1
-
-            except Exception as e:
-                messagebox.showerror("Error de Carga", f"No se pudo leer el archivo '{os.path.basename(filepath)}': {e}")
+        self._load_paths(filepaths)
+
+    def load_folder_to_list(self):
+        """Carga recursivamente una carpeta, filtrada con los globs de Incluir/Excluir."""
+        if self.worker.running: return
+        folder = filedialog.askdirectory(title="Seleccionar carpeta para revisión")
+        if not folder: return
+
+        # El recorrido (os.walk) y la lectura de metadatos corren en el hilo de trabajo;
+        # la barra de progreso toma su máximo cuando el recorrido informa cuántos hay
+        include, exclude = self.var_include.get(), self.var_exclude.get()
+        known = set(self.loaded_files)
+        self._load_errors = []
+        self._folder_found = None
+        self._start_work(0)
+        self.worker.start(
+            lambda cancel_event: _scan_and_stat(folder, include, exclude, known, cancel_event),
+            self._on_folder_item, self._on_folder_done
+        )
+
+    def _on_folder_item(self, item):
+        """Callback (hilo de Tk): el primer elemento es el total encontrado; el resto, archivos."""
+        if self._folder_found is None:
+            self._folder_found = item
+            self.barra_progreso.config(maximum=max(item, 1), value=0)
+            return
+        self._on_file_loaded(item)
+
+    def _on_folder_done(self, cancelled):
+        """Callback (hilo de Tk): avisa si la carpeta no tenía archivos nuevos que coincidan."""
+        self._on_load_done(cancelled)
+        if not cancelled and not self._folder_found:
+            messagebox.showinfo("Cargar Carpeta", "No se encontraron archivos nuevos que coincidan con los filtros.")
+
+    def _load_paths(self, filepaths):
+        """Lee los metadatos de los archivos nuevos en un pool de hilos, fuera del hilo de Tk."""
+        new_paths = [filepath for filepath in filepaths if filepath not in self.loaded_files]
+        if not new_paths: return
+
+        self._load_errors = []
+        self._start_work(len(new_paths))
+        self.worker.start(
+            lambda cancel_event: stat_files_parallel(new_paths),
+            self._on_file_loaded, self._on_load_done
+        )
+
+    def _on_file_loaded(self, item):
+        """Callback (hilo de Tk): registra los metadatos de un archivo (sin su contenido)."""
+        filepath, metadata, error = item
+        self.barra_progreso.step(1)
+        if error is not None:
+            self._load_errors.append((filepath, error))
+            return
+        changed_rows = self.loaded_files.add(filepath, metadata)
+        self.listbox_archivos.insert(tk.END, self.loaded_files.label(filepath))
+        # Un homónimo nuevo alarga la etiqueta de los archivos con el mismo nombre
+        for row in changed_rows:
+            self.listbox_archivos.delete(row)
+            self.listbox_archivos.insert(row, self.loaded_files.label(self.loaded_files.path_at(row)))
+
+    def _on_load_done(self, cancelled):
+        """Callback (hilo de Tk): resume en un solo diálogo los archivos que no se pudieron leer."""
+        self._on_work_done(cancelled)
+        if self._load_errors:
+            lines = [f"• {os.path.basename(path)}: {error}" for path, error in self._load_errors[:LOAD_ERRORS_SHOWN]]
+            hidden = len(self._load_errors) - LOAD_ERRORS_SHOWN
+            if hidden > 0:
+                lines.append(f"... y {hidden} más.")
+            messagebox.showerror(
+                "Error de Carga",
+                f"No se pudieron leer {len(self._load_errors)} archivo(s):\n\n" + "\n".join(lines)
+            )
+            self._load_errors = []
     
     def remove_selected_files(self):
         """Elimina los archivos seleccionados del Listbox y de la estructura global."""
@@ -196,459 +389,508 @@ class CodeReviewApp:
             messagebox.showwarning("Advertencia", "Selecciona al menos un archivo para eliminar.")
             return
 
-        files_to_remove_names = [self.listbox_archivos.get(i) for i in selected_indices]
-        
-        for i in reversed(selected_indices):
-            self.listbox_archivos.delete(i)
-            
-        keys_to_delete = []
-        for filepath in self.loaded_files.keys():
-            if os.path.basename(filepath) in files_to_remove_names:
-                keys_to_delete.append(filepath)
+        # Cada fila del Listbox es un índice del modelo: sin buscar por nombre de archivo
+        removed = self.loaded_files.remove_rows(selected_indices)
 
-        for key in keys_to_delete:
-            del self.loaded_files[key]
+        # Un solo borrado y una sola inserción (las etiquetas restantes pueden acortarse)
+        self.listbox_archivos.delete(0, tk.END)
+        if self.loaded_files:
+            self.listbox_archivos.insert(tk.END, *self.loaded_files.labels())
             
-        messagebox.showinfo("Archivos Eliminados", f"Se eliminaron {len(keys_to_delete)} archivo(s) de la lista.")
+        messagebox.showinfo("Archivos Eliminados", f"Se eliminaron {len(removed)} archivo(s) de la lista.")
 
     # =========================================================================
-    # === Lógica Central de Detección (Funciones de utilidad) ===
+    # === Lógica de Análisis (Pipeline por archivo) ===
     # =========================================================================
 
-    def _format_header_violation_message(self, func_name: str, line_num: int, param_list: list, error_type: str) -> str:
-        """
-        Formatea el mensaje de error para violaciones en la documentación del header (MISSING/EXTRA).
-        """
-        num_params = len(param_list)
-        quoted_params = [f"'{p}'" for p in param_list]
-        
-        if num_params == 1:
-            param_str = quoted_params[0]
-            param_word = "parameter"
-            verb = "is"
-        else:
-            param_word = "parameters"
-            verb = "are"
-            if num_params == 2:
-                param_str = f"{quoted_params[0]} and {quoted_params[1]}"
-            else:
-                param_str = ", ".join(quoted_params[:-1])
-                param_str += f", and {quoted_params[-1]}"
-
-        if error_type == 'MISSING':
-            header = f"The {param_word} {param_str} {verb} not mentioned in the function header comment."
-        elif error_type == 'EXTRA':
-            header = f"The {param_word} {param_str} {verb} documented in the header but {verb} not found in the function signature."
-        else:
-            header = f"Header documentation issue with {param_word} {param_str}."
-
-        message = f"\n    Line {line_num} (Function '{func_name}'): {header}"
-        return message
+    def _enabled_checks(self):
+        """Claves de Pipeline.REVIEW_CHECKS habilitadas en los checkboxes."""
+        selection = {
+            'line_length': self.var_120_chars,
+            'todos': self.var_check_todos,
+            'unused_params': self.var_unused_params,
+            'header_params': self.var_header_params,
+        }
+        return {key for key, var in selection.items() if var.get()}
 
-    def _format_unused_params_message_en(self, func_name: str, line_num: int, unused_list: list) -> str:
-        """
-        Formatea el mensaje de error para parámetros no utilizados (en inglés).
-        """
-        num_unused = len(unused_list)
-        quoted_params = [f"'{p}'" for p in unused_list]
-        
-        if num_unused == 1:
-            param_str = quoted_params[0]
-            verb = "is"
-            word = "parameter"
-            header = f"The {word} {param_str} {verb} defined but not used in the function body."
-        else:
-            verb = "are"
-            word = "parameters"
-            if num_unused == 2:
-                param_str = f"{quoted_params[0]} and {quoted_params[1]}"
-            else:
-                param_str = ", ".join(quoted_params[:-1])
-                param_str += f", and {quoted_params[-1]}"
-            header = f"The {word} {param_str} {verb} defined but not used in the function body."
-            
-        message = f"\n    Line {line_num} (Function '{func_name}'): {header}"
-        return message
-    
-    def _get_clean_param_name(self, param_str):
+    def analyze_all_files(self):
         """
-        Limpia una cadena de parámetro para aislar el nombre de la variable.
+        Ejecuta el pipeline (parseo → revisiones → monitoreo → render) una sola vez
+        por cada archivo cargado, en un hilo de trabajo. Los resultados aparecen
+        archivo por archivo a medida que terminan.
         """
-        param_str = param_str.strip()
-        
-        if param_str.lower() == 'void' or not param_str:
-            return None
-    
-        param_str = param_str.split('=')[0].strip()
-        
-        if param_str.startswith('{') or param_str.startswith('['):
-            return None 
-    
-        parts = param_str.split()
-        if not parts: return None
-    
-        potential_name_token = parts[-1]
-        
-        match = re.search(r'([a-zA-Z_][a-zA-Z0-9_]*)(?=[\[*&])', potential_name_token)
+        if self.worker.running: return
         
-        clean_name = potential_name_token
+        self.area_resultado.config(state=tk.NORMAL)
+        self.area_monitoreo.config(state=tk.NORMAL)
+        self.area_resultado.delete(1.0, tk.END)
+        self.area_monitoreo.delete(1.0, tk.END)
+        self.tree_monitoreo.delete(*self.tree_monitoreo.get_children())
+        self._method_rows = {}
+        self._detail_source = None
+        self._sections = {}
+        self._file_violations = {}
+        self._last_run = None
         
-        if match:
-            clean_name = match.group(1)
-        else:
-            clean_name = re.sub(r'[^\w]', '', potential_name_token).strip()
-    
-        if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', clean_name):
-            return clean_name
-            
-        return None
-
-    def _clean_body_for_param_search(self, body_content: str) -> str:
-        """
-        Limpia el cuerpo de la función para la búsqueda de parámetros de forma ULTRA-AGRESIVA.
-        """
-        # === FASE 1: Limpieza de COMENTARIOS (Alta Precedencia) =============
-        body_content = re.sub(r'(//|#).*$', ' ', body_content, flags=re.MULTILINE)
-        body_content = re.sub(r'/\*[\s\S]*?\*/', ' ', body_content, flags=re.DOTALL)
+        if not self.loaded_files:
+            self.area_resultado.insert(tk.END, "⚠️ No hay archivos cargados para analizar.")
+            self.area_resultado.config(state=tk.DISABLED)
+            self.area_monitoreo.config(state=tk.DISABLED)
+            return
 
-        # === FASE 2: Limpieza de STRINGS (Precedencia Media) =================
-        body_content = re.sub(r'"([^"\\]|\\.)*"', ' ', body_content, flags=re.DOTALL)
-        body_content = re.sub(r"'([^'\\]|\\.)*'", ' ', body_content, flags=re.DOTALL)
+        self.area_resultado.config(state=tk.DISABLED)
+        self.area_monitoreo.config(state=tk.DISABLED)
 
-        # === FASE 3: Normalización y Aislamiento de Tokens ===================
-        # Eliminar U+00A0
-        body_content = body_content.replace('\u00A0', ' ')
-        body_content = re.sub(r'\s', ' ', body_content) 
+        # Instantánea de la lista y de las opciones: el hilo de trabajo no lee variables de Tk.
+        # Solo viajan rutas: cada archivo se lee al analizarlo y se libera después.
+        filepaths = list(self.loaded_files)
+        enabled_checks = self._enabled_checks()
+        monitor = self.var_monitor_methods.get()
+        cache = self.cache if self.var_cache.get() else None
+        instrument = self.var_instrument.get()
 
-        body_content = re.sub(r'::', ' ', body_content) 
-        body_content = re.sub(r'->', ' ', body_content) 
-        body_content = re.sub(r'\.', ' ', body_content) 
+        if self.var_parallel.get():
+            # Los procesos reciben solo las rutas y leen cada archivo por su cuenta
+            try:
+                workers = max(1, self.var_workers.get())
+            except tk.TclError:
+                workers = None  # Valor inválido en el Spinbox: usar todos los núcleos
+            task = lambda cancel_event: run_pipeline_parallel(
+                filepaths, enabled_checks, monitor, workers, cancel_event, cache, DEFAULT_TIME_BUDGET, instrument,
+                False
+            )
+        else:
+            # El monitoreo viaja como filas compactas (sin texto): el árbol arma el detalle al pedirlo
+            task = lambda cancel_event: run_pipeline(
+                ((filepath, None) for filepath in filepaths), enabled_checks, monitor, cancel_event, cache,
+                DEFAULT_TIME_BUDGET, instrument, False
+            )
 
-        body_content = re.sub(r'[^\w]', ' ', body_content)
+        self._total_violations = 0
+        self._cache_stats = [0, 0] if cache is not None else None
+        self._last_run = (enabled_checks, monitor, instrument)
+        self._perf_rows = []
+        self._start_work(len(filepaths))
+        self.worker.start(task, self._on_file_analyzed, self._on_analysis_done, self._on_work_error)
+
+    def _on_file_analyzed(self, result):
+        """Callback (hilo de Tk): muestra los resultados de un archivo recién analizado."""
+        self._show_file_result(result)
+        self._total_violations += result['violation_count']
+        if self._cache_stats is not None:
+            self._cache_stats[0] += result['cache_hits']
+            self._cache_stats[1] += result['cache_misses']
+        self.barra_progreso.step(1)
+
+    def _on_analysis_done(self, cancelled):
+        """Callback (hilo de Tk): escribe el resumen final y libera la interfaz."""
+        batch = TextBatch()
+        if cancelled:
+            batch.add("\n\n⛔ ANÁLISIS CANCELADO por el usuario. Resultados parciales.\n", "warning")
+
+        # Mensaje de Resumen Final de Revisión (tag propio para que la vigilancia lo actualice)
+        final_summary, tag = render_summary(self._total_violations)
+        batch.add(final_summary, (tag, SUMMARY_TAG))
+        self._refresh_performance_panel()
+        if self._cache_stats is not None:
+            batch.add(format_cache_stats(*self._cache_stats) + "\n", ("ok", SUMMARY_TAG))
+        self.area_resultado.config(state=tk.NORMAL)
+        batch.flush(self.area_resultado, tk.END, see=tk.END)
+        self.area_resultado.config(state=tk.DISABLED)
+        self._on_work_done(cancelled)
 
-        body_content = re.sub(r' +', ' ', body_content).strip() 
-        
-        return body_content
+    def _on_work_error(self, error):
+        """Callback (hilo de Tk): muestra un error inesperado del hilo de trabajo."""
+        self.area_resultado.config(state=tk.NORMAL)
+        self.area_resultado.insert(
+            tk.END, f"\n--- ERROR FATAL DURANTE EL ANÁLISIS ---\n{type(error).__name__}: {str(error)}\n", "warning"
+        )
+        self.area_resultado.config(state=tk.DISABLED)
 
     # =========================================================================
-    # === Lógica de Estándares de Código (Módulos de Revisión) ===
+    # === Secciones por Archivo en las Áreas de Texto ===
     # =========================================================================
 
-    def check_line_length(self, code, filename):
-        """Verifica las líneas que exceden el límite de 120 caracteres."""
-        LINE_LIMIT = 120
-        lines = code.split('\n')
-        violations = []
-        for num_line, line in enumerate(lines, 1):
-            if len(line) > LINE_LIMIT:
-                violations.append(f"Line {num_line}: {len(line)} characters (Limit: {LINE_LIMIT})")
-        return "Límite de 120 Caracteres", violations, LINE_LIMIT
-
-    def check_for_todos(self, code, filename):
-        """Verifica la existencia de comentarios 'TODO', 'FIXME', o 'HACK'."""
-        keywords = ["TODO", "FIXME", "HACK"]
-        lines = code.split('\n')
-        violations = []
-        
-        pattern = re.compile(r'\b(?:' + '|'.join(keywords) + r')\b', re.IGNORECASE)
-        
-        for num_line, line in enumerate(lines, 1):
-            if pattern.search(line):
-                violations.append(f"Línea {num_line}: Se encontró un marcador de tarea (TODO/FIXME/HACK).")
-        return "Comentarios Pendientes (TODOs)", violations, 0 
-
-    def check_unused_parameters(self, code, filename):
+    def _show_file_result(self, result):
+        """Escribe (o reemplaza) la sección de un archivo en ambas áreas de texto."""
+        filepath = result['filepath']
+        if filepath not in self._sections:
+            self._sections[filepath] = f"archivo_{len(self._sections)}"
+        self._file_violations[filepath] = result['violation_count']
+        section = self._sections[filepath]
+        start = time.perf_counter()
+        review_chunks = render_review(result)
+        self._replace_section(self.area_resultado, section, review_chunks)
+        self._show_monitoring(result, section)
+        
+        # La inserción en Tk es una etapa más del panel de rendimiento
+        if result.get('metrics') is not None:
+            self._perf_rows = [row for row in self._perf_rows if row['file'] != filepath]
+            self._perf_rows.extend(metrics_rows(result))
+            self._perf_rows.append({
+                'file': filepath, 'stage': 'render (Tk)', 'seconds': time.perf_counter() - start,
+                'functions': 0, 'regex_searches': 0,
+                'bytes_scanned': sum(len(text) for text, _ in review_chunks),
+            })
+
+    def _show_monitoring(self, result, section):
         """
-        Revisa si los parámetros definidos en funciones o métodos son utilizados
-        dentro del cuerpo de la función, incluyendo la lista de inicialización.
+        Crea (o reemplaza en su lugar) el nodo de un archivo en el árbol de monitoreo.
+        Solo se inserta la fila del archivo: sus métodos se agregan al expandirla.
         """
-        
-        # Palabras clave de control de flujo C/C++ a excluir
-        EXCLUDED_KEYWORDS = r'(?:if|for|while|switch|catch|do|try|new|delete|sizeof|return|NULL|class|struct|enum|using)\b'
-
-        # PATRÓN V15: Captura la firma y la lista de inicialización.
-        FUNCTION_SIG_PATTERN = re.compile(
-            r'(?:^|\n)\s*'
-            r'(?:[a-zA-Z_][a-zA-Z0-9_:\s*&<>]+\s+)?' 
-            r'(?!' + EXCLUDED_KEYWORDS + r')'
-            r'([a-zA-Z_][a-zA-Z0-9_:]*)'  # Group 1 (Function/Method Name)
-            r'\s*\((.*?)\)'              # Group 2 (Parameters)
-            r'(?:\s*const)?' 
-            r'(\s*:[\s\S]*?)?'           # Group 3: Lista de inicialización (Constructor), opcional
-            r'\s*\{'                     # Coincide con la llave de apertura
-            , re.DOTALL 
+        tree = self.tree_monitoreo
+        methods = result.get('methods')
+        index = tk.END
+        was_open = False
+        if tree.exists(section):
+            index = tree.index(section)
+            was_open = tree.item(section, 'open')
+            tree.delete(section)
+        if methods is None and result['monitoring'] is None and not result['error']:
+            return  # Monitoreo desactivado
+
+        if methods is None:
+            # Error de lectura o tiempo agotado: el nodo muestra el motivo
+            reason = result['error'] or ' '.join(result['monitoring'])
+            tree.insert('', index, iid=section, text=f"{result['filename']}: {reason}")
+            return
+        self._method_rows[section] = (result['filepath'], methods, result['mtime'])
+        total_lines = sum(row.end_line - row.line + 1 for row in methods)
+        tree.insert(
+            '', index, iid=section, text=f"{result['filename']} ({len(methods)} método(s))",
+            values=('', total_lines, sum(row.size for row in methods))
         )
-        
-        violations = []
-        
-        if filename.lower().endswith(('.html', '.css', '.md')):
-            return "Parámetros No Utilizados", violations, 0
+        if methods:
+            tree.insert(section, tk.END, iid=f"{section}{PENDING_SUFFIX}", text="…")
+            if was_open:
+                self._populate_methods(section)
+                tree.item(section, open=True)
+
+    def _on_monitor_open(self, event=None):
+        """Al expandir un archivo del árbol se insertan sus filas de método (una sola vez)."""
+        self._populate_methods(self.tree_monitoreo.focus())
+
+    def _populate_methods(self, section):
+        """Sustituye el marcador de un nodo de archivo por una fila por método."""
+        tree = self.tree_monitoreo
+        placeholder = f"{section}{PENDING_SUFFIX}"
+        if not tree.exists(placeholder):
+            return
+        tree.delete(placeholder)
+        _, methods, _ = self._method_rows[section]
+        for number, row in enumerate(methods):
+            tree.insert(
+                section, tk.END, iid=f"{section}:{number}", text=row.name,
+                values=(row.line, row.end_line - row.line + 1, row.size)
+            )
 
-        current_pos = 0 
-        
-        while True:
-            match = FUNCTION_SIG_PATTERN.search(code, current_pos)
-            if not match:
-                break 
-
-            func_name = match.group(1).split('::')[-1] 
-            param_string = match.group(2) 
-            init_list = match.group(3) 
-            start_brace_index = match.end() - 1 
-            
-            func_body, body_end_index = _extract_brace_body(code, start_brace_index)
-            
-            if func_body is None or body_end_index == -1:
-                current_pos = start_brace_index + 1
-                continue 
-
-            start_line_index = code[:match.start()].count('\n') + 1
-
-            # 1. Extraer nombres de parámetros limpios
-            raw_params = [p.strip() for p in re.split(r',\s*', param_string) if p.strip()]
-            parameters = []
-            for p in raw_params:
-                param_name = self._get_clean_param_name(p)
-                if param_name and param_name not in ('self', 'cls', '_', '__'): 
-                    parameters.append(param_name)
-
-            if parameters:
-                used_in_init_list = set()
-                
-                # 2. Verificar uso en la Lista de Inicialización 
-                if init_list:
-                    for param in parameters:
-                        usage_pattern = re.compile(r'\b' + re.escape(param) + r'\b')
-                        if usage_pattern.search(init_list):
-                            used_in_init_list.add(param)
-                            
-                params_to_check_in_body = [p for p in parameters if p not in used_in_init_list]
-
-                unused_params_in_func = []
-                
-                if params_to_check_in_body:
-                    body_to_search = self._clean_body_for_param_search(func_body)
-
-                    # 5. Verificar el uso en el cuerpo limpio 
-                    for param in params_to_check_in_body:
-                        usage_pattern = re.compile(r'\b' + re.escape(param) + r'\b')
-                        
-                        if not usage_pattern.search(body_to_search):
-                            unused_params_in_func.append(param)
-                
-                # 6. Generar el mensaje de violación agrupado en inglés
-                if unused_params_in_func:
-                    violation_message = self._format_unused_params_message_en(
-                        func_name, start_line_index, unused_params_in_func
-                    )
-                    violations.append(violation_message)
-
-            current_pos = body_end_index + 1
-        
-        return "Parámetros No Utilizados", violations, 0
+    def _on_monitor_select(self, event=None):
+        """Muestra el detalle del método seleccionado, leyendo su archivo en ese momento."""
+        iid = self.tree_monitoreo.focus()
+        section, _, number = iid.partition(':')
+        if not number.isdigit() or section not in self._method_rows:
+            return
+        filepath, methods, analyzed_mtime = self._method_rows[section]
+        row = methods[int(number)]
+        try:
+            code, stale = self._method_source(filepath, analyzed_mtime)
+            text = "\n".join(method_detail_lines(row, code)).lstrip('\n') + "\n"
+            if stale:
+                text = "⚠️ El archivo cambió desde el análisis: vuelve a ejecutar la revisión.\n\n" + text
+        except OSError as e:
+            text = f"❌ ERROR: No se pudo leer el archivo: {e}\n"
+        self.area_monitoreo.config(state=tk.NORMAL)
+        self.area_monitoreo.delete(1.0, tk.END)
+        self.area_monitoreo.insert(tk.END, text)
+        self.area_monitoreo.config(state=tk.DISABLED)
 
-    # 🌟 FUNCIÓN DE REVISIÓN CORREGIDA (V26)
-    def check_header_params_documentation(self, code, filename):
+    def _method_source(self, filepath, analyzed_mtime):
         """
-        Verifica la consistencia entre los parámetros de la firma de la función
-        y los parámetros documentados en el comentario de cabecera.
-        
-        Corrige la detección de \param[in] name (ej. 'tag').
+        Contenido de un archivo para el detalle de métodos. Solo se conserva el último
+        archivo leído (seleccionar varios métodos del mismo archivo no lo relee).
+        Devuelve (código, cambió desde el análisis); `analyzed_mtime` es el mtime de la
+        versión analizada (resultado de analyze_path), no el de la carga en la lista.
         """
-        
-        EXCLUDED_KEYWORDS = r'(?:if|for|while|switch|catch|do|try|new|delete|sizeof|return|NULL|class|struct|enum|using)\b'
-
-        FUNCTION_SIG_PATTERN = re.compile(
-            r'(?:^|\n)\s*'
-            r'(?:[a-zA-Z_][a-zA-Z0-9_:\s*&<>]+\s+)?' 
-            r'(?!' + EXCLUDED_KEYWORDS + r')'
-            r'([a-zA-Z_][a-zA-Z0-9_:]*)'  # Group 1 (Function/Method Name)
-            r'\s*\((.*?)\)'              # Group 2 (Parameters)
-            r'(?:\s*const)?'
-            r'(\s*:[\s\S]*?)?'           # Group 3: Lista de inicialización
-            r'\s*([;\{])'                # Group 4: Llave de apertura '{' o punto y coma ';' (declaración)
-            , re.DOTALL 
+        mtime = _get_mtime(filepath)
+        if self._detail_source is None or self._detail_source[:2] != (filepath, mtime):
+            self._detail_source = (filepath, mtime, read_source(filepath))
+        return self._detail_source[2], analyzed_mtime is not None and mtime != analyzed_mtime
+
+    def _replace_section(self, area, section, chunks):
+        """
+        Sustituye el texto marcado con el tag `section` por `chunks` [(texto, tags)].
+        El resto del área (otros archivos, resumen) queda intacto.
+        """
+        area.config(state=tk.NORMAL)
+        ranges = area.tag_ranges(section)
+        if ranges:
+            index = ranges[0]
+            area.delete(ranges[0], ranges[-1])
+        else:
+            index = self._section_insert_index(area, section)
+        # Una sola llamada a insert para toda la sección (ver TextRender)
+        batch = TextBatch()
+        batch.extend(chunks)
+        batch.flush(area, index, extra_tags=(section,))
+        area.config(state=tk.DISABLED)
+
+    def _section_insert_index(self, area, section):
+        """Posición de una sección nueva o vacía: antes de la siguiente sección con texto o del resumen."""
+        following = list(self._sections.values())
+        for other in following[following.index(section) + 1:] + [SUMMARY_TAG]:
+            ranges = area.tag_ranges(other)
+            if ranges:
+                return ranges[0]
+        return tk.END
+
+    def _refresh_summary(self, changed):
+        """Recalcula el resumen final tras una re-evaluación de la vigilancia."""
+        self._total_violations = sum(self._file_violations.values())
+        final_summary, tag = render_summary(self._total_violations)
+        names = ", ".join(os.path.basename(path) for path in changed)
+        self._replace_section(self.area_resultado, SUMMARY_TAG, [
+            (final_summary, (tag,)),
+            (f"🔄 Actualizado ({len(changed)} archivo(s) modificado(s)): {names}\n", ("ok",)),
+        ])
+
+    # =========================================================================
+    # === Modo Vigilancia (sondeo de mtime) ===
+    # =========================================================================
+
+    def toggle_watch(self):
+        """Activa o detiene el sondeo periódico de los archivos cargados."""
+        if self.var_watch.get():
+            if self._watch_job is None:
+                self._watch_job = self.root.after(WATCH_POLL_MS, self._poll_changes)
+        elif self._watch_job is not None:
+            self.root.after_cancel(self._watch_job)
+            self._watch_job = None
+
+    def _poll_changes(self):
+        """Compara el mtime de cada archivo cargado y re-analiza solo los modificados."""
+        self._watch_job = None
+        if not self.var_watch.get():
+            return
+        if not self.worker.running:
+            changed = [
+                filepath for filepath in self.loaded_files
+                if _get_mtime(filepath) not in (None, self.loaded_files[filepath]['mtime'])
+            ]
+            if changed:
+                self._reanalyze(changed)
+        self._watch_job = self.root.after(WATCH_POLL_MS, self._poll_changes)
+
+    def _reanalyze(self, changed):
+        """Relee los archivos modificados en el hilo de trabajo y actualiza solo sus secciones."""
+        files = [(filepath, self.loaded_files[filepath]['digest']) for filepath in changed]
+        if self._last_run is None:
+            # Aún no hay resultados en pantalla: solo se refrescan los metadatos
+            task = lambda cancel_event: _reanalyze_files(files, None, False, None)
+        else:
+            enabled_checks, monitor, instrument = self._last_run
+            cache = self.cache if self.var_cache.get() else None
+            task = lambda cancel_event: _reanalyze_files(
+                files, enabled_checks, monitor, cache, cancel_event, instrument
+            )
+        updated = []
+        self._start_work(len(changed))
+        self.worker.start(
+            task,
+            lambda item: self._on_file_reanalyzed(item, updated),
+            lambda cancelled: self._on_reanalysis_done(updated, cancelled),
+            self._on_work_error
         )
-        
-        violations = []
-        
-        if not filename.lower().endswith(('.cpp', '.c', '.h', '.hpp', '.py', '.js', '.ts')):
-            return "Documented Parameters (Header)", violations, 0
 
-        current_pos = 0 
-        
-        while True:
-            match = FUNCTION_SIG_PATTERN.search(code, current_pos)
-            if not match:
-                break 
-
-            func_name_full = match.group(1) 
-            param_string = match.group(2) 
-            end_char = match.group(4) 
-            start_index = match.start()
-            start_line_index = code[:start_index].count('\n') + 1
-
-            # --- A. PARÁMETROS EN LA FIRMA (Signature Parameters) ---
-            raw_params = [p.strip() for p in re.split(r',\s*', param_string) if p.strip()]
-            sig_params = set() 
-            for p in raw_params:
-                param_name = self._get_clean_param_name(p)
-                if param_name and param_name not in ('self', 'cls', '_', '__'): 
-                    sig_params.add(param_name)
-
-            # --- B. PARÁMETROS EN LA DOCUMENTACIÓN (Header Parameters) ---
-            header_comment = _get_header_comment(code, start_index) 
-            doc_params = set() 
-            
-            if header_comment:
-                clean_comment = re.sub(r'\s+', ' ', header_comment)
-                
-                # 🎯 CORRECCIÓN ROBUSTA V26: Maneja todos los casos Doxygen.
-                # (\param o @param) seguido de [optional modifiers] luego (el nombre)
-                param_tag_matches = re.findall(
-                    r'(?:\\param|@param)\s+'
-                    r'(?:\[[^\]]+\]\s*)?' # [in], [out], [in, out] o cualquier cosa entre corchetes, opcional
-                    r'([a-zA-Z_][a-zA-Z0-9_]*)\b', 
-                    clean_comment
-                )
-                
-                for name in param_tag_matches:
-                    doc_params.add(name)
-
-            # --- C. COMPARACIÓN DE CONJUNTOS Y GENERACIÓN DE VIOLACIONES ---
-
-            # 1. Parámetros FALTANTES (En la firma, pero NO en la documentación)
-            missing_params = sorted(list(sig_params - doc_params))
-
-            if missing_params:
-                violation_message = self._format_header_violation_message(
-                    func_name_full, start_line_index, missing_params, 'MISSING'
-                )
-                violations.append(violation_message)
-
-            # 2. Parámetros EXTRA (En la documentación, pero NO en la firma)
-            extra_params = sorted(list(doc_params - sig_params))
-            
-            if extra_params:
-                violation_message = self._format_header_violation_message(
-                    func_name_full, start_line_index, extra_params, 'EXTRA'
-                )
-                violations.append(violation_message)
-            
-            # 3. Mover la posición de búsqueda
-            if end_char == ';':
-                current_pos = match.end()
-            else:
-                start_brace_index = match.end() - 1 
-                func_body, body_end_index = _extract_brace_body(code, start_brace_index)
-                
-                if body_end_index == -1:
-                    current_pos = match.end() # Fallback
-                else:
-                    current_pos = body_end_index + 1
-        
-        return "Documented Parameters (Header)", violations, 0
+    def _on_file_reanalyzed(self, item, updated):
+        """Callback (hilo de Tk): guarda los metadatos nuevos y reemplaza la sección del archivo."""
+        filepath, metadata, result = item
+        self.barra_progreso.step(1)
+        if metadata is None or filepath not in self.loaded_files:
+            return
+        self.loaded_files[filepath] = metadata
+        if result is not None:
+            self._show_file_result(result)
+            updated.append(filepath)
+            return
+        # Mismo contenido con otro mtime: los offsets de sus métodos siguen siendo válidos
+        section = self._sections.get(filepath)
+        if section in self._method_rows:
+            path, methods, _ = self._method_rows[section]
+            self._method_rows[section] = (path, methods, metadata['mtime'])
+
+    def _on_reanalysis_done(self, updated, cancelled):
+        """Callback (hilo de Tk): actualiza el resumen si algún archivo se re-analizó."""
+        if updated:
+            self._refresh_summary(updated)
+            self._refresh_performance_panel()
+        self._on_work_done(cancelled)
+
     # =========================================================================
-    # === Lógica de Monitoreo ===
+    # === Panel de Rendimiento (instrumentación) ===
     # =========================================================================
 
-    # ... (Lógica de Monitoreo no se toca) ...
-    def analyze_all_files(self):
-        """Ejecuta todos los checks seleccionados en todos los archivos cargados (Revisión y Monitoreo)."""
-        
-        self.area_resultado.config(state=tk.NORMAL)
-        self.area_monitoreo.config(state=tk.NORMAL)
-        self.area_resultado.delete(1.0, tk.END)
-        self.area_monitoreo.delete(1.0, tk.END)
-        
-        if not self.loaded_files:
-            self.area_resultado.insert(tk.END, "⚠️ No hay archivos cargados para analizar.")
-            self.area_resultado.config(state=tk.DISABLED)
-            self.area_monitoreo.config(state=tk.DISABLED)
+    def open_performance_panel(self):
+        """Abre (o trae al frente) la ventana con las métricas por archivo y etapa."""
+        if self._perf_window is not None and self._perf_window.winfo_exists():
+            self._perf_window.lift()
+            self._refresh_performance_panel()
             return
 
-        total_violations = 0
-        
-        # --- EJECUTAR REVISIÓN (Violaciones) ---
-        for filepath, content in self.loaded_files.items():
-            filename = os.path.basename(filepath)
-            
-            file_violations_count = 0
-            file_results = []
+        self._perf_window = tk.Toplevel(self.root)
+        self._perf_window.title("Rendimiento por Archivo y Etapa")
+        self._perf_window.geometry("900x450")
+
+        barra = tk.Frame(self._perf_window, padx=5, pady=5)
+        barra.pack(fill='x')
+        tk.Label(
+            barra, text="Activa 'Instrumentar' y ejecuta la revisión. Clic en una columna para ordenar.",
+            font=('Arial', 9)
+        ).pack(side=tk.LEFT)
+        tk.Button(barra, text="💾 Exportar JSON", command=self.export_performance_json).pack(side=tk.RIGHT)
+
+        frame_tabla = tk.Frame(self._perf_window)
+        frame_tabla.pack(expand=True, fill='both', padx=5, pady=(0, 5))
+        self._perf_tree = ttk.Treeview(frame_tabla, columns=[c[0] for c in PERF_COLUMNS], show='headings')
+        for key, title, width in PERF_COLUMNS:
+            self._perf_tree.heading(key, text=title, command=lambda key=key: self._sort_performance(key))
+            self._perf_tree.column(key, width=width, anchor='w' if key in ('file', 'stage') else 'e')
+        scroll = ttk.Scrollbar(frame_tabla, orient=tk.VERTICAL, command=self._perf_tree.yview)
+        self._perf_tree.configure(yscrollcommand=scroll.set)
+        self._perf_tree.pack(side=tk.LEFT, expand=True, fill='both')
+        scroll.pack(side=tk.RIGHT, fill='y')
+        self._refresh_performance_panel()
+
+    def _sort_performance(self, key):
+        """Ordena por `key`; un segundo clic en la misma columna invierte el orden."""
+        current_key, descending = self._perf_sort
+        self._perf_sort = (key, not descending if key == current_key else key not in ('file', 'stage'))
+        self._refresh_performance_panel()
+
+    def _refresh_performance_panel(self):
+        """Vuelve a llenar la tabla del panel (si está abierto) con las filas actuales."""
+        if self._perf_tree is None or not self._perf_tree.winfo_exists():
+            return
+        key, descending = self._perf_sort
+        rows = sorted(self._perf_rows, key=lambda row: row[key], reverse=descending)
+        self._perf_tree.delete(*self._perf_tree.get_children())
+        for row in rows:
+            self._perf_tree.insert('', tk.END, values=(
+                os.path.basename(row['file']), row['stage'], f"{row['seconds'] * 1000:.2f}",
+                row['functions'], row['regex_searches'], row['bytes_scanned'],
+            ))
+
+    def export_performance_json(self):
+        """Guarda las métricas del último análisis instrumentado en un archivo JSON."""
+        if not self._perf_rows:
+            messagebox.showwarning("Advertencia", "No hay métricas: activa 'Instrumentar' y ejecuta la revisión.")
+            return
+        filepath = filedialog.asksaveasfilename(
+            title="Exportar métricas de rendimiento", defaultextension=".json",
+            filetypes=(("JSON", "*.json"), ("Todos los archivos", "*.*"))
+        )
+        if not filepath: return
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump({'rows': self._perf_rows}, f, ensure_ascii=False, indent=2)
+        messagebox.showinfo("Métricas Exportadas", f"Se guardaron {len(self._perf_rows)} filas en {filepath}.")
+
+    # =========================================================================
+    # === Control del Hilo de Trabajo ===
+    # =========================================================================
+
+    def _start_work(self, total):
+        """Prepara la barra de progreso y bloquea los botones mientras hay trabajo en curso."""
+        self.barra_progreso.config(maximum=max(total, 1), value=0)
+        for boton in (self.boton_cargar, self.boton_carpeta, self.boton_eliminar, self.boton_verificar):
+            boton.config(state=tk.DISABLED)
+        self.boton_cancelar.config(state=tk.NORMAL)
+
+    def _on_work_done(self, cancelled=False):
+        """Callback (hilo de Tk): restablece los botones al terminar o cancelar."""
+        for boton in (self.boton_cargar, self.boton_carpeta, self.boton_eliminar, self.boton_verificar):
+            boton.config(state=tk.NORMAL)
+        self.boton_cancelar.config(state=tk.DISABLED)
+
+    def cancel_work(self):
+        """Solicita al hilo de trabajo que se detenga entre funciones."""
+        self.worker.cancel()
+
+    def invalidate_cache(self):
+        """Vacía la caché persistente de resultados."""
+        if self.worker.running:
+            messagebox.showwarning("Advertencia", "Espera a que termine el análisis en curso.")
+            return
+        self.cache.invalidate()
+        messagebox.showinfo("Caché", "Se vació la caché de resultados.")
+
+
+# Columnas del árbol de monitoreo (clave, título, ancho); la columna de árbol es el nombre
+METHOD_COLUMNS = [
+    ('line', "Línea", 70),
+    ('lines', "Líneas", 70),
+    ('size', "Bytes", 90),
+]
+# Sufijo del hijo marcador que hace expandible un archivo antes de insertar sus métodos
+PENDING_SUFFIX = ":pendiente"
+
+# Columnas del panel de rendimiento: (clave de la fila, título, ancho)
+PERF_COLUMNS = [
+    ('file', "Archivo", 220),
+    ('stage', "Etapa", 130),
+    ('seconds', "Tiempo (ms)", 100),
+    ('functions', "Funciones", 90),
+    ('regex_searches', "Búsquedas regex", 120),
+    ('bytes_scanned', "Bytes recorridos", 120),
+]
+
+# Intervalo de sondeo del modo vigilancia y nombres reservados en las áreas de texto
+WATCH_POLL_MS = 1000
+# Errores de carga listados en el diálogo de resumen (el resto se cuenta)
+LOAD_ERRORS_SHOWN = 15
+SUMMARY_TAG = "resumen_final"
+
+
+def _scan_and_stat(folder, include, exclude, known, cancel_event):
+    """
+    Tarea del hilo de trabajo para Cargar Carpeta: recorre `folder` con los filtros,
+    produce primero cuántos archivos nuevos (fuera de `known`) encontró y después
+    (ruta, metadatos, error) de cada uno (ver stat_files_parallel).
+    """
+    filepaths = [
+        filepath for filepath in map(os.path.normpath, scan_directory(folder, include, exclude, cancel_event))
+        if filepath not in known
+    ]
+    yield len(filepaths)
+    yield from stat_files_parallel(filepaths)
+
+
+def _get_mtime(filepath):
+    """mtime del archivo o None si ya no existe / no es accesible."""
+    try:
+        return os.stat(filepath).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _reanalyze_files(files, enabled_checks, monitor, cache, cancel_event=None, instrument=False):
+    """
+    Generador (hilo de trabajo) del modo vigilancia: `files` son pares (ruta, digest anterior)
+    y produce (ruta, metadatos, resultado). Un archivo cuyo contenido no cambió (solo el
+    mtime) o sin `enabled_checks` no se re-analiza (resultado None). Un archivo ilegible
+    (p. ej. a medio guardar) produce metadatos None y se reintenta en el siguiente sondeo.
+    """
+    for filepath, previous_digest in files:
+        try:
+            metadata = file_metadata(filepath)
+        except OSError:
+            yield filepath, None, None
+            continue
+        result = None
+        if enabled_checks is not None and metadata['digest'] != previous_digest:
+            result = analyze_path(
+                filepath, enabled_checks, monitor, cancel_event, cache, DEFAULT_TIME_BUDGET, instrument, False
+            )
+        yield filepath, metadata, result
 
-            self.area_resultado.insert(tk.END, f"\n\n==================================================================\n")
-            self.area_resultado.insert(tk.END, f"🔎 REVISIÓN DE ESTÁNDARES: {filename}\n", "ok")
-            self.area_resultado.insert(tk.END, f"==================================================================\n")
-            
-            # 1. Check: Límite de 120 Caracteres
-            if self.var_120_chars.get():
-                _, violations, _ = self.check_line_length(content, filename)
-                if violations:
-                    file_results.append(f"❌ VIOLACIÓN: Límite de 120 Caracteres ({len(violations)} líneas)")
-                    file_results.extend([f"     > {v}" for v in violations])
-                    file_violations_count += len(violations)
-                else:
-                    file_results.append("✅ Límite de 120 Caracteres: OK")
-                    
-            # 2. Check: TODOs/FIXMEs
-            if self.var_check_todos.get():
-                _, violations, _ = self.check_for_todos(content, filename)
-                if violations:
-                    file_results.append(f"⚠️ PENDIENTE: Comentarios Pendientes (TODOs/FIXMEs) ({len(violations)} encontrados)")
-                    file_results.extend([f"     > {v}" for v in violations])
-                    file_violations_count += len(violations)
-                else:
-                    file_results.append("✅ Comentarios Pendientes: OK")
-            
-            # 3. Check: Parámetros No Utilizados
-            if self.var_unused_params.get():
-                _, violations, _ = self.check_unused_parameters(content, filename)
-                if violations:
-                    file_results.append(f"❌ VIOLACIÓN CRÍTICA: Parámetros No Utilizados ({len(violations)} funciones afectadas)")
-                    file_results.extend(violations) 
-                    file_violations_count += len(violations)
-                else:
-                    file_results.append("✅ Parámetros No Utilizados: OK")
-
-            # 🌟 4. Check: Parámetros Documentados en Header (¡Actualizado V26!)
-            if self.var_header_params.get():
-                _, violations, _ = self.check_header_params_documentation(content, filename)
-                if violations:
-                    file_results.append(f"❌ VIOLACIÓN: Consistencia de Documentación de Parámetros ({len(violations)} problemas)")
-                    file_results.extend(violations) 
-                    file_violations_count += len(violations)
-                else:
-                    file_results.append("✅ Parámetros Documentados: OK")
-                        
-            # Mostrar resultados de revisión
-            for result in file_results:
-                if result.startswith(('❌', '⚠️')):
-                    self.area_resultado.insert(tk.END, result + "\n", "warning")
-                else:
-                    self.area_resultado.insert(tk.END, result + "\n", "ok")
-
-            total_violations += file_violations_count
-            
-            # --- EJECUTAR MONITOREO (Extracción de Datos) ---
-            for filepath, content in self.loaded_files.items():
-                filename = os.path.basename(filepath)
-                
-                if self.var_monitor_methods.get():
-                    _, output_lines, _ = monitor_methods(content, filename)
-                    
-                    self.area_monitoreo.insert(tk.END, "\n".join(output_lines) + "\n\n")
-
-        # Mensaje de Resumen Final de Revisión
-        final_summary = f"\n\n--- RESUMEN FINAL DE REVISIÓN ---\n"
-        if total_violations > 0:
-            final_summary += f"🔴 ALERTA: Se encontraron {total_violations} violaciones de estándares en total.\n"
-            self.area_resultado.insert(tk.END, final_summary, "warning")
-        else:
-            final_summary += "🟢 ÉXITO: Todos los archivos cargados cumplen con los estándares seleccionados.\n"
-            self.area_resultado.insert(tk.END, final_summary, "ok")
-            
-        self.area_resultado.config(state=tk.DISABLED)
-        self.area_monitoreo.config(state=tk.DISABLED)
 
 # =========================================================================
 # === Bloque de Ejecución Principal ===
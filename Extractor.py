@@ -0,0 +1,573 @@
+# Extractor.py
+
+import re
+import time
+from bisect import bisect_left, bisect_right
+
+from Lexer import RegionMask
+from LineRules import evaluate_line_rules
+
+
+# Palabras clave de control de flujo C/C++ a excluir de ser nombres de función
+EXCLUDED_KEYWORDS = r'(?:if|for|while|switch|catch|do|try|new|delete|sizeof|return|NULL|class|struct|enum|using)\b'
+
+# Operadores sobrecargables reconocidos en el nombre de la función
+OPERATOR_SYMBOLS = r'(?:<<|>>|==|!=|<=|>=|<|>|\+\+|--|\+|-|\*|/|%|=|\[\]|&|\||\^|~|\(\))'
+
+# Caracteres de un token del tipo de retorno y de los parámetros (sin ';', llaves ni paréntesis)
+_TYPE_TOKEN_CHARS = r'[a-zA-Z0-9_:*&<>]'
+_PARAM_CHARS = r'[^;{}()]'
+
+# Átomos de la lista de parámetros. Cada uno empieza con un caracter distinto (texto, '('
+# o '{'), así que no se solapan y las repeticiones pueden ser posesivas:
+#   - hasta dos niveles de paréntesis anidados: 'std::function<void(int(*)(int))> f'
+#   - un valor por defecto entre llaves, acotado y sin anidar: 'std::vector<int> v = {}'
+MAX_DEFAULT_BRACE_LENGTH = 200
+_PARAM_BRACES = r'\{' + _PARAM_CHARS + r'{0,' + str(MAX_DEFAULT_BRACE_LENGTH) + r'}+\}'
+_PARAM_PARENS_2 = r'\(' + _PARAM_CHARS + r'*+\)'
+_PARAM_PARENS_1 = r'\((?:' + _PARAM_CHARS + r'++|' + _PARAM_PARENS_2 + r'|' + _PARAM_BRACES + r')*+\)'
+_PARAM_LIST = r'(?:' + _PARAM_CHARS + r'++|' + _PARAM_PARENS_1 + r'|' + _PARAM_BRACES + r')*+'
+
+# Límites que acotan el trabajo del patrón por candidato (ver V27 abajo)
+MAX_RETURN_TYPE_TOKENS = 8
+MAX_INIT_LIST_LENGTH = 4000
+
+# PATRÓN UNIFICADO (V16): Una sola pasada por archivo para todas las revisiones y el monitoreo.
+# Reúne lo que antes hacían por separado check_unused_parameters, check_header_params_documentation,
+# monitor_methods y 003.locate_method_starts.
+# V27: Sin retroceso catastrófico. El tipo de retorno se divide en tokens (antes
+# '[...\s...]+\s+' era ambiguo y tardaba minutos en archivos con muchas líneas vacías),
+# los parámetros no cruzan ';' y solo admiten paréntesis (dos niveles) y llaves de valores
+# por defecto acotadas (antes '(.*?)' podía recorrer el resto del archivo), y la lista
+# de inicialización es posesiva y acotada.
+FUNCTION_SIG_PATTERN = re.compile(
+    # Inicio de cadena O después de un salto de línea, seguido de espacios de la misma línea
+    r'(?:^|\n)[^\S\n]*'
+    # Tipo de retorno o scope (opcional, tokens separados por espacios/saltos de línea)
+    r'(?:[a-zA-Z_]' + _TYPE_TOKEN_CHARS + r'*'
+    r'(?:\s+' + _TYPE_TOKEN_CHARS + r'+){0,' + str(MAX_RETURN_TYPE_TOKENS) + r'}\s+)?'
+    r'(?!' + EXCLUDED_KEYWORDS + r')'
+    # Group 1: Operador sobrecargado (con o sin alcance) o nombre (incluye destructores '~')
+    r'((?:[a-zA-Z_][a-zA-Z0-9_]*::)*operator\s*' + OPERATOR_SYMBOLS + r'|[a-zA-Z_~][a-zA-Z0-9_:~]*)'
+    # Group 2: Parámetros (dos niveles de paréntesis y valores por defecto '{...}')
+    r'\s*\((' + _PARAM_LIST + r')\)'
+    r'(?:\s*const)?'             # Modificador const (opcional)
+    # Group 3: Lista de inicialización (Constructor), opcional
+    r'(\s*:[^;{]{0,' + str(MAX_INIT_LIST_LENGTH) + r'}+)?'
+    r'\s*([;\{])'                # Group 4: Llave de apertura '{' o ';' (declaración)
+)
+
+NO_HEADER_COMMENT = "No se encontró comentario de cabecera."
+
+
+class AnalysisCancelled(Exception):
+    """Se lanza entre funciones cuando el usuario cancela el análisis en curso."""
+
+
+class AnalysisTimedOut(Exception):
+    """Se lanza cuando una etapa supera su presupuesto de tiempo (entre funciones o al construir un índice)."""
+
+_NON_SPACE = re.compile(r'\S')
+_BRACE_PATTERN = re.compile(r'[{}]')
+# Cada cuántas llaves o líneas se comprueba la cancelación / el plazo al construir los índices
+_CANCEL_CHECK_ITEMS = 4096
+_COMMENT_LINE_PREFIXES = ('//', '*', '#')
+
+
+class SourceFile:
+    """
+    Archivo de código analizado una sola vez. Las revisiones y el monitoreo consumen
+    los mismos registros de función, sin importar cuántas revisiones estén activas.
+    """
+    def __init__(self, code, filename, cancel_event=None, functions=None):
+        self.code = code
+        self.filename = filename
+        self.cancel_event = cancel_event
+        # Instante (time.perf_counter) a partir del cual la etapa en curso se aborta
+        self.deadline = None
+        # Contadores de la etapa en curso (ver new_stage_stats); None = instrumentación apagada
+        self.stats = None
+        # Reglas por línea a evaluar juntas en la primera consulta (ver line_hits)
+        self.line_rules = ()
+        # `functions` permite reutilizar registros ya extraídos (p. ej. desde la caché)
+        self._functions = functions
+        self._line_index = None
+        self._comment_index = None
+        self._region_mask = None
+        self._brace_table = None
+        self._line_hits = {}
+
+    @property
+    def functions(self):
+        """Lista de registros de función (se extrae en el primer acceso)."""
+        if self._functions is None:
+            self._functions = extract_functions(
+                self.code, self.line_index, self.comment_index, self.cancel_event, self.deadline, self.stats,
+                self.brace_table
+            )
+        return self._functions
+
+    @property
+    def functions_extracted(self):
+        """True si los registros de función ya están disponibles (extraídos o reutilizados)."""
+        return self._functions is not None
+
+    @property
+    def line_index(self):
+        """Tabla de saltos de línea del archivo (se construye en el primer acceso)."""
+        if self._line_index is None:
+            self._line_index = LineIndex(self.code)
+        return self._line_index
+
+    @property
+    def comment_index(self):
+        """Índice de comentarios del archivo (se construye en el primer acceso)."""
+        if self._comment_index is None:
+            self._comment_index = CommentIndex(self.code, self.line_index, self.check_cancelled)
+        return self._comment_index
+
+    @property
+    def region_mask(self):
+        """Clasificación código/comentario/literal de cada offset (se construye en el primer acceso)."""
+        if self._region_mask is None:
+            self._region_mask = RegionMask(self.code, self.check_cancelled)
+            self.record_search(1, len(self.code))
+        return self._region_mask
+
+    @property
+    def brace_table(self):
+        """Tabla de llaves emparejadas del archivo (se construye en el primer acceso)."""
+        if self._brace_table is None:
+            self._brace_table = BraceTable(self.code, self.region_mask, self.check_cancelled)
+        return self._brace_table
+
+    def line_hits(self, rule_name):
+        """
+        Resultados [(línea, detalle), ...] de una regla de LineRules. En la primera consulta
+        se evalúan juntas (ver LineRules), `rule_name` y las reglas de `line_rules`
+        que aún no tengan resultado.
+        """
+        if rule_name not in self._line_hits:
+            pending = {rule_name, *self.line_rules} - self._line_hits.keys()
+            self._line_hits.update(evaluate_line_rules(self, pending))
+        return self._line_hits[rule_name]
+
+    def line_of(self, offset):
+        """Número de línea (base 1) de un offset."""
+        return self.line_index.line_of(offset)
+
+    def position(self, offset):
+        """Tupla (línea, columna), ambas en base 1, de un offset."""
+        return self.line_index.position(offset)
+
+    def check_cancelled(self):
+        """Lanza AnalysisCancelled si se solicitó la cancelación, o AnalysisTimedOut si venció el plazo."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AnalysisCancelled(self.filename)
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise AnalysisTimedOut(self.filename)
+
+    def iter_functions(self, definitions_only=False):
+        """
+        Itera los registros comprobando la cancelación entre una función y la siguiente.
+        Si aún no se extrajeron, se generan a medida que se encuentran (ver _stream_functions).
+        """
+        stats = self.stats
+        records = self._functions if self._functions is not None else self._stream_functions()
+        for record in records:
+            self.check_cancelled()
+            if definitions_only and record['body_span'] is None:
+                continue
+            if stats is not None:
+                stats['functions'] += 1
+            yield record
+
+    def _stream_functions(self):
+        """
+        Genera los registros directamente del patrón. Si se recorren hasta el final
+        quedan guardados en `functions`; si el consumidor se detiene antes, no se
+        extrae el resto del archivo.
+        """
+        records = []
+        for record in iter_extract_functions(
+            self.code, self.line_index, self.comment_index, self.cancel_event, self.deadline, self.stats,
+            self.brace_table
+        ):
+            records.append(record)
+            yield record
+        # Sin contar aquí: iter_functions ya suma cada registro que entrega
+        if self._functions is None:
+            self._functions = records
+
+    def definitions(self):
+        """Registros con cuerpo '{...}' cerrado (omite declaraciones y cuerpos sin cerrar)."""
+        return self.iter_functions(definitions_only=True)
+
+    def text(self, span):
+        """Devuelve el texto de un span (inicio, fin) o '' si el span no existe."""
+        if span is None:
+            return ''
+        return self.code[span[0]:span[1]]
+
+    def header_comment(self, record):
+        """Texto del comentario de cabecera de un registro."""
+        return header_comment_text(self.code, record['comment_span'])
+
+    def record_search(self, searches, bytes_scanned):
+        """Suma búsquedas regex y bytes recorridos a la etapa en curso (si hay instrumentación)."""
+        if self.stats is not None:
+            self.stats['regex_searches'] += searches
+            self.stats['bytes_scanned'] += bytes_scanned
+
+
+def new_stage_stats():
+    """Contadores de una etapa instrumentada: funciones, búsquedas regex y bytes recorridos."""
+    return {'functions': 0, 'regex_searches': 0, 'bytes_scanned': 0}
+
+
+class LineIndex:
+    """
+    Tabla con el offset de inicio de cada línea, construida una vez por archivo.
+    Convierte offset -> (línea, columna) con búsqueda binaria en O(log n).
+    """
+    def __init__(self, code):
+        starts = [0]
+        newline_index = code.find('\n')
+        while newline_index != -1:
+            starts.append(newline_index + 1)
+            newline_index = code.find('\n', newline_index + 1)
+        self.line_starts = starts
+
+    def __len__(self):
+        return len(self.line_starts)
+
+    def line_of(self, offset):
+        """Número de línea (base 1) que contiene `offset`."""
+        return bisect_right(self.line_starts, offset)
+
+    def position(self, offset):
+        """Tupla (línea, columna) en base 1 para `offset`."""
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def line_start(self, line):
+        """Offset del primer caracter de la línea `line` (base 1)."""
+        return self.line_starts[line - 1]
+
+
+def extract_functions(code, line_index=None, comment_index=None, cancel_event=None, deadline=None, stats=None,
+                      brace_table=None):
+    """Lista completa de registros de iter_extract_functions (mismos argumentos)."""
+    records = list(iter_extract_functions(
+        code, line_index, comment_index, cancel_event, deadline, stats, brace_table
+    ))
+    if stats is not None:
+        stats['functions'] += len(records)
+    return records
+
+
+def iter_extract_functions(code, line_index=None, comment_index=None, cancel_event=None, deadline=None, stats=None,
+                           brace_table=None):
+    """
+    Recorre el archivo una vez y genera un registro por cada firma, a medida que se
+    encuentra (quien solo quiere el primero no paga el resto del archivo).
+
+    Cada registro es un dict con offsets sobre `code`:
+      name, start, line, signature_span, params_span, init_span, brace_index,
+      body_span, is_declaration, comment_span.
+    `body_span` es None para declaraciones (';') y para cuerpos sin cerrar.
+    Si `cancel_event` está activado se lanza AnalysisCancelled antes de la siguiente firma;
+    si se superó `deadline` (time.perf_counter), AnalysisTimedOut.
+    Con `stats` (new_stage_stats) cuenta funciones, búsquedas del patrón y bytes recorridos.
+    """
+    if line_index is None:
+        line_index = LineIndex(code)
+    if comment_index is None:
+        comment_index = CommentIndex(code, line_index)
+    if brace_table is None:
+        brace_table = BraceTable(code)
+    current_pos = 0
+
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled()
+        if deadline is not None and time.perf_counter() > deadline:
+            raise AnalysisTimedOut()
+        match = FUNCTION_SIG_PATTERN.search(code, current_pos)
+        if stats is not None:
+            stats['regex_searches'] += 1
+            stats['bytes_scanned'] += (match.end() if match else len(code)) - current_pos
+        if not match:
+            break
+
+        brace_index = match.end() - 1
+        is_declaration = match.group(4) == ';'
+
+        # 1. Inicio real de la firma (después de newlines/espacios previos)
+        match_start = match.start()
+        if code[match_start] == '\n':
+            match_start += 1
+        real_signature_start = _NON_SPACE.search(code, match_start, brace_index)
+        real_start_index = real_signature_start.start() if real_signature_start else match_start
+
+        # 2. Encabezado de la firma (hasta el inicio de la lista de inicialización, Group 3)
+        header_end_index = match.start(3) if match.group(3) else brace_index
+
+        # La lista de inicialización posesiva incluye los espacios previos a '{': se recortan
+        init_span = None
+        if match.group(3):
+            init_start, init_end = match.span(3)
+            while init_end > init_start and code[init_end - 1].isspace():
+                init_end -= 1
+            init_span = (init_start, init_end)
+
+        body_span = None
+        if is_declaration:
+            current_pos = match.end()
+        else:
+            body_end_index = brace_table.body_end(brace_index)
+            if body_end_index == -1:
+                current_pos = brace_index + 1
+            else:
+                body_span = (brace_index + 1, body_end_index)
+                current_pos = body_end_index + 1
+
+        yield {
+            'name': match.group(1),
+            'start': real_start_index,
+            'line': line_index.line_of(real_start_index),
+            'signature_span': (real_start_index, header_end_index),
+            'params_span': match.span(2),
+            'init_span': init_span,
+            'brace_index': brace_index,
+            'body_span': body_span,
+            'is_declaration': is_declaration,
+            'comment_span': comment_index.preceding(real_start_index),
+        }
+
+
+class BraceTable:
+    """
+    Emparejamiento de llaves de todo el archivo, calculado en una sola pasada sobre la
+    máscara de regiones (Lexer.RegionMask): solo cuentan las llaves en código, las de
+    comentarios y literales se ignoran. El cierre de un cuerpo pasa a ser una consulta O(1).
+    `check_cancelled` (opcional) se llama cada tanto durante la construcción (ver RegionMask).
+    """
+    def __init__(self, code, region_mask=None, check_cancelled=None):
+        self.code = code
+        if region_mask is None:
+            region_mask = RegionMask(code, check_cancelled)
+        mask = region_mask.mask
+        # Offset de cada '{' en código -> offset de su '}' (-1 si no se cierra)
+        self.closes = {}
+        open_braces = []
+        for number, match in enumerate(_BRACE_PATTERN.finditer(code), 1):
+            if check_cancelled is not None and not number % _CANCEL_CHECK_ITEMS:
+                check_cancelled()
+            index = match.start()
+            if mask[index]:
+                continue
+            if match.group() == '{':
+                open_braces.append(index)
+            elif open_braces:
+                self.closes[open_braces.pop()] = index
+
+        for index in open_braces:
+            self.closes[index] = -1
+
+    def body_end(self, brace_index):
+        """
+        Offset de la '}' que cierra la '{' en `brace_index`, o -1 si no se cierra.
+        Una '{' dentro de un comentario o cadena (p. ej. una firma comentada) no está en
+        la tabla: se recorre desde ella con _extract_brace_body, como antes.
+        """
+        close = self.closes.get(brace_index)
+        if close is None:
+            return _extract_brace_body(self.code, brace_index)[1]
+        return close
+
+
+def _extract_brace_body(code_snippet, start_brace_index):
+    """
+    Extrae el cuerpo de la función contando llaves anidadas ({ y }).
+    Recorre caracter por caracter; BraceTable lo usa solo para llaves fuera de código.
+    """
+    balance = 1
+    body_end_index = start_brace_index + 1
+    code_length = len(code_snippet)
+
+    # Iterar desde el caracter después del '{' inicial
+    while body_end_index < code_length:
+        char = code_snippet[body_end_index]
+
+        # --- Manejo de Strings ---
+        if char == '"' or char == "'":
+            end_quote = code_snippet.find(char, body_end_index + 1)
+
+            # Saltar comillas escapadas: '\"' o '\''
+            while end_quote != -1 and code_snippet[end_quote - 1] == '\\':
+                end_quote = code_snippet.find(char, end_quote + 1)
+
+            if end_quote != -1:
+                body_end_index = end_quote + 1
+                continue
+            # String sin cerrar: continuar caracter por caracter
+
+        # --- Manejo de Comentarios C/C++ ---
+        elif char == '/':
+            next_char_index = body_end_index + 1
+            if next_char_index < code_length:
+                next_char = code_snippet[next_char_index]
+
+                if next_char == '/':
+                    # Comentario de una línea (//...)
+                    newline_index = code_snippet.find('\n', next_char_index)
+                    body_end_index = newline_index + 1 if newline_index != -1 else code_length
+                    continue
+
+                elif next_char == '*':
+                    # Comentario de bloque (/*...*/); sin cerrar avanza hasta el final
+                    end_comment_index = code_snippet.find('*/', next_char_index + 1)
+                    body_end_index = end_comment_index + 2 if end_comment_index != -1 else code_length
+                    continue
+
+        # --- Manejo de Comentarios Python/Shell ---
+        elif char == '#':
+            newline_index = code_snippet.find('\n', body_end_index + 1)
+            body_end_index = newline_index + 1 if newline_index != -1 else code_length
+            continue
+
+        # --- Contador de Llaves ---
+        if char == '{':
+            balance += 1
+        elif char == '}':
+            balance -= 1
+            if balance == 0:
+                # Encontró el cierre de la función/método
+                return code_snippet[start_brace_index + 1 : body_end_index], body_end_index
+
+        body_end_index += 1
+
+    return None, -1 # Cuerpo no cerrado encontrado (función malformada)
+
+
+class CommentIndex:
+    """
+    Índice de comentarios construido una vez por archivo: posiciones de '/*' y '*/'
+    y, por cada línea, la racha de líneas de comentario (//, #, *) que termina en ella.
+    "El comentario inmediatamente anterior a un offset" se resuelve con búsqueda binaria.
+    Las rachas se calculan hacia adelante solo hasta la línea consultada, así recorrer
+    las funciones en orden (o solo las primeras) no clasifica líneas de más.
+    `check_cancelled` (opcional) se llama cada tanto mientras se calculan las rachas.
+    """
+    def __init__(self, code, line_index=None, check_cancelled=None):
+        self.code = code
+        self.line_index = line_index if line_index is not None else LineIndex(code)
+        self.check_cancelled = check_cancelled
+        self.block_opens = _find_all(code, '/*')
+        self.block_closes = _find_all(code, '*/')
+
+        # Racha por línea: (inicio de la primera línea de comentario, fin de la última)
+        # desde la última línea de código real. Líneas vacías y 'template<' no cortan la racha.
+        self._run_first = []
+        self._run_last = []
+        self._run_state = (None, None)
+
+    def _extend_runs(self, count):
+        """Calcula las rachas de las primeras `count` líneas (si aún no están)."""
+        run_first = self._run_first
+        run_last = self._run_last
+        if len(run_first) >= count:
+            return
+        code = self.code
+        line_starts = self.line_index.line_starts
+        check_cancelled = self.check_cancelled
+        first, last = self._run_state
+        for number in range(len(run_first), min(count, len(line_starts))):
+            if check_cancelled is not None and number and not number % _CANCEL_CHECK_ITEMS:
+                # Estado consistente con las rachas ya calculadas por si se interrumpe aquí
+                self._run_state = (first, last)
+                check_cancelled()
+            line_start = line_starts[number]
+            line_end = line_starts[number + 1] - 1 if number + 1 < len(line_starts) else len(code)
+            kind = _classify_comment_line(code[line_start:line_end].strip())
+            if kind == 'comment':
+                if first is None:
+                    first = line_start
+                last = line_end
+            elif kind == 'code':
+                first = last = None
+            run_first.append(first)
+            run_last.append(last)
+        self._run_state = (first, last)
+
+    def preceding(self, offset):
+        """
+        Localiza el comentario que precede inmediatamente a `offset`.
+        Devuelve (inicio, fin, 'block' | 'lines') o None si no hay comentario.
+        """
+        code = self.code
+        # Equivalente a code[:offset].rstrip() sin copiar el prefijo
+        end = offset
+        while end > 0 and code[end - 1].isspace():
+            end -= 1
+
+        # 1. Comentario de bloque C-style (/* ... */) justo antes: primer '/*' tras el '*/' anterior
+        if code.endswith('*/', 0, end):
+            close_pos = bisect_right(self.block_closes, end - 4) - 1
+            search_from = self.block_closes[close_pos] + 2 if close_pos >= 0 else 0
+            open_pos = bisect_left(self.block_opens, search_from)
+            if open_pos < len(self.block_opens) and self.block_opens[open_pos] <= end - 4:
+                return (self.block_opens[open_pos], end, 'block')
+
+        # 2. Comentarios de una línea: la línea parcial que termina en `end` y la racha anterior
+        line = self.line_index.line_of(end)
+        line_start = self.line_index.line_start(line)
+        kind = _classify_comment_line(code[line_start:end].strip())
+        if kind == 'code':
+            return None
+
+        first = last = None
+        if kind == 'comment':
+            first, last = line_start, end
+        if line > 1:
+            self._extend_runs(line - 1)
+            previous_first = self._run_first[line - 2]
+            if previous_first is not None:
+                first = previous_first
+                if last is None:
+                    last = self._run_last[line - 2]
+
+        if first is None:
+            return None
+        return (first, last, 'lines')
+
+
+def _find_all(code, token):
+    """Offsets de todas las apariciones de `token` en `code`."""
+    positions = []
+    index = code.find(token)
+    while index != -1:
+        positions.append(index)
+        index = code.find(token, index + 1)
+    return positions
+
+
+def _classify_comment_line(stripped_line):
+    """Clasifica una línea ya recortada: 'comment', 'skip' (vacía o template) o 'code'."""
+    if stripped_line.startswith(_COMMENT_LINE_PREFIXES):
+        return 'comment'
+    if not stripped_line or stripped_line.startswith('template<'):
+        return 'skip'
+    return 'code'
+
+
+def header_comment_text(code, comment_span):
+    """Reconstruye el texto del comentario de cabecera a partir de su span."""
+    if comment_span is None:
+        return NO_HEADER_COMMENT
+    start, end, kind = comment_span
+    if kind == 'block':
+        return code[start:end].strip()
+    lines = [line.strip() for line in code[start:end].split('\n')]
+    return '\n'.join(line for line in lines if line.startswith(_COMMENT_LINE_PREFIXES)).strip()
@@ -0,0 +1,144 @@
+# FileModel.py
+#
+# Modelo de la lista de archivos cargados, independiente de Tkinter. Cada fila del
+# Listbox corresponde a una ruta por índice (sin buscar por nombre) y cada ruta se
+# muestra con el sufijo de carpetas más corto que la distingue de las demás
+# (p. ej. 'core/utils.cpp' y 'gui/utils.cpp').
+
+from collections import defaultdict
+
+
+def _path_parts(path):
+    """Componentes de una ruta, sin importar el separador ('/' o '\\')."""
+    return [part for part in path.replace('\\', '/').split('/') if part]
+
+
+def _suffixes(path):
+    """Sufijos de una ruta de menor a mayor: ['utils.cpp', 'core/utils.cpp', ...]."""
+    parts = _path_parts(path) or [path]
+    return ['/'.join(parts[-depth:]) for depth in range(1, len(parts) + 1)]
+
+
+class FileListModel:
+    """
+    Archivos cargados en orden de fila: ruta -> metadatos ({'size', 'mtime', 'digest'}).
+    Se usa como un dict (in, len, iteración en orden de fila, [ruta]) y además traduce
+    filas a rutas en O(1).
+
+    La etiqueta de cada ruta es su sufijo más corto que ninguna otra ruta comparte. Por
+    cada sufijo se guardan las rutas que lo tienen, así agregar o quitar una ruta solo
+    revisa sus propios sufijos (O(profundidad)) y las pocas rutas que llevaban como
+    etiqueta uno de ellos, en lugar de recalcular a todos los homónimos.
+    """
+    def __init__(self):
+        self._paths = []                          # fila -> ruta
+        self._rows = {}                           # ruta -> fila
+        self._metadata = {}                       # ruta -> metadatos
+        self._suffixes = {}                       # ruta -> sus sufijos (de menor a mayor)
+        self._suffix_paths = defaultdict(set)     # sufijo -> rutas que terminan en él
+        self._labels = {}                         # ruta -> etiqueta visible
+        self._label_paths = defaultdict(set)      # etiqueta -> rutas que la muestran
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __iter__(self):
+        return iter(list(self._paths))
+
+    def __contains__(self, path):
+        return path in self._metadata
+
+    def __getitem__(self, path):
+        return self._metadata[path]
+
+    def __setitem__(self, path, metadata):
+        """Actualiza los metadatos de una ruta; si es nueva, la agrega al final."""
+        if path in self._metadata:
+            self._metadata[path] = metadata
+        else:
+            self.add(path, metadata)
+
+    def path_at(self, row):
+        """Ruta de una fila del Listbox."""
+        return self._paths[row]
+
+    def row_of(self, path):
+        """Fila del Listbox de una ruta."""
+        return self._rows[path]
+
+    def label(self, path):
+        """Etiqueta visible (ruta relativa mínima sin ambigüedad) de una ruta."""
+        return self._labels[path]
+
+    def labels(self):
+        """Etiquetas de todas las filas, en orden."""
+        return [self._labels[path] for path in self._paths]
+
+    def add(self, path, metadata):
+        """
+        Agrega una ruta al final. Devuelve las filas de OTRAS rutas cuya etiqueta cambió
+        (al aparecer un homónimo hay que mostrar más carpetas).
+        """
+        self._rows[path] = len(self._paths)
+        self._paths.append(path)
+        self._metadata[path] = metadata
+        suffixes = self._suffixes[path] = _suffixes(path)
+
+        # Quien mostraba uno de estos sufijos deja de ser único con esa etiqueta
+        affected = set()
+        for suffix in suffixes:
+            self._suffix_paths[suffix].add(path)
+            affected.update(self._label_paths.get(suffix, ()))
+        changed = [other for other in affected if self._update_label(other)]
+        self._update_label(path)
+        return [self._rows[other] for other in changed]
+
+    def remove_rows(self, rows):
+        """
+        Elimina las filas indicadas y devuelve sus rutas. Las filas restantes se renumeran
+        en una sola pasada; solo se re-etiquetan las rutas que compartían sufijos con las
+        eliminadas y ahora pueden mostrarse más cortas.
+        """
+        removed = [self._paths[row] for row in sorted(set(rows))]
+        removed_set = set(removed)
+        affected = set()
+        for path in removed:
+            del self._metadata[path]
+            self._set_label(path, None)
+            for suffix in self._suffixes.pop(path):
+                owners = self._suffix_paths[suffix]
+                owners.discard(path)
+                if len(owners) == 1:
+                    affected.update(owners)
+                elif not owners:
+                    del self._suffix_paths[suffix]
+        self._paths = [path for path in self._paths if path not in removed_set]
+        self._rows = {path: row for row, path in enumerate(self._paths)}
+        for path in affected - removed_set:
+            self._update_label(path)
+        return removed
+
+    def _update_label(self, path):
+        """Recalcula la etiqueta de una ruta; devuelve True si cambió."""
+        suffixes = self._suffixes[path]
+        label = suffixes[-1]
+        for suffix in suffixes:
+            if len(self._suffix_paths[suffix]) == 1:
+                label = suffix
+                break
+        if self._labels.get(path) == label:
+            return False
+        self._set_label(path, label)
+        return True
+
+    def _set_label(self, path, label):
+        """Cambia la etiqueta de una ruta (None la quita) manteniendo el índice inverso."""
+        previous = self._labels.pop(path, None)
+        if previous is not None:
+            owners = self._label_paths[previous]
+            owners.discard(path)
+            if not owners:
+                del self._label_paths[previous]
+        if label is not None:
+            self._labels[path] = label
+            self._label_paths[label].add(path)
@@ -0,0 +1,122 @@
+# Lexer.py
+#
+# Escáner léxico de una sola pasada para C/C++ (y Python/shell en lo básico):
+# distingue comentarios, literales de cadena/caracter e identificadores sin crear
+# copias intermedias del texto. Lo comparten las revisiones que necesitan los
+# identificadores "reales" de un fragmento de código.
+
+import re
+from bisect import bisect_left, bisect_right
+
+
+# Reglas léxicas (las mismas para todo el proyecto):
+#   comment  -> '//...', '#...' (hasta fin de línea) o '/* ... */'; un '/*' sin
+#               cerrar llega hasta el final del texto (una sola búsqueda, no una por '/*')
+#   string   -> "..." o '...' con escapes (pueden abarcar varias líneas)
+#   ident    -> racha \w (identificadores, números y palabras clave)
+# Lo demás (operadores, espacios o comillas sin cerrar) es código.
+_COMMENT_RULE = r'//[^\n]*|#[^\n]*|/\*.*?(?:\*/|\Z)'
+_STRING_RULE = r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''
+
+# Un solo patrón con alternativas; finditer recorre el texto de izquierda a derecha y
+# la primera alternativa que empieza en cada posición gana (igual que un compilador).
+LEXEME_PATTERN = re.compile(
+    r'(?P<comment>' + _COMMENT_RULE + r')|(?P<string>' + _STRING_RULE + r')|(?P<ident>\w+)',
+    re.DOTALL
+)
+
+# Solo comentarios y literales: salta el código sin emitir un match por identificador
+REGION_PATTERN = re.compile(r'(?P<comment>' + _COMMENT_RULE + r')|(?P<string>' + _STRING_RULE + r')', re.DOTALL)
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Cada cuántos comentarios/literales se llama a `check_cancelled` al armar la máscara
+_CANCEL_CHECK_MATCHES = 4096
+
+# Clases de la máscara de regiones
+CODE = 0
+COMMENT = 1
+STRING = 2
+
+
+def iter_lexemes(code, start=0, end=None):
+    """
+    Genera (tipo, inicio, fin) para cada comentario, literal e identificador de
+    code[start:end], con tipo 'comment', 'string' o 'ident'. Los offsets son sobre `code`.
+    """
+    if end is None:
+        end = len(code)
+    for match in LEXEME_PATTERN.finditer(code, start, end):
+        yield match.lastgroup, match.start(), match.end()
+
+
+def iter_identifiers(code, start=0, end=None):
+    """Genera los identificadores de code[start:end] fuera de comentarios y literales."""
+    if end is None:
+        end = len(code)
+    for match in LEXEME_PATTERN.finditer(code, start, end):
+        identifier = match.group('ident')
+        if identifier is not None:
+            yield identifier
+
+
+def identifier_set(code, start=0, end=None):
+    """Conjunto de identificadores de code[start:end] (ver iter_identifiers)."""
+    return set(iter_identifiers(code, start, end))
+
+
+class RegionMask:
+    """
+    Clasificación de cada offset del archivo en CODE, COMMENT o STRING, calculada una
+    sola vez con las reglas de arriba. `mask` es un bytearray (un byte por caracter) para
+    consultas puntuales y `spans` la lista ordenada de (inicio, fin, clase) de comentarios
+    y literales para recorrer regiones sin mirar el código.
+    `check_cancelled` (opcional) se llama cada tanto durante la construcción y puede
+    interrumpirla con una excepción (cancelación o plazo vencido).
+    """
+    def __init__(self, code, check_cancelled=None):
+        self.code = code
+        mask = bytearray(len(code))
+        spans = []
+        fill = {COMMENT: b'\x01', STRING: b'\x02'}
+        for number, match in enumerate(REGION_PATTERN.finditer(code), 1):
+            if check_cancelled is not None and not number % _CANCEL_CHECK_MATCHES:
+                check_cancelled()
+            kind = COMMENT if match.lastgroup == 'comment' else STRING
+            start, end = match.span()
+            mask[start:end] = fill[kind] * (end - start)
+            spans.append((start, end, kind))
+        self.mask = mask
+        self.spans = spans
+        self._span_starts = [span[0] for span in spans]
+
+    def kind_at(self, offset):
+        """Clase (CODE, COMMENT o STRING) del caracter en `offset`."""
+        return self.mask[offset]
+
+    def is_code(self, offset):
+        return self.mask[offset] == CODE
+
+    def iter_spans(self, kind, start=0, end=None):
+        """Genera (inicio, fin) de las regiones de clase `kind` que se solapan con [start, end)."""
+        if end is None:
+            end = len(self.code)
+        first = max(bisect_right(self._span_starts, start) - 1, 0)
+        last = bisect_left(self._span_starts, end)
+        for span_start, span_end, span_kind in self.spans[first:last]:
+            if span_kind == kind and span_end > start:
+                yield span_start, span_end
+
+    def identifiers(self, start=0, end=None):
+        """
+        Conjunto de identificadores en código de code[start:end]. Equivale a
+        identifier_set sobre el mismo rango cuando el rango empieza fuera de un
+        comentario o literal (p. ej. el cuerpo de una función).
+        """
+        if end is None:
+            end = len(self.code)
+        mask = self.mask
+        return {
+            match.group() for match in _WORD_PATTERN.finditer(self.code, start, end)
+            if not mask[match.start()]
+        }
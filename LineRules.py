@@ -0,0 +1,152 @@
+# LineRules.py
+#
+# Motor de reglas por línea: las revisiones orientadas a líneas (longitud, marcadores
+# TODO, ...) se registran aquí y se evalúan juntas en la primera consulta del archivo.
+#
+# Qué se comparte y qué no (decisión deliberada):
+#   - las reglas con predicado comparten un único recorrido de las líneas en Python;
+#   - las reglas con patrón comparten la máscara de regiones (se arma una vez por
+#     archivo) y el recorrido de los spans de su región, pero cada una corre su
+#     propio finditer: k reglas con patrón sobre el archivo entero son k pasadas del
+#     motor de regex (en C). Una alternativa combinada 'a|b' haría una sola pasada,
+#     pero el match de una regla consume el texto que otra necesitaba y sus resultados
+#     dependerían de qué reglas estén activas.
+
+import re
+from functools import lru_cache
+
+from Lexer import CODE
+
+
+# Registro de reglas: nombre -> dict con
+#   'pattern'   -> regex de una sola línea (no debe cruzar '\n') o None
+#   'flags'     -> flags del regex (p. ej. re.IGNORECASE | re.DOTALL)
+#   'predicate' -> función(línea) que devuelve un detalle (verdadero) o None, o None
+#   'region'    -> clase de Lexer (COMMENT, STRING, CODE) a la que se limita la búsqueda, o None
+LINE_RULES = {}
+
+# Cada cuántas líneas (o resultados) y cada cuántos spans se comprueba la cancelación / el plazo
+_CANCEL_CHECK_LINES = 4096
+_CANCEL_CHECK_SPANS = 256
+
+
+def register_line_rule(name, pattern=None, predicate=None, region=None, flags=0):
+    """
+    Registra una regla por línea. Una regla define `pattern` (con sus `flags`, cualquiera
+    de las de `re`) o `predicate`. Cada regla se evalúa por separado: sus resultados no
+    dependen de qué otras reglas estén activas. Las de predicado comparten una pasada
+    por las líneas; cada regla con patrón agrega una pasada del regex sobre su región
+    (ver la cabecera del módulo).
+    """
+    if (pattern is None) == (predicate is None):
+        raise ValueError(f"la regla '{name}' debe definir pattern o predicate (solo uno)")
+    LINE_RULES[name] = {
+        'name': name,
+        'pattern': pattern,
+        'flags': flags,
+        'predicate': predicate,
+        'region': region,
+    }
+
+
+@lru_cache(maxsize=None)
+def _engine_for(rule_names):
+    """Motor compilado para una tupla ordenada de nombres de regla (se compila una vez)."""
+    return LineRuleEngine(rule_names)
+
+
+class LineRuleEngine:
+    """
+    Evalúa un conjunto de reglas sobre un archivo:
+      - las reglas con patrón se agrupan por región y comparten el recorrido de sus
+        spans (el archivo entero, o solo sus comentarios, literales o código); en cada
+        span cada regla corre su propio finditer (una pasada del regex por regla), así
+        el match de una regla nunca consume el texto que otra necesitaba;
+      - las reglas con predicado comparten un único recorrido de las líneas.
+    Los contadores de instrumentación reflejan eso: una búsqueda y los bytes del span
+    por cada finditer, más el archivo entero si hay predicados.
+    """
+    def __init__(self, rule_names):
+        rules = [LINE_RULES[name] for name in rule_names]
+        self.rule_names = tuple(rule_names)
+        self.predicates = [(rule['name'], rule['predicate']) for rule in rules if rule['predicate'] is not None]
+        # Región -> [(nombre, regex compilada con sus propias flags)]
+        self.patterns = {}
+        for rule in rules:
+            if rule['pattern'] is not None:
+                self.patterns.setdefault(rule['region'], []).append(
+                    (rule['name'], re.compile(rule['pattern'], rule['flags']))
+                )
+
+    def run(self, source):
+        """
+        Devuelve {nombre de regla: [(línea, detalle), ...]} ordenado por línea. Las reglas
+        con patrón reportan cada línea una sola vez (detalle = primer texto encontrado);
+        con `region`, solo cuentan los matches que empiezan y terminan dentro de esa
+        región. '$' se ancla siempre al fin real de la línea, no al fin del span.
+        """
+        hits = {name: [] for name in self.rule_names}
+        code = source.code
+        searches = 0
+        scanned = 0
+
+        for region, patterns in self.patterns.items():
+            if region is None:
+                spans = ((0, len(code)),)
+            elif region == CODE:
+                spans = _code_spans(source.region_mask)
+            else:
+                spans = source.region_mask.iter_spans(region)
+            last_line = {}
+            for number, (span_start, span_end) in enumerate(spans):
+                if not number % _CANCEL_CHECK_SPANS:
+                    source.check_cancelled()
+                # El regex ve el resto de la línea donde termina el span (para '$')
+                line_end = code.find('\n', span_end)
+                search_end = len(code) if line_end == -1 else line_end
+                for name, pattern in patterns:
+                    searches += 1
+                    scanned += search_end - span_start
+                    found = hits[name]
+                    for match in pattern.finditer(code, span_start, search_end):
+                        if match.start() >= span_end:
+                            break
+                        if match.end() > span_end:
+                            continue
+                        line = source.line_of(match.start())
+                        if last_line.get(name) == line:
+                            continue
+                        last_line[name] = line
+                        found.append((line, match.group()))
+                        if not len(found) % _CANCEL_CHECK_LINES:
+                            source.check_cancelled()
+
+        if self.predicates:
+            predicates = self.predicates
+            scanned += len(code)
+            for num_line, line in enumerate(code.split('\n'), 1):
+                if not num_line % _CANCEL_CHECK_LINES:
+                    source.check_cancelled()
+                for name, predicate in predicates:
+                    detail = predicate(line)
+                    if detail is not None:
+                        hits[name].append((num_line, detail))
+
+        source.record_search(searches, scanned)
+        return hits
+
+
+def _code_spans(region_mask):
+    """Genera (inicio, fin) de los tramos de código entre comentarios y literales."""
+    position = 0
+    for span_start, span_end, _ in region_mask.spans:
+        if span_start > position:
+            yield position, span_start
+        position = span_end
+    if position < len(region_mask.code):
+        yield position, len(region_mask.code)
+
+
+def evaluate_line_rules(source, rule_names):
+    """Evalúa las reglas `rule_names` sobre un SourceFile con el motor compilado correspondiente."""
+    return _engine_for(tuple(sorted(rule_names))).run(source)
@@ -1,212 +1,212 @@
 # Monitoring.py
 
-import re
 import os
 
+from Extractor import SourceFile, header_comment_text
 
-def monitor_methods(code, filename):
+
+METHOD_SEPARATOR = "=================================================================="
+
+# Extensiones sin métodos que extraer
+MONITOR_SKIPPED_EXTENSIONS = ('.html', '.css', '.md')
+
+
+class MethodRecord:
+    """
+    Fila compacta de un método: nombre, líneas, tamaño y los spans (inicio, fin) de sus
+    partes sobre el código original. No guarda texto: los spans son los mismos objetos
+    del registro de Extractor y el texto se corta solo al mostrarlo o exportarlo
+    (method_detail_lines, MethodRecord.text). Con __slots__ ocupa una fracción de un dict.
+    """
+    __slots__ = (
+        'name', 'line', 'end_line', 'size',
+        'comment_span', 'signature_span', 'params_span', 'init_span', 'body_span',
+    )
+
+    def __init__(self, name, line, end_line, size, comment_span, signature_span, params_span, init_span,
+                 body_span):
+        self.name = name
+        self.line = line
+        self.end_line = end_line
+        self.size = size
+        self.comment_span = comment_span
+        self.signature_span = signature_span
+        self.params_span = params_span
+        self.init_span = init_span
+        self.body_span = body_span
+
+    def __repr__(self):
+        return f"MethodRecord({self.name!r}, línea {self.line}-{self.end_line})"
+
+    def text(self, code, part):
+        """Texto de una parte ('signature', 'params', 'init' o 'body'); '' si no existe."""
+        span = getattr(self, f"{part}_span")
+        return code[span[0]:span[1]] if span is not None else ''
+
+    def to_json(self):
+        """Dict serializable en JSON (solo offsets; los spans quedan como listas)."""
+        return {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in ((name, getattr(self, name)) for name in self.__slots__)
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        """Inverso de to_json."""
+        values = {
+            name: tuple(value) if isinstance(value, list) else value
+            for name, value in data.items()
+        }
+        return cls(**values)
+
+
+def iter_methods(code, filename='', source=None):
+    """
+    Genera un MethodRecord por método con cuerpo a medida que se encuentra, sin copiar
+    ningún texto. El detalle de cada método se arma aparte y bajo demanda con
+    method_detail_lines.
+    """
+    if source is None:
+        source = SourceFile(code, filename)
+    for record in source.definitions():
+        body_end = record['body_span'][1]
+        yield MethodRecord(
+            record['name'], record['line'], source.line_of(body_end), body_end - record['start'],
+            record['comment_span'], record['signature_span'], record['params_span'], record['init_span'],
+            record['body_span'],
+        )
+
+
+def method_rows(source):
+    """
+    Todos los MethodRecord de iter_methods de un SourceFile. Es lo que viaja a la
+    interfaz; el detalle de cada método se arma después (p. ej. al expandir su fila).
+    """
+    return list(iter_methods(source.code, source.filename, source))
+
+
+def method_detail_lines(row, code):
+    """Líneas del bloque de monitoreo de un método (ver monitor_methods) a partir de su MethodRecord."""
+    init_list = row.text(code, 'init')
+    return [
+        f"\n{METHOD_SEPARATOR}",
+        f"🔹 MÉTODO IDENTIFICADO: {row.name} (Línea {row.line})",
+        METHOD_SEPARATOR,
+        f"💬 COMENTARIO DE CABECERA:",
+        header_comment_text(code, row.comment_span),
+        f"\n📝 FIRMA (Solo cabecera):",
+        row.text(code, 'signature').strip(),  # SOLO LA CABECERA (sin lista de inicialización)
+        # MOSTRAR PARÁMETROS y LISTA DE INICIALIZACIÓN (separados para claridad)
+        f"\n⚙️ PARÁMETROS:",
+        f"({row.text(code, 'params').strip()})",
+        f"\n⚙️ LISTA DE INICIALIZACIÓN (C++):",
+        init_list.strip() if init_list else 'N/A',  # Lista de inicialización (multilínea)
+        f"\n💻 CONTENIDO DEL CUERPO (Solo lo que está dentro de {{}}):",
+        row.text(code, 'body').strip(),
+    ]
+
+
+def monitor_methods(code, filename, source=None, rows=None):
     """
     Identifica y extrae métodos/funciones de C++ (y similares) con su contenido
-    y su comentario de cabecera. Utiliza búsqueda secuencial para evitar anidamiento.
+    y su comentario de cabecera. Consume los registros compartidos de Extractor,
+    así el archivo se recorre una sola vez aunque haya varias revisiones activas.
+    Devuelve el texto completo (para la CLI); la interfaz usa method_rows.
+    Con `rows` (MethodRecord ya calculados) solo se formatea, sin recorrer otra vez las funciones.
     """
-    results = []
-    
-    if filename.lower().endswith(('.html', '.css', '.md')):
+    if filename.lower().endswith(MONITOR_SKIPPED_EXTENSIONS):
         return "Extracción de Métodos", [f"ℹ️ OMITIDO. No aplica para archivos {os.path.splitext(filename)[1].upper()}."], 0
-    # Palabras clave de control de flujo C/C++ a excluir de ser nombres de función
-    EXCLUDED_KEYWORDS = r'(?:if|for|while|switch|catch|do|try|new|delete|sizeof|return|NULL|class|struct|enum|using)\b'
-    # PATRÓN V15: Usamos el mismo patrón que en check_unused_parameters para ser consistentes
-    FUNCTION_SIG_PATTERN = re.compile(
-        # Start of string OR after a newline, followed by optional whitespace
-        r'(?:^|\n)\s*'
-        # Tipo de retorno o scope (opcional, flexible con espacios/saltos de línea)
-        r'(?:[a-zA-Z_][a-zA-Z0-9_:\s*&<>]+\s+)?' 
-        r'(?!' + EXCLUDED_KEYWORDS + r')'
-        r'([a-zA-Z_][a-zA-Z0-9_:]*|operator\s*(?:==|!=|<=|>=|<|>|\+\+|--|\+|-|\*|/|%|=|\[\]|<<|>>|&|\||\^|~|\(\)))'  # Group 1 (Name or Operator)
-        r'\s*\((.*?)\)'              # Group 2 (Parameters)
-        r'(?:\s*const)?'             # Modificador const (opcional)
-        r'(\s*:[\s\S]*?)?'           # Group 3: Lista de inicialización (Constructor), opcional
-        r'\s*\{'                     # Coincide con la llave de apertura
-        , re.DOTALL 
-    )
-    current_pos = 0 
-    
-    while True:
-        match = FUNCTION_SIG_PATTERN.search(code, current_pos)
-        if not match:
-            break 
-        param_string = match.group(2) 
-        init_list = match.group(3) # Lista de inicialización
-        start_brace_index = match.end() - 1 
-        
-        func_body, body_end_index = _extract_brace_body(code, start_brace_index)
-        if func_body is None or body_end_index == -1:
-            current_pos = start_brace_index + 1
-            continue
-        full_name = match.group(1) 
-        
-        # 1. Definir el inicio real del código (después de newlines/whitespaces que vienen antes)
-        match_start = match.start()
-        if code[match_start] == '\n':
-            match_start += 1
-            
-        real_signature_start = re.search(r'\S', code[match_start:start_brace_index])
-        real_start_index = match_start + real_signature_start.start() if real_signature_start else match_start
-        
-        # 2. Extraer el encabezado de la función (hasta el inicio de la lista de inicialización Group 3)
-        # Esto corrige el problema de la firma multi-línea con la lista de inicialización.
-        header_end_index = match.start(3) if match.group(3) else start_brace_index
-        signature_header = code[real_start_index:header_end_index].strip()
-        
-        # 3. Extraer el comentario de cabecera 
-        header_comment = _get_header_comment(code, real_start_index)
-        
-        clean_body = func_body.strip()
-        init_list_text = init_list.strip() if init_list else 'N/A'
-        
-        results.append({
-            'name': full_name, 
-            'comment': header_comment,
-            'signature_header': signature_header, # AHORA SOLO LA CABECERA (sin lista de inicialización)
-            'parameters': param_string.strip(), 
-            'init_list': init_list_text,        # Lista de inicialización (multilínea)
-            'content': clean_body 
-        })
-        
-        current_pos = body_end_index + 1
-        
-    # Formatear la salida para el área de monitoreo
-    output_lines = [f"--- MONITOREO DE MÉTODOS: {filename} ({len(results)} encontrados) ---"]
-    if results:
-        for r in results:
-            output_lines.append(f"\n==================================================================")
-            output_lines.append(f"🔹 MÉTODO IDENTIFICADO: {r['name']}")
-            output_lines.append(f"==================================================================")
-            
-            output_lines.append(f"💬 COMENTARIO DE CABECERA:")
-            output_lines.append(r['comment'])
-            
-            output_lines.append(f"\n📝 FIRMA (Solo cabecera):")
-            output_lines.append(r['signature_header']) # Muestra solo la parte de la función
-            
-            # MOSTRAR PARÁMETROS y LISTA DE INICIALIZACIÓN (separados para claridad)
-            output_lines.append(f"\n⚙️ PARÁMETROS:") 
-            output_lines.append(f"({r['parameters']})") 
-            
-            output_lines.append(f"\n⚙️ LISTA DE INICIALIZACIÓN (C++):") 
-            output_lines.append(r['init_list']) # Muestra la lista completa, incluyendo saltos de línea
-            output_lines.append(f"\n💻 CONTENIDO DEL CUERPO (Solo lo que está dentro de {{}}):")
-            output_lines.append(r['content'])
-    else:
+
+    if source is None:
+        source = SourceFile(code, filename)
+
+    # Formatear la salida para el área de monitoreo (el encabezado lleva el total: va al final)
+    output_lines = [None]
+    count = 0
+    for row in (rows if rows is not None else iter_methods(code, filename, source)):
+        output_lines.extend(method_detail_lines(row, code))
+        source.record_search(0, row.size)
+        count += 1
+    output_lines[0] = f"--- MONITOREO DE MÉTODOS: {filename} ({count} encontrados) ---"
+    if not count:
         output_lines.append("No se encontraron métodos que cumplan el patrón de extracción.")
-    return "Extracción de Métodos", output_lines, len(results)
+    return "Extracción de Métodos", output_lines, count
 
 
+# =========================================================================
+# === Inicio de Métodos de Clase (003.py) ===
+# =========================================================================
 
-def _extract_brace_body(code_snippet, start_brace_index):
+def iter_method_starts(code, filename='', cancel_event=None):
     """
-    Extrae el cuerpo de la función contando llaves anidadas ({ y }).
+    Genera, a medida que se encuentran, los métodos de clase (con alcance '::') y los
+    operadores sobrecargados con cuerpo: {'name', 'line_start', 'signature_span', 'closed'}.
+    `line_start` es la línea de la llave '{'; `closed` es False si su cuerpo no se cierra.
+    No toca la interfaz ni copia la firma: el texto se arma al reportar.
     """
-    balance = 1
-    body_end_index = start_brace_index + 1
-    code_length = len(code_snippet)
-    
-    # Iterar desde el caracter después del '{' inicial
-    while body_end_index < code_length:
-        char = code_snippet[body_end_index]
-        
-        # --- Manejo de Strings ---
-        # Simplificación: Asumir que la lógica de quote escapado es correcta para avanzar el índice
-        if char == '"' or char == "'":
-            # start_quote = body_end_index # Not used, can be removed
-            end_quote = code_snippet.find(char, body_end_index + 1)
-            
-            # Simple loop to skip escaped quotes: '\"' or '\''
-            while end_quote != -1 and code_snippet[end_quote - 1] == '\\':
-                end_quote = code_snippet.find(char, end_quote + 1)
-
-            if end_quote != -1:
-                body_end_index = end_quote + 1
-                continue
-            # If end_quote not found, assume unclosed string and continue char by char
-            
-        # --- Manejo de Comentarios C/C++ ---
-        elif char == '/':
-            next_char_index = body_end_index + 1
-            if next_char_index < code_length:
-                next_char = code_snippet[next_char_index]
-                
-                if next_char == '/':
-                    # Comentario de una línea (//...)
-                    newline_index = code_snippet.find('\n', next_char_index)
-                    if newline_index != -1:
-                        body_end_index = newline_index + 1
-                    else:
-                        # Fin del archivo
-                        body_end_index = code_length 
-                    continue
-                    
-                elif next_char == '*':
-                    # Comentario de bloque (/*...*/)
-                    end_comment_index = code_snippet.find('*/', next_char_index + 1)
-                    if end_comment_index != -1:
-                        body_end_index = end_comment_index + 2
-                    else:
-                        # Comentario de bloque sin cerrar, avanzar hasta el final para evitar bucle infinito
-                        body_end_index = code_length 
-                    continue
-            
-        # --- Manejo de Comentarios Python/Shell ---
-        elif char == '#':
-            newline_index = code_snippet.find('\n', body_end_index + 1)
-            if newline_index != -1:
-                body_end_index = newline_index + 1
-            else:
-                body_end_index = code_length
+    # Registros compartidos de Extractor (una sola pasada por archivo)
+    source = SourceFile(code, filename, cancel_event)
+    for record in source.iter_functions():
+        if record['is_declaration']:
+            continue
+        full_name = record['name'].strip()
+        if '::' not in full_name and not full_name.startswith('operator'):
             continue
-        
-        # --- Contador de Llaves ---
-        if char == '{':
-            balance += 1
-        elif char == '}':
-            balance -= 1
-            if balance == 0:
-                # Encontró el cierre de la función/método
-                return code_snippet[start_brace_index + 1 : body_end_index], body_end_index
-        
-        body_end_index += 1
-        
-    return None, -1 # Cuerpo no cerrado encontrado (función malformada)
-
-
-
-def _get_header_comment(code_snippet, func_start_index):
+        brace_index = record['brace_index']
+        yield {
+            'name': full_name,
+            'line_start': source.line_of(brace_index),
+            'signature_span': (record['start'], brace_index),
+            'closed': record['body_span'] is not None,
+        }
+
+
+def find_method_starts(code, filename, cancel_event=None):
     """
-    Extrae el comentario que precede inmediatamente a la firma de la función.
+    Busca firmas de método de clase y la línea de inicio de su llave '{'.
+    Devuelve (resultados, nombres con cuerpo sin cerrar); ver iter_method_starts.
     """
-    preceding_code = code_snippet[:func_start_index].rstrip()
-    
-    # 1. Patrón para comentario de bloque C-style (/* ... */) al final
-    block_comment_match = re.search(r'/\*[\s\S]*?\*/\s*$', preceding_code, re.DOTALL)
-    if block_comment_match:
-        return block_comment_match.group(0).strip()
-
-    # 2. Patrón para comentarios de una línea (//) o inicio de bloque (doc-strings Py/JS)
-    line_comments = []
-    lines = preceding_code.split('\n')
-    
-    # Revisar las últimas líneas
-    for line in reversed(lines):
-        stripped_line = line.strip()
-        # Buscar líneas de comentario C++/JS (//) o líneas de documentación de Python/JS (#)
-        if stripped_line.startswith('//') or stripped_line.startswith('*') or stripped_line.startswith('#'):
-            line_comments.append(stripped_line)
-        elif stripped_line and not stripped_line.startswith(('template<', '#')):
-            # Si encontramos código real (y no es una directiva o template), paramos
-            break
-            
-    if line_comments:
-        line_comments.reverse() # Poner en orden correcto
-        return '\n'.join(line_comments).strip()
-
-    return "No se encontró comentario de cabecera."
+    results = []
+    unclosed = []
+    for method in iter_method_starts(code, filename, cancel_event):
+        if not method['closed']:
+            unclosed.append(method['name'])
+            continue
+        start, end = method['signature_span']
+        results.append({
+            'name': method['name'],
+            'signature': code[start:end].strip(),
+            'line_start': method['line_start'],
+        })
+    return results, unclosed
+
+
+def method_start_lines(results, unclosed, filename):
+    """
+    Reporte de find_method_starts como [(línea, color)]; el color es también el nombre
+    del tag con que 003.py la muestra. Sin Tkinter: sirve igual para un script o la CLI.
+    """
+    lines = [
+        (METHOD_SEPARATOR, "black"),
+        (f"🔎 INICIANDO BÚSQUEDA DE MÉTODOS EN: {filename}", "blue"),
+        (f"{METHOD_SEPARATOR}\n", "black"),
+    ]
+    for full_name in unclosed:
+        lines.append((f"   ⚠️ ERROR: Cuerpo no cerrado para '{full_name}'. Saltando.", "red"))
+
+    # --- REPORTE DE RESULTADOS ---
+    lines.append((f"\n{METHOD_SEPARATOR}", "black"))
+    lines.append((f"🎉 ANÁLISIS COMPLETADO. {len(results)} métodos de clase identificados.", "blue"))
+    lines.append((METHOD_SEPARATOR, "black"))
+
+    if results:
+        lines.append(("\n| Línea | Método de Clase/Operador |", "black"))
+        lines.append(("|-------|--------------------------|", "black"))
+        for r in results:
+            display_signature = r['signature'].replace(r['name'], f"**{r['name']}**")
+            lines.append((f"| {r['line_start']:<5} | {display_signature} {{...}}", "green"))
+    else:
+        lines.append(("No se encontraron métodos de clase con notación de alcance (::) o sobrecarga de operador.", "red"))
+
+    lines.append(("\n--- FIN DEL REPORTE ---", "black"))
+    return lines
@@ -0,0 +1,501 @@
+# Pipeline.py
+#
+# Pipeline de análisis por archivo: carga → parseo → revisiones → monitoreo → render.
+# Cada etapa se ejecuta exactamente una vez por archivo. Sin dependencias de Tkinter.
+
+import fnmatch
+import hashlib
+import mmap
+import os
+import time
+
+from Extractor import AnalysisCancelled, AnalysisTimedOut, SourceFile, new_stage_stats
+from Monitoring import MONITOR_SKIPPED_EXTENSIONS, method_rows, monitor_methods
+from ResultCache import content_hash
+import ReviewChecks
+
+
+# Registro de revisiones en orden de ejecución:
+# (clave, función, encabezado de violación, mensaje OK, prefijar cada violación con '>')
+REVIEW_CHECKS = [
+    ('line_length', ReviewChecks.check_line_length,
+     "❌ VIOLACIÓN: Límite de 120 Caracteres ({count} líneas)",
+     "✅ Límite de 120 Caracteres: OK", True),
+    ('todos', ReviewChecks.check_for_todos,
+     "⚠️ PENDIENTE: Comentarios Pendientes (TODOs/FIXMEs) ({count} encontrados)",
+     "✅ Comentarios Pendientes: OK", True),
+    ('unused_params', ReviewChecks.check_unused_parameters,
+     "❌ VIOLACIÓN CRÍTICA: Parámetros No Utilizados ({count} funciones afectadas)",
+     "✅ Parámetros No Utilizados: OK", False),
+    ('header_params', ReviewChecks.check_header_params_documentation,
+     "❌ VIOLACIÓN: Consistencia de Documentación de Parámetros ({count} problemas)",
+     "✅ Parámetros Documentados: OK", False),
+]
+
+CHECK_KEYS = [entry[0] for entry in REVIEW_CHECKS]
+
+# Checks que consumen los registros de función de Extractor
+FUNCTION_CHECKS = {'unused_params', 'header_params'}
+
+# Checks basados en reglas por línea (LineRules), evaluadas juntas en una sola etapa
+LINE_CHECKS = {'line_length', 'todos'}
+
+# Versión de cada resultado guardado en la caché; subirla invalida las entradas anteriores.
+CACHE_VERSIONS = {
+    'line_length': 1,
+    'todos': 3,
+    'unused_params': 5,
+    'header_params': 5,
+    'functions': 5,
+}
+
+# Presupuesto de tiempo (segundos) por etapa y archivo; None lo desactiva.
+# Una etapa que lo supera se reporta como "tiempo agotado" en lugar de bloquear la revisión.
+DEFAULT_TIME_BUDGET = 10.0
+
+# Tamaño (bytes) a partir del cual un archivo se lee con mmap en lugar de read()
+MMAP_THRESHOLD = 1024 * 1024
+
+# Filtros por defecto al cargar una carpeta (globs separados por ';'; 'carpeta/' excluye
+# la carpeta completa) y número de hilos de lectura
+DEFAULT_INCLUDE = "*.h;*.cpp;*.hpp;*.cc;*.c;*.py;*.js;*.ts;*.jsx;*.tsx"
+DEFAULT_EXCLUDE = "build/;third_party/;.git/"
+READ_WORKERS = 8
+
+SEPARATOR = "=================================================================="
+
+
+# =========================================================================
+# === Etapas del Pipeline ===
+# =========================================================================
+
+def analyze_file(filepath, content, enabled_checks, monitor=True, cancel_event=None, cache=None,
+                 time_budget=DEFAULT_TIME_BUDGET, instrument=False, monitor_text=True):
+    """
+    Ejecuta parseo, revisiones y monitoreo de un archivo ya cargado.
+    Devuelve un dict con los resultados listos para renderizar.
+    Lanza AnalysisCancelled entre funciones si `cancel_event` se activa.
+    Con `cache` (ResultCache), las violaciones de cada check y los registros de
+    función de un contenido ya analizado se reutilizan en lugar de recalcularse.
+    Cada etapa dispone de `time_budget` segundos; si lo supera, su resultado es None
+    y su clave queda en 'timed_out'. 'timings' guarda la duración de cada etapa.
+    Con `instrument`, 'metrics' guarda por etapa funciones, búsquedas regex y bytes
+    recorridos (sin instrumentación los contadores no se tocan).
+    Con `monitor`, 'methods' lleva un Monitoring.MethodRecord por método (solo offsets,
+    sin texto); el texto completo de 'monitoring' solo se arma con `monitor_text`.
+    """
+    started = time.perf_counter()
+    filename = os.path.basename(filepath)
+    extension = os.path.splitext(filename)[1].lower()
+    digest = content_hash(content) if cache is not None else None
+    hits = misses = 0
+    timings = {}
+    timed_out = []
+    metrics = {} if instrument else None
+
+    # Parseo: un solo SourceFile compartido por todas las etapas
+    needs_functions = monitor or bool(FUNCTION_CHECKS & set(enabled_checks))
+    cached_functions = None
+    if cache is not None and needs_functions:
+        cached_functions = cache.get(digest, 'functions', _cache_version('functions', extension))
+        hits += cached_functions is not None
+    source = SourceFile(content, filename, cancel_event, cached_functions)
+
+    # Extracción de funciones como etapa propia, para medirla y acotarla por separado
+    functions_timed_out = False
+    if needs_functions and cached_functions is None:
+        try:
+            _run_stage(source, 'functions', time_budget, timings, lambda: source.functions, metrics)
+        except AnalysisTimedOut:
+            functions_timed_out = True
+            timed_out.append('functions')
+
+    # Resultados ya guardados en la caché para los checks habilitados
+    cached_violations = {}
+    if cache is not None:
+        for key in CHECK_KEYS:
+            if key in enabled_checks:
+                cached_violations[key] = cache.get(digest, key, _cache_version(key, extension))
+                hits += cached_violations[key] is not None
+
+    # Reglas por línea de los checks pendientes, como etapa propia: se evalúan todas juntas
+    line_rules_timed_out = False
+    source.line_rules = [
+        key for key in CHECK_KEYS
+        if key in LINE_CHECKS and key in enabled_checks and cached_violations.get(key) is None
+    ]
+    if source.line_rules:
+        try:
+            _run_stage(
+                source, 'line_rules', time_budget, timings, lambda: source.line_hits(source.line_rules[0]), metrics
+            )
+        except AnalysisTimedOut:
+            line_rules_timed_out = True
+            timed_out.append('line_rules')
+
+    # Revisiones (solo las habilitadas, en el orden del registro)
+    review = []
+    violation_count = 0
+    for key, check, _, _, _ in REVIEW_CHECKS:
+        if key not in enabled_checks:
+            continue
+        violations = cached_violations.get(key)
+        if violations is None:
+            try:
+                if functions_timed_out and key in FUNCTION_CHECKS:
+                    raise AnalysisTimedOut(filename)
+                if line_rules_timed_out and key in LINE_CHECKS:
+                    raise AnalysisTimedOut(filename)
+                _, violations, _ = _run_stage(
+                    source, key, time_budget, timings, lambda: check(content, filename, source), metrics
+                )
+            except AnalysisTimedOut:
+                timed_out.append(key)
+            else:
+                if cache is not None:
+                    misses += 1
+                    cache.put(digest, key, _cache_version(key, extension), violations)
+        review.append((key, violations))
+        violation_count += len(violations) if violations is not None else 0
+
+    # Monitoreo (extracción de métodos): filas compactas y, si se pide, el texto completo
+    monitoring = None
+    methods = None
+    if monitor:
+        def monitoring_stage():
+            rows = [] if extension in MONITOR_SKIPPED_EXTENSIONS else method_rows(source)
+            text = monitor_methods(content, filename, source, rows)[1] if monitor_text else None
+            return rows, text
+
+        try:
+            if functions_timed_out:
+                raise AnalysisTimedOut(filename)
+            methods, monitoring = _run_stage(source, 'monitoring', time_budget, timings, monitoring_stage, metrics)
+        except AnalysisTimedOut:
+            timed_out.append('monitoring')
+            monitoring = [f"⏱️ TIEMPO AGOTADO: la extracción de métodos de {filename} superó {time_budget} s."]
+
+    if cache is not None and cached_functions is None and source.functions_extracted:
+        misses += 1
+        cache.put(digest, 'functions', _cache_version('functions', extension), source.functions)
+
+    return file_result(
+        filepath, instrument, review=review, violation_count=violation_count, monitoring=monitoring,
+        cache_hits=hits, cache_misses=misses, timings=timings, elapsed=time.perf_counter() - started,
+        timed_out=timed_out, metrics=metrics, methods=methods,
+    )
+
+
+def file_result(filepath, instrument=False, **fields):
+    """
+    Resultado de un archivo con todas sus claves: los valores por defecto corresponden
+    a un archivo sin análisis (p. ej. un error de lectura) y `fields` los reemplaza.
+    Único lugar donde se define el esquema que consumen el render, la CLI y la interfaz.
+    """
+    result = {
+        'filepath': filepath,
+        'filename': os.path.basename(filepath),
+        'review': [],
+        'violation_count': 0,
+        'monitoring': None,
+        'error': None,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'timings': {},
+        'elapsed': 0.0,
+        'timed_out': [],
+        'metrics': {} if instrument else None,
+        'methods': None,
+        # st_mtime_ns del archivo en el momento en que analyze_path lo leyó (None sin ruta leída)
+        'mtime': None,
+    }
+    unknown = fields.keys() - result.keys()
+    if unknown:
+        raise KeyError(f"claves desconocidas en el resultado: {sorted(unknown)}")
+    result.update(fields)
+    return result
+
+
+def _run_stage(source, name, time_budget, timings, stage, metrics=None):
+    """
+    Ejecuta `stage()` con el plazo de `time_budget` segundos y anota su duración en `timings`.
+    Con `metrics` (dict) registra además los contadores de la etapa bajo `name`.
+    """
+    if metrics is not None:
+        source.stats = metrics[name] = new_stage_stats()
+    start = time.perf_counter()
+    source.deadline = start + time_budget if time_budget else None
+    try:
+        return stage()
+    finally:
+        source.deadline = None
+        timings[name] = time.perf_counter() - start
+        if metrics is not None:
+            metrics[name]['seconds'] = timings[name]
+            source.stats = None
+
+
+def _cache_version(name, extension):
+    """Versión de la entrada de caché; incluye la extensión porque algunos checks dependen de ella."""
+    return f"{CACHE_VERSIONS[name]}{extension}"
+
+
+def run_pipeline(files, enabled_checks, monitor=True, cancel_event=None, cache=None,
+                 time_budget=DEFAULT_TIME_BUDGET, instrument=False, monitor_text=True):
+    """
+    Generador: produce el resultado de cada archivo en el orden de `files`
+    (iterable de (ruta, contenido)), un archivo a la vez. Con contenido None el archivo
+    se lee del disco justo antes de analizarlo y se libera al pasar al siguiente.
+    """
+    try:
+        for filepath, content in files:
+            if content is None:
+                yield analyze_path(
+                    filepath, enabled_checks, monitor, cancel_event, cache, time_budget, instrument, monitor_text
+                )
+                continue
+            yield analyze_file(
+                filepath, content, enabled_checks, monitor, cancel_event, cache, time_budget, instrument, monitor_text
+            )
+    finally:
+        if cache is not None:
+            cache.trim()
+
+
+# =========================================================================
+# === Modo Paralelo (multi-núcleo, un proceso por worker) ===
+# =========================================================================
+
+def read_source(filepath):
+    """
+    Lee un archivo de código en UTF-8, con respaldo a latin-1, y normaliza los saltos de
+    línea como el modo texto de open(). Los archivos de MMAP_THRESHOLD bytes o más se
+    decodifican directamente desde un mmap, sin la copia intermedia de read().
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return _decode_source(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _decode_source(mapped)
+
+
+def _decode_source(data):
+    """Decodifica bytes (o un mmap) a texto con saltos de línea '\n'."""
+    try:
+        content = str(data, 'utf-8')
+    except UnicodeDecodeError:
+        content = str(data, 'latin-1')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def file_metadata(filepath):
+    """
+    Metadatos de un archivo para la lista de carga, sin guardar su contenido:
+    {'size', 'mtime' (st_mtime_ns), 'digest'}. El digest es el blake2b de los bytes en
+    disco (no la clave de la caché de resultados) y sirve para saber si el contenido
+    cambió de verdad cuando cambia el mtime. Lanza OSError si no se puede leer.
+    """
+    with open(filepath, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        digest = hashlib.blake2b(digest_size=20)
+        if stat.st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            digest.update(f.read())
+    return {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'digest': digest.hexdigest()}
+
+
+def analyze_path(filepath, enabled_checks, monitor=True, cancel_event=None, cache=None,
+                 time_budget=DEFAULT_TIME_BUDGET, instrument=False, monitor_text=True):
+    """
+    Lee y analiza un archivo a partir de su ruta. Es la tarea de los procesos worker:
+    reciben solo la ruta (no el contenido) y evitan serializar cadenas enormes.
+    Un error de lectura se devuelve como resultado con 'error' en lugar de propagarse.
+    'mtime' registra la versión del archivo que se analizó.
+    """
+    try:
+        # El mtime se toma antes de leer: si el archivo cambia durante la lectura, el
+        # resultado queda marcado como anterior al cambio
+        mtime = os.stat(filepath).st_mtime_ns
+        content = read_source(filepath)
+    except OSError as e:
+        return file_result(filepath, instrument, error=str(e))
+    result = analyze_file(
+        filepath, content, enabled_checks, monitor, cancel_event, cache, time_budget, instrument, monitor_text
+    )
+    result['mtime'] = mtime
+    return result
+
+
+def run_pipeline_parallel(filepaths, enabled_checks, monitor=True, workers=None, cancel_event=None, cache=None,
+                          time_budget=DEFAULT_TIME_BUDGET, instrument=False, monitor_text=True):
+    """
+    Generador: reparte los archivos entre `workers` procesos (None = núcleos disponibles)
+    y produce los resultados en el orden original de `filepaths`, a medida que llegan.
+    Los workers leen el contenido actual del disco. La caché viaja como ruta y cada
+    proceso abre su propia conexión.
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    completed = False
+    try:
+        futures = [
+            executor.submit(
+                analyze_path, path, enabled_checks, monitor, None, cache, time_budget, instrument, monitor_text
+            )
+            for path in filepaths
+        ]
+        for future in futures:
+            # Espera con sondeo para poder cancelar entre archivos
+            while cancel_event is not None and not future.done():
+                if cancel_event.is_set():
+                    raise AnalysisCancelled()
+                wait([future], timeout=0.1)
+            yield future.result()
+        completed = True
+    finally:
+        # Al cancelar no se espera a los procesos: se descartan las tareas pendientes
+        executor.shutdown(wait=completed, cancel_futures=not completed)
+        if cache is not None:
+            cache.trim()
+
+
+# =========================================================================
+# === Carga de Carpetas (recorrido con filtros y lectura en paralelo) ===
+# =========================================================================
+
+def split_globs(text):
+    """Convierte 'a;b, c' en ['a', 'b', 'c'] (separadores ';' o ',')."""
+    return [glob.strip() for glob in text.replace(',', ';').split(';') if glob.strip()]
+
+
+def _glob_matches(relative_path, patterns, is_dir):
+    """
+    True si la ruta relativa (separada por '/') coincide con algún patrón. Un patrón que
+    termina en '/' solo aplica a carpetas; los demás se prueban contra el nombre y contra
+    la ruta relativa completa. Sin distinguir mayúsculas.
+    """
+    name = relative_path.rsplit('/', 1)[-1].lower()
+    relative_path = relative_path.lower()
+    for pattern in patterns:
+        pattern = pattern.lower()
+        if pattern.endswith('/'):
+            if not is_dir:
+                continue
+            pattern = pattern.rstrip('/')
+        if fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(relative_path, pattern):
+            return True
+    return False
+
+
+def scan_directory(root, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE, cancel_event=None):
+    """
+    Recorre `root` recursivamente y devuelve, ordenadas, las rutas de los archivos que
+    coinciden con algún glob de `include` y con ninguno de `exclude` (cadenas 'a;b' o
+    listas). Las carpetas excluidas (p. ej. 'build/') no se recorren.
+    Lanza AnalysisCancelled entre carpetas si `cancel_event` se activa.
+    """
+    include = split_globs(include) if isinstance(include, str) else list(include)
+    exclude = split_globs(exclude) if isinstance(exclude, str) else list(exclude)
+    collected = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled(root)
+        relative_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        prefix = '' if relative_dir == '.' else relative_dir + '/'
+        dirnames[:] = sorted(
+            dirname for dirname in dirnames if not _glob_matches(prefix + dirname, exclude, True)
+        )
+        for filename in sorted(filenames):
+            relative_path = prefix + filename
+            if _glob_matches(relative_path, include, False) and not _glob_matches(relative_path, exclude, False):
+                collected.append(os.path.join(dirpath, filename))
+    return collected
+
+
+def stat_files_parallel(filepaths, workers=READ_WORKERS):
+    """
+    Generador: calcula file_metadata de cada archivo en un pool de `workers` hilos (la
+    lectura y el hash liberan el GIL) y produce (ruta, metadatos, error) en el orden de
+    `filepaths`. Un archivo ilegible produce metadatos None y su OSError, sin detener el
+    resto. Al cerrar el generador (p. ej. al cancelar) se descartan las lecturas pendientes.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(file_metadata, filepath) for filepath in filepaths]
+        for filepath, future in zip(filepaths, futures):
+            try:
+                yield filepath, future.result(), None
+            except OSError as e:
+                yield filepath, None, e
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# =========================================================================
+# === Render (texto + tag, independiente del widget) ===
+# =========================================================================
+
+def render_review(result):
+    """Devuelve la lista de (texto, tags) del bloque de revisión de un archivo."""
+    chunks = [
+        (f"\n\n{SEPARATOR}\n", ()),
+        (f"🔎 REVISIÓN DE ESTÁNDARES: {result['filename']}\n", ("ok",)),
+        (f"{SEPARATOR}\n", ()),
+    ]
+    if result['error']:
+        chunks.append((f"❌ ERROR: No se pudo leer el archivo: {result['error']}\n", ("warning",)))
+        return chunks
+    messages = {entry[0]: entry[2:] for entry in REVIEW_CHECKS}
+    for key, violations in result['review']:
+        violation_header, ok_message, prefixed = messages[key]
+        if violations is None:
+            shared_stage = 'line_rules' if key in LINE_CHECKS else 'functions'
+            elapsed = result['timings'].get(key, result['timings'].get(shared_stage, 0.0))
+            chunks.append((f"⏱️ TIEMPO AGOTADO: la revisión '{key}' se interrumpió tras {elapsed:.1f} s.\n", ("warning",)))
+        elif violations:
+            chunks.append((violation_header.format(count=len(violations)) + "\n", ("warning",)))
+            for v in violations:
+                chunks.append((f"     > {v}\n" if prefixed else v + "\n", ("ok",)))
+        else:
+            chunks.append((ok_message + "\n", ("ok",)))
+    return chunks
+
+
+def render_monitoring(result):
+    """Devuelve el texto del bloque de monitoreo de un archivo ('' si no se ejecutó)."""
+    if result['monitoring'] is None:
+        return ""
+    return "\n".join(result['monitoring']) + "\n\n"
+
+
+def render_timings(result):
+    """Devuelve una línea con la duración total de un archivo y de sus etapas más lentas."""
+    stages = sorted(result['timings'].items(), key=lambda item: item[1], reverse=True)
+    detail = ", ".join(f"{name} {seconds:.3f} s" for name, seconds in stages[:3])
+    timed_out = f" ⏱️ agotado: {', '.join(result['timed_out'])}" if result['timed_out'] else ""
+    return f"{result['elapsed']:8.3f} s  {result['filepath']} ({detail}){timed_out}"
+
+
+def metrics_rows(result):
+    """Filas planas (archivo, etapa, segundos y contadores) de un resultado instrumentado."""
+    rows = []
+    for stage, values in (result.get('metrics') or {}).items():
+        rows.append(dict(values, file=result['filepath'], stage=stage))
+    return rows
+
+
+def render_summary(total_violations):
+    """Devuelve (texto, tag) del resumen final de la revisión."""
+    final_summary = f"\n\n--- RESUMEN FINAL DE REVISIÓN ---\n"
+    if total_violations > 0:
+        final_summary += f"🔴 ALERTA: Se encontraron {total_violations} violaciones de estándares en total.\n"
+        return final_summary, "warning"
+    final_summary += "🟢 ÉXITO: Todos los archivos cargados cumplen con los estándares seleccionados.\n"
+    return final_summary, "ok"
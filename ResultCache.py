@@ -0,0 +1,111 @@
+# ResultCache.py
+#
+# Caché persistente en disco de resultados de análisis. La clave es
+# (hash del contenido, nombre del check, versión del check/configuración), así un
+# archivo sin cambios cuesta un hash y una consulta. Tamaño máximo con expulsión LRU.
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".code_review_cache.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def content_hash(content):
+    """Hash estable del contenido de un archivo (texto ya decodificado)."""
+    return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=20).hexdigest()
+
+
+class ResultCache:
+    """
+    Caché SQLite con expulsión LRU por tamaño. Cada hilo abre su propia conexión y
+    el objeto se puede enviar a procesos worker (solo viaja la ruta y el límite).
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def __getstate__(self):
+        return {'path': self.path, 'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['max_bytes'])
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            import sqlite3  # Diferido: importar el núcleo de análisis no carga SQLite
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " content_hash TEXT NOT NULL, name TEXT NOT NULL, version TEXT NOT NULL,"
+                " value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL,"
+                " PRIMARY KEY (content_hash, name, version))"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+            self._local.connection = connection
+        return connection
+
+    def get(self, digest, name, version):
+        """Devuelve el valor guardado o None si no existe (y actualiza su uso LRU)."""
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value FROM entries WHERE content_hash = ? AND name = ? AND version = ?",
+            (digest, name, version)
+        ).fetchone()
+        if row is None:
+            return None
+        connection.execute(
+            "UPDATE entries SET last_used = ? WHERE content_hash = ? AND name = ? AND version = ?",
+            (time.time(), digest, name, version)
+        )
+        return json.loads(row[0])
+
+    def put(self, digest, name, version, value):
+        """Guarda un valor serializable en JSON."""
+        encoded = json.dumps(value, ensure_ascii=False)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO entries (content_hash, name, version, value, size, last_used)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (digest, name, version, encoded, len(encoded), time.time())
+        )
+
+    def trim(self):
+        """Expulsa las entradas menos usadas recientemente hasta respetar max_bytes."""
+        connection = self._connection()
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return 0
+        evicted = []
+        for rowid, size in connection.execute("SELECT rowid, size FROM entries ORDER BY last_used"):
+            evicted.append((rowid,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+        return len(evicted)
+
+    def invalidate(self):
+        """Borra todas las entradas de la caché."""
+        self._connection().execute("DELETE FROM entries")
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def format_cache_stats(hits, misses):
+    """Línea de resumen de aciertos/fallos de caché para la interfaz o la CLI."""
+    total = hits + misses
+    ratio = f" ({100 * hits / total:.0f}% aciertos)" if total else ""
+    return f"💾 Caché: {hits} aciertos / {misses} fallos{ratio}"
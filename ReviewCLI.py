@@ -0,0 +1,205 @@
+# ReviewCLI.py
+#
+# Punto de entrada de línea de comandos para hooks de pre-commit y tareas nocturnas.
+# No importa Tkinter: arranca rápido en máquinas de build sin pantalla.
+#
+#   python ReviewCLI.py src/ include/*.h --checks unused_params,header_params --format json
+#
+# Código de salida: 0 sin violaciones, 1 con violaciones, 2 si algún archivo no se pudo leer
+# o alguna etapa agotó su presupuesto de tiempo (revisión incompleta).
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+from Pipeline import (
+    CHECK_KEYS, DEFAULT_INCLUDE, DEFAULT_TIME_BUDGET, analyze_path, render_monitoring, render_review, render_summary,
+    render_timings, run_pipeline_parallel, scan_directory,
+)
+from ResultCache import DEFAULT_CACHE_PATH, DEFAULT_MAX_BYTES, ResultCache, format_cache_stats
+
+
+def collect_files(targets, include=DEFAULT_INCLUDE, exclude=''):
+    """
+    Expande archivos, directorios (recursivo, filtrado con los globs `include`/`exclude`
+    de Pipeline.scan_directory) y globs en una lista ordenada y sin duplicados.
+    """
+    collected = []
+    seen = set()
+
+    def add(path):
+        path = os.path.normpath(path)
+        if path not in seen:
+            seen.add(path)
+            collected.append(path)
+
+    for target in targets:
+        if glob.has_magic(target):
+            matches = sorted(glob.glob(target, recursive=True))
+        else:
+            matches = [target]
+        for match in matches:
+            if os.path.isdir(match):
+                for path in scan_directory(match, include, exclude):
+                    add(path)
+            else:
+                add(match)
+    return collected
+
+
+def _result_to_json(result):
+    """Convierte un resultado del pipeline en un dict serializable."""
+    return {
+        'file': result['filepath'],
+        'error': result['error'],
+        'violation_count': result['violation_count'],
+        'checks': {key: [v.strip() for v in violations] for key, violations in result['review']},
+        'monitoring': result['monitoring'],
+        # Offsets de cada método sobre el archivo (MethodRecord.to_json), sin su texto
+        'methods': [row.to_json() for row in result['methods']] if result['methods'] is not None else None,
+        'timed_out': result['timed_out'],
+        'timings': {stage: round(seconds, 6) for stage, seconds in result['timings'].items()},
+        'metrics': result['metrics'],
+    }
+
+
+def _positive_int(text):
+    """Tipo de argparse: entero mayor o igual a 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' no es un entero") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"debe ser al menos 1 (se recibió {value})")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Revisión de estándares de código sin interfaz gráfica."
+    )
+    parser.add_argument('targets', nargs='*', help="Archivos, directorios o globs (ej. 'src/**/*.cpp').")
+    parser.add_argument(
+        '--checks', default=','.join(CHECK_KEYS),
+        help=f"Checks separados por comas (por defecto todos: {','.join(CHECK_KEYS)})."
+    )
+    parser.add_argument(
+        '--include', default=DEFAULT_INCLUDE,
+        help="Globs de archivos a recoger en directorios, separados por ';' (por defecto extensiones de código)."
+    )
+    parser.add_argument(
+        '--exclude', default='',
+        help="Globs a omitir en directorios, separados por ';' ('build/' omite la carpeta entera)."
+    )
+    parser.add_argument('--monitor', action='store_true', help="Incluye la extracción de métodos (monitor_methods).")
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help="Formato de salida.")
+    parser.add_argument('--jobs', type=_positive_int, default=1, help="Procesos en paralelo (al menos 1).")
+    parser.add_argument('--no-cache', action='store_true', help="No usa la caché de resultados.")
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH, help="Archivo SQLite de la caché.")
+    parser.add_argument(
+        '--cache-size-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Tamaño máximo de la caché en MB (expulsión LRU)."
+    )
+    parser.add_argument('--invalidate-cache', action='store_true', help="Vacía la caché antes de revisar.")
+    parser.add_argument(
+        '--time-budget', type=float, default=DEFAULT_TIME_BUDGET,
+        help=f"Segundos máximos por etapa y archivo (0 = sin límite, por defecto {DEFAULT_TIME_BUDGET})."
+    )
+    parser.add_argument(
+        '--timings', type=int, nargs='?', const=10, default=0, metavar='N',
+        help="Muestra en stderr los N archivos más lentos (por defecto 10)."
+    )
+    parser.add_argument(
+        '--instrument', action='store_true',
+        help="Registra por etapa funciones, búsquedas regex y bytes recorridos (campo 'metrics' del JSON)."
+    )
+    args = parser.parse_args(argv)
+
+    if not args.targets and not args.invalidate_cache:
+        parser.error("indica al menos un archivo, directorio o glob")
+
+    args.checks = [c.strip() for c in args.checks.split(',') if c.strip()]
+    unknown = [c for c in args.checks if c not in CHECK_KEYS]
+    if unknown:
+        parser.error(f"check(s) desconocido(s): {', '.join(unknown)}. Disponibles: {', '.join(CHECK_KEYS)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    cache = None
+    if not args.no_cache or args.invalidate_cache:
+        cache = ResultCache(args.cache_path, args.cache_size_mb * 1024 * 1024)
+    if args.invalidate_cache:
+        cache.invalidate()
+        print("Caché invalidada.", file=sys.stderr)
+        if not args.targets:
+            return 0
+    if args.no_cache:
+        cache = None
+
+    filepaths = collect_files(args.targets, args.include, args.exclude)
+    if not filepaths:
+        print("No se encontraron archivos para revisar.", file=sys.stderr)
+        return 2
+
+    enabled_checks = set(args.checks)
+    time_budget = args.time_budget or None
+    if args.jobs == 1:
+        results = (
+            analyze_path(path, enabled_checks, args.monitor, None, cache, time_budget, args.instrument)
+            for path in filepaths
+        )
+    else:
+        results = run_pipeline_parallel(
+            filepaths, enabled_checks, args.monitor, args.jobs, None, cache, time_budget, args.instrument
+        )
+
+    total_violations = 0
+    read_errors = 0
+    timed_out = 0
+    slowest = []
+    cache_hits = cache_misses = 0
+    json_results = []
+    for result in results:
+        total_violations += result['violation_count']
+        read_errors += 1 if result['error'] else 0
+        timed_out += 1 if result['timed_out'] else 0
+        if args.timings:
+            slowest.append((result['elapsed'], render_timings(result)))
+        cache_hits += result['cache_hits']
+        cache_misses += result['cache_misses']
+        if args.format == 'json':
+            json_results.append(_result_to_json(result))
+        else:
+            sys.stdout.write(''.join(text for text, _ in render_review(result)))
+            sys.stdout.write(render_monitoring(result))
+
+    if args.format == 'json':
+        json.dump({'files': json_results, 'total_violations': total_violations}, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    else:
+        sys.stdout.write(render_summary(total_violations)[0])
+
+    if cache is not None:
+        cache.trim()
+        print(format_cache_stats(cache_hits, cache_misses), file=sys.stderr)
+
+    if args.timings:
+        slowest.sort(reverse=True)
+        print(f"--- {min(args.timings, len(slowest))} archivo(s) más lento(s) ---", file=sys.stderr)
+        for _, line in slowest[:args.timings]:
+            print(line, file=sys.stderr)
+    if timed_out:
+        print(f"⏱️ {timed_out} archivo(s) con etapas que agotaron el tiempo.", file=sys.stderr)
+
+    if read_errors or timed_out:
+        return 2
+    return 1 if total_violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+# ReviewChecks.py
+#
+# Revisiones de estándares de código. Módulo sin dependencias de interfaz (Tkinter):
+# cada check recibe el código, el nombre del archivo y, opcionalmente, el SourceFile
+# compartido, y devuelve (título, violaciones, límite).
+
+import re
+
+from Extractor import SourceFile
+from Lexer import COMMENT
+from LineRules import register_line_rule
+
+
+# =========================================================================
+# === Lógica Central de Detección (Funciones de utilidad) ===
+# =========================================================================
+
+def _format_header_violation_message(func_name: str, line_num: int, param_list: list, error_type: str) -> str:
+    """
+    Formatea el mensaje de error para violaciones en la documentación del header (MISSING/EXTRA).
+    """
+    num_params = len(param_list)
+    quoted_params = [f"'{p}'" for p in param_list]
+
+    if num_params == 1:
+        param_str = quoted_params[0]
+        param_word = "parameter"
+        verb = "is"
+    else:
+        param_word = "parameters"
+        verb = "are"
+        if num_params == 2:
+            param_str = f"{quoted_params[0]} and {quoted_params[1]}"
+        else:
+            param_str = ", ".join(quoted_params[:-1])
+            param_str += f", and {quoted_params[-1]}"
+
+    if error_type == 'MISSING':
+        header = f"The {param_word} {param_str} {verb} not mentioned in the function header comment."
+    elif error_type == 'EXTRA':
+        header = f"The {param_word} {param_str} {verb} documented in the header but {verb} not found in the function signature."
+    else:
+        header = f"Header documentation issue with {param_word} {param_str}."
+
+    message = f"\n    Line {line_num} (Function '{func_name}'): {header}"
+    return message
+
+
+def _format_unused_params_message_en(func_name: str, line_num: int, unused_list: list) -> str:
+    """
+    Formatea el mensaje de error para parámetros no utilizados (en inglés).
+    """
+    num_unused = len(unused_list)
+    quoted_params = [f"'{p}'" for p in unused_list]
+
+    if num_unused == 1:
+        param_str = quoted_params[0]
+        verb = "is"
+        word = "parameter"
+        header = f"The {word} {param_str} {verb} defined but not used in the function body."
+    else:
+        verb = "are"
+        word = "parameters"
+        if num_unused == 2:
+            param_str = f"{quoted_params[0]} and {quoted_params[1]}"
+        else:
+            param_str = ", ".join(quoted_params[:-1])
+            param_str += f", and {quoted_params[-1]}"
+        header = f"The {word} {param_str} {verb} defined but not used in the function body."
+
+    message = f"\n    Line {line_num} (Function '{func_name}'): {header}"
+    return message
+
+
+def _get_clean_param_name(param_str):
+    """
+    Limpia una cadena de parámetro para aislar el nombre de la variable.
+    """
+    param_str = param_str.strip()
+
+    if param_str.lower() == 'void' or not param_str:
+        return None
+
+    param_str = param_str.split('=')[0].strip()
+
+    if param_str.startswith('{') or param_str.startswith('['):
+        return None 
+
+    parts = param_str.split()
+    if not parts: return None
+
+    potential_name_token = parts[-1]
+
+    match = re.search(r'([a-zA-Z_][a-zA-Z0-9_]*)(?=[\[*&])', potential_name_token)
+
+    clean_name = potential_name_token
+
+    if match:
+        clean_name = match.group(1)
+    else:
+        clean_name = re.sub(r'[^\w]', '', potential_name_token).strip()
+
+    if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', clean_name):
+        return clean_name
+
+    return None
+
+
+# Identificadores (rachas \w) de una lista de inicialización
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+# =========================================================================
+# === Reglas por Línea (evaluadas juntas por LineRules) ===
+# =========================================================================
+
+LINE_LIMIT = 120
+
+# Líneas de más de LINE_LIMIT caracteres: el regex mide la línea sin recorrerla en Python
+register_line_rule('line_length', pattern=rf'^[^\n]{{{LINE_LIMIT + 1},}}', flags=re.MULTILINE)
+# Marcadores de tarea pendiente (sin distinguir mayúsculas), solo dentro de comentarios
+register_line_rule('todos', pattern=r'\b(?:TODO|FIXME|HACK)\b', region=COMMENT, flags=re.IGNORECASE)
+
+
+# =========================================================================
+# === Lógica de Estándares de Código (Módulos de Revisión) ===
+# =========================================================================
+
+def check_line_length(code, filename, source=None):
+    """Verifica las líneas que exceden el límite de 120 caracteres."""
+    if source is None:
+        source = SourceFile(code, filename)
+    violations = [
+        f"Line {num_line}: {len(line)} characters (Limit: {LINE_LIMIT})"
+        for num_line, line in source.line_hits('line_length')
+    ]
+    return "Límite de 120 Caracteres", violations, LINE_LIMIT
+
+
+def check_for_todos(code, filename, source=None):
+    """
+    Verifica la existencia de comentarios 'TODO', 'FIXME', o 'HACK'. Solo cuentan los
+    marcadores dentro de comentarios (según la máscara de regiones): un 'todo' en un
+    identificador o en una cadena no es una tarea pendiente.
+    """
+    if source is None:
+        source = SourceFile(code, filename)
+    violations = [
+        f"Línea {num_line}: Se encontró un marcador de tarea (TODO/FIXME/HACK)."
+        for num_line, _ in source.line_hits('todos')
+    ]
+    return "Comentarios Pendientes (TODOs)", violations, 0 
+
+
+def check_unused_parameters(code, filename, source=None):
+    """
+    Revisa si los parámetros definidos en funciones o métodos son utilizados
+    dentro del cuerpo de la función, incluyendo la lista de inicialización.
+    """
+    violations = []
+
+    if filename.lower().endswith(('.html', '.css', '.md')):
+        return "Parámetros No Utilizados", violations, 0
+
+    if source is None:
+        source = SourceFile(code, filename)
+
+    for record in source.definitions():
+        func_name = record['name'].split('::')[-1] 
+        param_string = source.text(record['params_span']) 
+        init_list = source.text(record['init_span']) 
+
+        # 1. Extraer nombres de parámetros limpios
+        raw_params = [p.strip() for p in re.split(r',\s*', param_string) if p.strip()]
+        source.record_search(1, len(param_string))
+        parameters = []
+        for p in raw_params:
+            param_name = _get_clean_param_name(p)
+            if param_name and param_name not in ('self', 'cls', '_', '__'): 
+                parameters.append(param_name)
+
+        if parameters:
+            # 2. Verificar uso en la Lista de Inicialización: conjunto de identificadores
+            # (una búsqueda \bparam\b equivale a que `param` sea una racha \w completa)
+            used_in_init_list = set()
+            if init_list:
+                init_identifiers = set(_WORD_PATTERN.findall(init_list))
+                used_in_init_list = {p for p in parameters if p in init_identifiers}
+                source.record_search(1, len(init_list))
+
+            params_to_check_in_body = [p for p in parameters if p not in used_in_init_list]
+
+            unused_params_in_func = []
+
+            if params_to_check_in_body:
+                # 5. Verificar el uso en el cuerpo: identificadores en código según la
+                # máscara de regiones del archivo (sin volver a lexear ni copiar el cuerpo)
+                body_start, body_end = record['body_span']
+                body_identifiers = source.region_mask.identifiers(body_start, body_end)
+                source.record_search(1, body_end - body_start)
+                unused_params_in_func = [p for p in params_to_check_in_body if p not in body_identifiers]
+
+            # 6. Generar el mensaje de violación agrupado en inglés
+            if unused_params_in_func:
+                violation_message = _format_unused_params_message_en(
+                    func_name, record['line'], unused_params_in_func
+                )
+                violations.append(violation_message)
+
+    return "Parámetros No Utilizados", violations, 0
+
+
+# 🌟 FUNCIÓN DE REVISIÓN CORREGIDA (V26)
+def check_header_params_documentation(code, filename, source=None):
+    """
+    Verifica la consistencia entre los parámetros de la firma de la función
+    y los parámetros documentados en el comentario de cabecera.
+
+    Corrige la detección de \param[in] name (ej. 'tag').
+    """
+    violations = []
+
+    if not filename.lower().endswith(('.cpp', '.c', '.h', '.hpp', '.py', '.js', '.ts')):
+        return "Documented Parameters (Header)", violations, 0
+
+    if source is None:
+        source = SourceFile(code, filename)
+
+    # Incluye declaraciones (';') y cuerpos sin cerrar, igual que antes
+    for record in source.iter_functions():
+        func_name_full = record['name'] 
+        param_string = source.text(record['params_span']) 
+
+        # --- A. PARÁMETROS EN LA FIRMA (Signature Parameters) ---
+        raw_params = [p.strip() for p in re.split(r',\s*', param_string) if p.strip()]
+        source.record_search(1, len(param_string))
+        sig_params = set() 
+        for p in raw_params:
+            param_name = _get_clean_param_name(p)
+            if param_name and param_name not in ('self', 'cls', '_', '__'): 
+                sig_params.add(param_name)
+
+        # --- B. PARÁMETROS EN LA DOCUMENTACIÓN (Header Parameters) ---
+        header_comment = source.header_comment(record) 
+        doc_params = set() 
+
+        if header_comment:
+            clean_comment = re.sub(r'\s+', ' ', header_comment)
+
+            # 🎯 CORRECCIÓN ROBUSTA V26: Maneja todos los casos Doxygen.
+            # (\param o @param) seguido de [optional modifiers] luego (el nombre)
+            param_tag_matches = re.findall(
+                r'(?:\\param|@param)\s+'
+                r'(?:\[[^\]]+\]\s*)?' # [in], [out], [in, out] o cualquier cosa entre corchetes, opcional
+                r'([a-zA-Z_][a-zA-Z0-9_]*)\b', 
+                clean_comment
+            )
+
+            for name in param_tag_matches:
+                doc_params.add(name)
+            source.record_search(2, len(header_comment) + len(clean_comment))
+
+        # --- C. COMPARACIÓN DE CONJUNTOS Y GENERACIÓN DE VIOLACIONES ---
+
+        # 1. Parámetros FALTANTES (En la firma, pero NO en la documentación)
+        missing_params = sorted(list(sig_params - doc_params))
+
+        if missing_params:
+            violation_message = _format_header_violation_message(
+                func_name_full, record['line'], missing_params, 'MISSING'
+            )
+            violations.append(violation_message)
+
+        # 2. Parámetros EXTRA (En la documentación, pero NO en la firma)
+        extra_params = sorted(list(doc_params - sig_params))
+
+        if extra_params:
+            violation_message = _format_header_violation_message(
+                func_name_full, record['line'], extra_params, 'EXTRA'
+            )
+            violations.append(violation_message)
+
+    return "Documented Parameters (Header)", violations, 0
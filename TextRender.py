@@ -0,0 +1,74 @@
+# TextRender.py
+#
+# Capa de render por lotes para widgets Text de Tk. Cada insert/see/tag_config es una
+# llamada al intérprete Tcl (y puede recalcular el layout); con miles de líneas ese
+# costo supera al del análisis. Aquí se acumula la salida de un archivo como pares
+# (texto, tags) y se inserta con UNA sola llamada Text.insert(índice, t1, tags1, t2, tags2, ...).
+# No importa Tkinter: trabaja con cualquier objeto con la interfaz de Text.
+
+
+class TextBatch:
+    """
+    Acumula texto con sus tags. Los fragmentos consecutivos con los mismos tags se
+    fusionan, así el número de argumentos de la inserción final crece con los cambios
+    de formato y no con el número de líneas.
+    """
+    def __init__(self):
+        self._texts = []
+        self._tags = []
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, text, tags=()):
+        """Agrega un fragmento; `tags` puede ser un nombre o una tupla de nombres."""
+        if not text:
+            return
+        if isinstance(tags, str):
+            tags = (tags,)
+        else:
+            tags = tuple(tags)
+        if self._tags and self._tags[-1] == tags:
+            self._texts[-1].append(text)
+        else:
+            self._texts.append([text])
+            self._tags.append(tags)
+
+    def add_line(self, text, tags=()):
+        """Agrega `text` seguido de un salto de línea."""
+        self.add(text + "\n", tags)
+
+    def extend(self, chunks):
+        """Agrega una lista de (texto, tags) como la que devuelve Pipeline.render_review."""
+        for text, tags in chunks:
+            self.add(text, tags)
+
+    def tag_names(self):
+        """Tags usados en el lote (para configurarlos una sola vez antes de insertar)."""
+        return {tag for tags in self._tags for tag in tags}
+
+    def arguments(self, extra_tags=()):
+        """Argumentos planos (t1, tags1, t2, tags2, ...) para Text.insert."""
+        extra_tags = tuple(extra_tags)
+        flat = []
+        for texts, tags in zip(self._texts, self._tags):
+            flat.append(''.join(texts))
+            flat.append(tags + extra_tags)
+        return flat
+
+    def flush(self, widget, index='end', extra_tags=(), see=None):
+        """
+        Inserta todo el lote en `widget` con una sola llamada y lo vacía. `extra_tags` se
+        agregan a cada fragmento (p. ej. el tag de sección del archivo). Con `see`, se
+        desplaza la vista una sola vez al final. Devuelve los caracteres insertados.
+        """
+        if not self._texts:
+            return 0
+        flat = self.arguments(extra_tags)
+        widget.insert(index, *flat)
+        if see is not None:
+            widget.see(see)
+        inserted = sum(len(text) for text in flat[::2])
+        self._texts = []
+        self._tags = []
+        return inserted
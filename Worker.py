@@ -0,0 +1,96 @@
+# Worker.py
+#
+# Ejecuta trabajo pesado fuera del hilo principal de Tk. El hilo de trabajo publica
+# sus resultados en una cola y la interfaz la vacía periódicamente con root.after,
+# de modo que la ventana nunca queda "No responde".
+
+import queue
+import threading
+import time
+
+from Extractor import AnalysisCancelled
+
+
+class BackgroundWorker:
+    """
+    Ejecuta un generador en un hilo de trabajo y entrega cada elemento producido
+    a la interfaz (hilo de Tk) a través de una cola.
+
+    `task(cancel_event)` debe ser un generador; los callbacks se llaman siempre
+    desde el hilo de Tk:
+      on_item(item)          por cada elemento producido
+      on_done(cancelled)     al terminar (cancelled=True si se canceló)
+      on_error(exc)          si el generador lanza una excepción
+    """
+    POLL_MS = 50
+    # Tiempo máximo por turno vaciando la cola: la interfaz sigue respondiendo y el
+    # ritmo de entrega depende del costo de cada callback, no de un número fijo de elementos
+    POLL_BUDGET = 0.010
+    # Si quedaron elementos en la cola, el siguiente turno se programa casi de inmediato
+    BACKLOG_POLL_MS = 1
+
+    def __init__(self, root):
+        self.root = root
+        self._queue = queue.Queue()
+        self._thread = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self, task, on_item, on_done, on_error=None):
+        """Lanza `task` en un hilo de trabajo (daemon) y empieza a vaciar la cola."""
+        if self.running:
+            return False
+        self._cancel_event = threading.Event()
+        self._callbacks = (on_item, on_done, on_error)
+        self._thread = threading.Thread(target=self._run, args=(task, self._cancel_event), daemon=True)
+        self._thread.start()
+        self.root.after(self.POLL_MS, self._poll)
+        return True
+
+    def cancel(self):
+        """Solicita la cancelación; el trabajo se detiene entre funciones/archivos."""
+        self._cancel_event.set()
+
+    def _run(self, task, cancel_event):
+        """Cuerpo del hilo de trabajo: nunca toca widgets, solo la cola."""
+        try:
+            for item in task(cancel_event):
+                self._queue.put(('item', item))
+                if cancel_event.is_set():
+                    raise AnalysisCancelled()
+            self._queue.put(('done', False))
+        except AnalysisCancelled:
+            self._queue.put(('done', True))
+        except Exception as e:
+            self._queue.put(('error', e))
+            self._queue.put(('done', cancel_event.is_set()))
+
+    def _poll(self):
+        """
+        Vacía la cola en el hilo de Tk durante a lo sumo POLL_BUDGET segundos y se
+        reprograma hasta terminar (enseguida si quedó trabajo pendiente).
+        """
+        on_item, on_done, on_error = self._callbacks
+        deadline = time.perf_counter() + self.POLL_BUDGET
+        backlog = False
+        while True:
+            if time.perf_counter() > deadline:
+                backlog = True
+                break
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'item':
+                on_item(payload)
+            elif kind == 'error':
+                if on_error is not None:
+                    on_error(payload)
+            else:
+                self._thread = None
+                on_done(payload)
+                return
+        self.root.after(self.BACKLOG_POLL_MS if backlog else self.POLL_MS, self._poll)
@@ -0,0 +1,8 @@
+# Revisiones: resultados idénticos a las implementaciones anteriores.
+
+import Benchmark
+
+
+def test_unused_params_and_scanner_match_legacy():
+    # unused_params por conjuntos vs. regex por parámetro, máscara vs. escáner, firmas válidas
+    assert Benchmark.check_equivalence(files=20) == 0
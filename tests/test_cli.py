@@ -0,0 +1,59 @@
+# ReviewCLI: códigos de salida, salida JSON y validación de argumentos.
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import ReviewCLI
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "ok.cpp").write_text(
+        "/**\n * @param a valor\n */\nint suma(int a)\n{\n    return a;\n}\n", encoding='utf-8'
+    )
+    (tmp_path / "src" / "largo.cpp").write_text("int x = 1; // " + "x" * 130 + "\n", encoding='utf-8')
+    (tmp_path / "src" / "notas.txt").write_text("no se revisa\n", encoding='utf-8')
+    return tmp_path
+
+
+def test_clean_file_exits_zero(project, capsys):
+    assert ReviewCLI.main([str(project / "src" / "ok.cpp"), '--no-cache']) == 0
+    assert "ok.cpp" in capsys.readouterr().out
+
+
+def test_directory_json_reports_violations(project, capsys):
+    code = ReviewCLI.main([str(project / "src"), '--no-cache', '--format', 'json', '--checks', 'line_length'])
+    report = json.loads(capsys.readouterr().out)
+
+    assert code == 1
+    assert sorted(os.path.basename(entry['file']) for entry in report['files']) == ['largo.cpp', 'ok.cpp']
+    assert report['total_violations'] == 1
+
+
+def test_unreadable_file_exits_two(project):
+    assert ReviewCLI.main([str(project / "falta.cpp"), '--no-cache']) == 2
+
+
+@pytest.mark.parametrize('jobs', ['0', '-3', 'dos'])
+def test_jobs_must_be_a_positive_integer(jobs, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        ReviewCLI.main(['archivo.cpp', '--jobs', jobs])
+    assert exit_info.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
+
+
+def test_parallel_run_as_a_script(project):
+    completed = subprocess.run(
+        [sys.executable, os.path.join(REPO_ROOT, 'ReviewCLI.py'), str(project / "src"), '--jobs', '2',
+         '--no-cache', '--format', 'json'],
+        capture_output=True, text=True,
+    )
+    assert completed.returncode == 1
+    assert len(json.loads(completed.stdout)['files']) == 2
@@ -0,0 +1,60 @@
+# Extractor: firmas válidas reconocidas por FUNCTION_SIG_PATTERN.
+
+import time
+
+import pytest
+
+import ReviewChecks
+from Benchmark import SIGNATURE_CASES, adversarial_cases, generate_cpp
+from Extractor import SourceFile, new_stage_stats
+from Lexer import COMMENT
+from Monitoring import iter_methods
+
+
+@pytest.mark.parametrize('name', sorted(SIGNATURE_CASES))
+def test_valid_signatures_are_definitions(name):
+    code = SIGNATURE_CASES[name]
+    records = SourceFile(code, 'caso.cpp').functions
+    assert len(records) == 1
+    assert records[0]['name'] == code.split('(')[0].split()[-1]
+    assert records[0]['body_span'] is not None
+
+
+def test_body_calls_are_not_reported_as_declarations():
+    code = (
+        "/**\n * \\brief Asigna\n * @param v valores\n */\n"
+        + SIGNATURE_CASES['brace_default_arg']
+        + "/**\n * \\brief Registra\n * @param f callback\n */\n"
+        + SIGNATURE_CASES['nested_callback']
+    )
+    _, violations, _ = ReviewChecks.check_header_params_documentation(code, 'caso.cpp')
+    assert violations == []
+
+
+def test_adversarial_corpus_extracts_within_budget():
+    # Sin retroceso catastrófico: AnalysisTimedOut si un caso supera el plazo
+    for name, code in adversarial_cases().items():
+        source = SourceFile(code, f"{name}.cpp")
+        source.deadline = time.perf_counter() + 2
+        source.functions
+
+
+def test_unclosed_block_comment_runs_to_end_of_file():
+    # Un '/*' sin cerrar es comentario hasta el final (y la máscara se arma en tiempo lineal)
+    code = adversarial_cases()['unclosed_comments']
+    source = SourceFile(code, 'comentario.cpp')
+    started = time.perf_counter()
+    spans = source.region_mask.spans
+
+    assert time.perf_counter() - started < 0.5
+    assert spans == [(0, len(code), COMMENT)]
+    assert source.region_mask.kind_at(code.index('{')) == COMMENT
+
+
+def test_streaming_counts_each_function_once():
+    source = SourceFile(generate_cpp(50), 'stream.cpp')
+    source.stats = new_stage_stats()
+    methods = list(iter_methods(source.code, source.filename, source))
+
+    assert len(methods) == 50
+    assert source.stats['functions'] == 50
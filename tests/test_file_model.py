@@ -0,0 +1,78 @@
+# FileModel: etiquetas con el sufijo único más corto, comparadas con una versión directa.
+
+import random
+
+import pytest
+
+from FileModel import FileListModel
+
+
+def _brute_force_labels(paths):
+    """Para cada ruta, su sufijo más corto que ninguna otra ruta comparte (o la ruta completa)."""
+    split = {path: path.replace('\\', '/').strip('/').split('/') for path in paths}
+    labels = {}
+    for path, parts in split.items():
+        candidates = ['/'.join(parts[-depth:]) for depth in range(1, len(parts) + 1)]
+        others = [other for other in paths if other != path]
+        labels[path] = next(
+            (suffix for suffix in candidates
+             if not any(('/' + '/'.join(split[other])).endswith('/' + suffix) for other in others)),
+            candidates[-1],
+        )
+    return labels
+
+
+def _random_path(rng):
+    # Pocas carpetas y nombres: muchos homónimos que comparten uno o más niveles
+    folders = [rng.choice(('src', 'core', 'gui', 'a')) for _ in range(rng.randint(0, 3))]
+    return '/'.join(folders + [rng.choice(('utils.cpp', 'main.cpp', 'util.h'))])
+
+
+def _assert_consistent(model):
+    paths = list(model)
+    assert model.labels() == [_brute_force_labels(paths)[path] for path in paths]
+    assert [model.row_of(path) for path in paths] == list(range(len(paths)))
+    assert [model.path_at(row) for row in range(len(paths))] == paths
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_labels_match_brute_force_under_adds_and_removes(seed):
+    rng = random.Random(seed)
+    model = FileListModel()
+    for _ in range(60):
+        if len(model) and rng.random() < 0.3:
+            rows = rng.sample(range(len(model)), rng.randint(1, min(3, len(model))))
+            expected = [model.path_at(row) for row in sorted(rows)]
+            assert model.remove_rows(rows) == expected
+        else:
+            path = _random_path(rng)
+            if path in model:
+                continue
+            before = dict(zip(model, model.labels()))
+            changed = model.add(path, {'size': 0})
+            after = dict(zip(model, model.labels()))
+            # add devuelve exactamente las filas de las otras rutas cuya etiqueta cambió
+            assert sorted(changed) == sorted(model.row_of(p) for p in before if before[p] != after[p])
+        _assert_consistent(model)
+
+
+def test_remove_rows_relabels_files_sharing_a_basename():
+    model = FileListModel()
+    for path in ('proj/core/utils.cpp', 'proj/gui/utils.cpp', 'old/gui/utils.cpp', 'proj/main.cpp'):
+        model.add(path, {})
+    assert model.labels() == ['core/utils.cpp', 'proj/gui/utils.cpp', 'old/gui/utils.cpp', 'main.cpp']
+
+    assert model.remove_rows([2]) == ['old/gui/utils.cpp']
+    assert model.labels() == ['core/utils.cpp', 'gui/utils.cpp', 'main.cpp']
+    assert model.row_of('proj/main.cpp') == 2
+
+    assert model.remove_rows([0, 1]) == ['proj/core/utils.cpp', 'proj/gui/utils.cpp']
+    assert model.labels() == ['main.cpp']
+    _assert_consistent(model)
+
+
+def test_backslash_and_slash_paths_share_suffixes():
+    model = FileListModel()
+    model.add('C:\\proj\\core\\utils.cpp', {})
+    model.add('/home/proj/gui/utils.cpp', {})
+    assert model.labels() == ['core/utils.cpp', 'gui/utils.cpp']
@@ -0,0 +1,8 @@
+# Importación: los módulos del núcleo cargan dentro del presupuesto y sin Tkinter.
+
+import Benchmark
+
+
+def test_core_modules_import_within_budget():
+    # Intérprete nuevo por módulo; falla por tiempo o si arrastra un módulo de HEAVY_MODULES
+    assert Benchmark.check_imports() == 0
@@ -0,0 +1,74 @@
+# LineRules: cada regla se evalúa por separado, con sus flags y '$' anclado al fin de línea;
+# las de predicado comparten un recorrido de las líneas.
+
+import re
+
+import pytest
+
+import LineRules
+from Extractor import AnalysisTimedOut, SourceFile, new_stage_stats
+from Lexer import CODE
+from LineRules import evaluate_line_rules, register_line_rule
+
+
+@pytest.fixture
+def rules(monkeypatch):
+    """Registra reglas temporales sin dejar rastro en LINE_RULES."""
+    monkeypatch.setattr(LineRules, 'LINE_RULES', dict(LineRules.LINE_RULES))
+    LineRules._engine_for.cache_clear()
+    yield register_line_rule
+    LineRules._engine_for.cache_clear()
+
+
+def _hits(code, names):
+    return evaluate_line_rules(SourceFile(code, 'reglas.cpp'), names)
+
+
+def test_passes_over_the_file(rules):
+    rules('trailing_ws', pattern=r'[ \t]+$', flags=re.MULTILINE)
+    rules('tabs', pattern=r'\t')
+    seen = {'first': [], 'second': []}
+    rules('first_lines', predicate=lambda line: seen['first'].append(line))
+    rules('second_lines', predicate=lambda line: seen['second'].append(line))
+    code = "x" * 130 + "   \n" + "int y;\t  \n"
+    names = {'line_length', 'trailing_ws', 'tabs', 'first_lines', 'second_lines'}
+
+    source = SourceFile(code, 'reglas.cpp')
+    source.stats = new_stage_stats()
+    together = evaluate_line_rules(source, names)
+
+    # Sin región, una pasada del regex por regla con patrón; los predicados, una entre todos
+    assert source.stats['regex_searches'] == 3
+    assert source.stats['bytes_scanned'] == 3 * len(code) + len(code)
+    assert len(seen['first']) == code.count('\n') + 1
+    assert all(a is b for a, b in zip(seen['first'], seen['second']))
+    # Los matches de una regla no ocultan los de otra ni dependen de qué reglas estén activas
+    assert together['line_length'] == [(1, "x" * 130 + "   ")]
+    assert together['trailing_ws'] == [(1, "   "), (2, "\t  ")]
+    assert together['tabs'] == [(2, "\t")]
+    for name in ('line_length', 'trailing_ws', 'tabs'):
+        assert _hits(code, {name})[name] == together[name]
+
+
+def test_all_regex_flags_are_honoured(rules):
+    rules('dotall', pattern=r'a.b', flags=re.DOTALL | re.IGNORECASE)
+    rules('verbose', pattern=r'''  f o o  # comentario del regex''', flags=re.VERBOSE)
+    rules('ascii', pattern=r'\w+é', flags=re.ASCII)
+    hits = _hits("x = A\tB;\nfoo();\ncafé\n", {'dotall', 'verbose', 'ascii'})
+    assert hits['dotall'] == [(1, "A\tB")]
+    assert hits['verbose'] == [(2, "foo")]
+    assert hits['ascii'] == [(3, "café")]
+
+
+def test_region_rules_anchor_dollar_to_the_real_line_end(rules):
+    rules('code_trailing_ws', pattern=r'[ \t]+$', region=CODE, flags=re.MULTILINE)
+    code = "int x = 1;   // nota\nint y = 2;   \n/* c */ int z;  \n"
+    assert _hits(code, {'code_trailing_ws'})['code_trailing_ws'] == [(2, "   "), (3, "  ")]
+
+
+def test_pattern_rules_respect_the_deadline(rules):
+    rules('words', pattern=r'\w+')
+    source = SourceFile("palabra\n" * 20000, 'reglas.cpp')
+    source.deadline = 0
+    with pytest.raises(AnalysisTimedOut):
+        evaluate_line_rules(source, {'words'})
@@ -0,0 +1,29 @@
+# Carga de carpetas: recorrido con filtros y cancelable desde el hilo de trabajo.
+
+import threading
+
+import pytest
+
+from Extractor import AnalysisCancelled
+from Pipeline import scan_directory
+
+
+def _tree(tmp_path):
+    for relative in ("src/a.cpp", "src/b.h", "src/notas.txt", "build/gen.cpp"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("int x;\n", encoding='utf-8')
+
+
+def test_scan_applies_include_and_exclude(tmp_path):
+    _tree(tmp_path)
+    found = scan_directory(str(tmp_path), "*.cpp;*.h", "build/")
+    assert [path.replace('\\', '/').split('/')[-2:] for path in found] == [['src', 'a.cpp'], ['src', 'b.h']]
+
+
+def test_scan_stops_when_cancelled(tmp_path):
+    _tree(tmp_path)
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(AnalysisCancelled):
+        scan_directory(str(tmp_path), "*.cpp", "", cancel_event)
@@ -0,0 +1,79 @@
+# Pipeline por archivo: cada etapa y el monitoreo se ejecutan una vez por archivo.
+
+import os
+from collections import Counter
+
+import pytest
+
+import Pipeline
+from Benchmark import generate_cpp
+
+# Margen sobre el plazo: los índices comprueban el plazo cada pocos miles de elementos
+INDEX_CHECK_SLACK = 0.25
+
+
+@pytest.mark.parametrize('files', [1, 5, 20])
+def test_stages_run_once_per_file(monkeypatch, files):
+    stage_calls = Counter()
+    monitor_calls = []
+    run_stage = Pipeline._run_stage
+    monitor_methods = Pipeline.monitor_methods
+
+    def counting_stage(source, name, *args, **kwargs):
+        stage_calls[name] += 1
+        return run_stage(source, name, *args, **kwargs)
+
+    def counting_monitor(code, filename, *args, **kwargs):
+        monitor_calls.append(filename)
+        return monitor_methods(code, filename, *args, **kwargs)
+
+    monkeypatch.setattr(Pipeline, '_run_stage', counting_stage)
+    monkeypatch.setattr(Pipeline, 'monitor_methods', counting_monitor)
+
+    sources = [(f"archivo_{i}.cpp", generate_cpp(5, seed=i)) for i in range(files)]
+    results = list(Pipeline.run_pipeline(sources, set(Pipeline.CHECK_KEYS), monitor=True))
+
+    assert [result['filepath'] for result in results] == [path for path, _ in sources]
+    assert sorted(monitor_calls) == sorted(path for path, _ in sources)
+    expected = {'functions', 'line_rules', 'monitoring', *Pipeline.CHECK_KEYS}
+    assert set(stage_calls) == expected
+    assert all(count == files for count in stage_calls.values()), stage_calls
+
+
+def test_read_errors_share_the_result_schema(tmp_path):
+    path = tmp_path / "ok.cpp"
+    path.write_text(generate_cpp(2), encoding='utf-8')
+    ok = Pipeline.analyze_path(str(path), set(Pipeline.CHECK_KEYS), instrument=True)
+    missing = Pipeline.analyze_path(str(tmp_path / "falta.cpp"), set(Pipeline.CHECK_KEYS), instrument=True)
+
+    assert ok['error'] is None
+    assert missing['error']
+    assert missing.keys() == ok.keys()
+
+
+def test_result_records_the_analysed_mtime(tmp_path):
+    path = tmp_path / "a.cpp"
+    path.write_text(generate_cpp(2), encoding='utf-8')
+    result = Pipeline.analyze_path(str(path), set(Pipeline.CHECK_KEYS))
+
+    assert result['mtime'] == os.stat(path).st_mtime_ns
+    assert Pipeline.analyze_file(str(path), path.read_text(encoding='utf-8'), set())['mtime'] is None
+
+
+def test_stage_budget_also_bounds_index_construction():
+    # Casi todo el costo está en la máscara de regiones y la tabla de llaves, no en las firmas
+    code = '"a" /* b */ {}\n' * 300000
+    result = Pipeline.analyze_file('indices.cpp', code, set(Pipeline.CHECK_KEYS), time_budget=0.5, instrument=True)
+
+    assert 'functions' in result['timed_out']
+    assert result['timings']['functions'] < 0.5 + INDEX_CHECK_SLACK
+
+
+@pytest.mark.parametrize('monitor_text', [False, True])
+def test_monitoring_counts_each_method_once(monitor_text):
+    code = generate_cpp(50)
+    result = Pipeline.analyze_file("metodos.cpp", code, set(), instrument=True, monitor_text=monitor_text)
+    assert len(result['methods']) == 50
+    assert result['metrics']['monitoring']['functions'] == 50
+    if monitor_text:
+        assert result['monitoring'][0].endswith("(50 encontrados) ---")
@@ -0,0 +1,67 @@
+# ResultCache: ida y vuelta por JSON, invalidación por versión/contenido y expulsión LRU.
+
+import itertools
+
+import pytest
+
+import Pipeline
+import ResultCache
+from Benchmark import generate_cpp
+from Extractor import SourceFile
+from Monitoring import MethodRecord, method_rows
+from ResultCache import content_hash
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache.ResultCache(str(tmp_path / "cache.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def test_method_records_round_trip(cache):
+    source = SourceFile(generate_cpp(5), 'a.cpp')
+    rows = method_rows(source)
+    digest = content_hash(source.code)
+    cache.put(digest, 'methods', '1', [row.to_json() for row in rows])
+
+    restored = [MethodRecord.from_json(data) for data in cache.get(digest, 'methods', '1')]
+    assert [row.to_json() for row in restored] == [row.to_json() for row in rows]
+    assert [row.body_span for row in restored] == [row.body_span for row in rows]
+
+
+def test_other_version_or_content_misses(cache):
+    digest = content_hash("int x;\n")
+    cache.put(digest, 'todos', '3.cpp', [[1, "TODO"]])
+
+    assert cache.get(digest, 'todos', '3.cpp') == [[1, "TODO"]]
+    assert cache.get(digest, 'todos', '4.cpp') is None
+    assert cache.get(digest, 'line_length', '3.cpp') is None
+    assert cache.get(content_hash("int x; \n"), 'todos', '3.cpp') is None
+
+
+def test_trim_evicts_least_recently_used(cache, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(ResultCache.time, 'time', lambda: next(clock))
+    for name in ('a', 'b', 'c'):
+        cache.put('digest', name, '1', "x" * 100)
+    cache.get('digest', 'a', '1')
+
+    cache.max_bytes = 250
+    assert cache.trim() == 1
+    assert cache.get('digest', 'b', '1') is None
+    assert cache.get('digest', 'a', '1') is not None
+    assert cache.get('digest', 'c', '1') is not None
+    assert cache.trim() == 0
+
+
+def test_cached_analysis_matches_fresh_analysis(cache):
+    code = generate_cpp(10)
+    checks = set(Pipeline.CHECK_KEYS)
+    first = Pipeline.analyze_file('a.cpp', code, checks, cache=cache)
+    second = Pipeline.analyze_file('a.cpp', code, checks, cache=cache)
+
+    assert first['cache_hits'] == 0
+    assert second['cache_misses'] == 0 and second['cache_hits'] == 1 + len(checks)
+    assert second['review'] == first['review']
+    assert [row.to_json() for row in second['methods']] == [row.to_json() for row in first['methods']]
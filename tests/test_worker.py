@@ -0,0 +1,65 @@
+# BackgroundWorker: la cola se vacía por tiempo, no por un número fijo de elementos.
+
+import time
+
+from Worker import BackgroundWorker
+
+
+class FakeRoot:
+    """Sustituto de Tk: guarda los root.after y los ejecuta en orden al llamar run()."""
+    def __init__(self):
+        self.pending = []
+        self.delays = []
+
+    def after(self, ms, callback, *args):
+        self.delays.append(ms)
+        self.pending.append((callback, args))
+
+    def run(self):
+        ticks = 0
+        while self.pending:
+            callback, args = self.pending.pop(0)
+            callback(*args)
+            ticks += 1
+        return ticks
+
+
+def test_backlog_is_drained_in_few_ticks():
+    root = FakeRoot()
+    worker = BackgroundWorker(root)
+    items = []
+    done = []
+
+    def task(cancel_event):
+        yield from range(10000)
+
+    worker.start(task, items.append, done.append)
+    worker._thread.join()
+    ticks = root.run()
+
+    assert items == list(range(10000))
+    assert done == [False]
+    assert not worker.running
+    # Con 20 elementos por turno harían falta 500 turnos (25 s a 50 ms por turno)
+    assert ticks < 50
+
+
+def test_slow_callbacks_yield_to_the_event_loop():
+    root = FakeRoot()
+    worker = BackgroundWorker(root)
+    items = []
+
+    def slow_item(item):
+        time.sleep(BackgroundWorker.POLL_BUDGET / 2)
+        items.append(item)
+
+    def task(cancel_event):
+        yield from range(12)
+
+    worker.start(task, slow_item, lambda cancelled: None)
+    worker._thread.join()
+    root.run()
+
+    assert items == list(range(12))
+    # Cada turno entrega pocos elementos y reprograma el siguiente enseguida
+    assert BackgroundWorker.BACKLOG_POLL_MS in root.delays